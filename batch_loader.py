@@ -0,0 +1,74 @@
+# batch_loader.py
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LoadHandle(Generic[K, V]):
+    """load() 가 돌려주는 지연 결과. get() 을 처음 호출할 때 모아 둔 키를 한 번에 조회한다."""
+
+    def __init__(self, loader: "BatchLoader[K, V]", key: K):
+        self._loader = loader
+        self.key = key
+
+    def get(self) -> Optional[V]:
+        return self._loader._resolve(self.key)
+
+
+class BatchLoader(Generic[K, V]):
+    """DataLoader 방식의 조회 모음기.
+
+    한 화면을 그리는 동안 load(key) 로 필요한 키를 모아 두었다가, 결과가 처음
+    필요해지는 시점에 batch_fn(키 목록) 한 번으로 가져온다. 한 번 가져온 키는
+    loader 가 살아 있는 동안 다시 조회하지 않으므로 loader 는 화면(요청) 단위로
+    새로 만들어 쓴다.
+
+    batch_fn 은 키 목록을 받아 {키: 값} dict 를 돌려줘야 하며, 없는 키는 빠져도 된다.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[K]], Dict[K, V]]):
+        self._batch_fn = batch_fn
+        self._cache: Dict[K, Optional[V]] = {}
+        self._pending: Dict[K, None] = {}  # 순서 유지용 dict
+        self.batches = 0
+
+    def load(self, key: K) -> LoadHandle[K, V]:
+        if key not in self._cache:
+            self._pending[key] = None
+        return LoadHandle(self, key)
+
+    def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """keys 와 같은 순서의 결과 목록 (없는 키는 None)"""
+        keys = list(keys)
+        for k in keys:
+            self.load(k)
+        self.dispatch()
+        return [self._cache.get(k) for k in keys]
+
+    def prime(self, key: K, value: V):
+        """이미 가진 값을 캐시에 넣어 조회를 생략"""
+        self._cache[key] = value
+        self._pending.pop(key, None)
+
+    def dispatch(self):
+        """모아 둔 키를 batch_fn 한 번으로 조회"""
+        if not self._pending:
+            return
+        keys = list(self._pending)
+        self._pending.clear()
+        found = self._batch_fn(keys)
+        self.batches += 1
+        for k in keys:
+            self._cache[k] = found.get(k)
+
+    def clear(self):
+        self._cache.clear()
+        self._pending.clear()
+
+    def _resolve(self, key: K) -> Optional[V]:
+        if key not in self._cache:
+            self._pending[key] = None
+            self.dispatch()
+        return self._cache.get(key)
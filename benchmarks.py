@@ -0,0 +1,428 @@
+# benchmarks.py
+"""데이터 계층 성능 측정 스크립트.
+
+    python benchmarks.py bookmarks
+    python benchmarks.py apply      (동시 지원 정합성 스트레스 테스트)
+    python benchmarks.py job_rows   (공고 10만 건 엔티티 변환 시간/메모리)
+    python benchmarks.py job_list   (목록 화면 projection)
+    python benchmarks.py deferred   (본문 지연 로딩)
+    python benchmarks.py datetimes  (날짜 변환 캐시, ISO 문자열 vs epoch 정수 저장)
+    python benchmarks.py all
+
+임시 DB 파일을 만들어 측정하므로 hangi_works.db 는 건드리지 않는다.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from database_manager import DatabaseManager
+from dao import (
+    APPLY_DUPLICATE,
+    APPLY_FULL,
+    APPLY_OK,
+    JOB_COLUMNS,
+    JOB_MAPPER,
+    ApplicationDAO,
+    BookmarkDAO,
+    JobDAO,
+)
+from entities import Application, Job
+from datetime_codec import decode_datetime
+from row_mapper import RowMapper
+
+
+def _temp_db(profile: str = "desktop", **kwargs) -> DatabaseManager:
+    fd, path = tempfile.mkstemp(suffix=".db", prefix="hangi_bench_")
+    os.close(fd)
+    db = DatabaseManager(path, profile=profile, **kwargs)
+    db.create_tables()
+    return db
+
+
+def _cleanup(db: DatabaseManager):
+    db.disconnect()
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(db.db_path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def _seed_jobs(db: DatabaseManager, count: int) -> list:
+    """공고 count 개를 한 트랜잭션으로 넣고 job_id 목록 반환"""
+    dao = JobDAO(db)
+    base = datetime(2025, 3, 1)
+    ids = []
+    with db.transaction():
+        for i in range(count):
+            ids.append(
+                dao.insert_job(
+                    Job(
+                        title=f"근로 공고 {i}",
+                        description="도서관 대출 반납 업무 보조 " * 20,
+                        category=random.choice(["장기", "단기", "일일"]),
+                        location=random.choice(["본관", "도서관", "학생식당"]),
+                        salary=9860 + i % 500,
+                        requirements="성실한 분",
+                        deadline=base + timedelta(days=30 + i % 60),
+                        created_at=base + timedelta(minutes=i),
+                    )
+                )
+            )
+    return ids
+
+
+def _timeit(fn, repeat: int) -> float:
+    """repeat 번 실행한 중앙값(ms)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+# ---------- 스크랩 목록: N+1 vs JOIN ----------
+def bench_bookmarks(jobs: int = 5000, bookmarks: int = 300, repeat: int = 20):
+    db = _temp_db()
+    try:
+        job_ids = _seed_jobs(db, jobs)
+        user_id = 1
+        now = datetime.now()
+        db.execute_many(
+            "INSERT INTO bookmarks (user_id, job_id, created_at) VALUES (?, ?, ?)",
+            [
+                (user_id, jid, db.dt_codec.encode(now - timedelta(seconds=i)))
+                for i, jid in enumerate(random.sample(job_ids, bookmarks))
+            ],
+        )
+        bm_dao = BookmarkDAO(db)
+        job_dao = JobDAO(db)
+
+        # 공고 캐시(identity map)가 N+1 쪽을 메모리에서 응답하지 않도록
+        # 두 방식 모두 매번 빈 캐시에서 시작한다
+        def n_plus_one():
+            # 예전 BookmarkManager.get_bookmarked_jobs 방식
+            job_dao.cache.clear()
+            return [
+                job_dao.get_job_by_id(jid)
+                for jid in bm_dao.get_bookmarked_job_ids(user_id)
+            ]
+
+        def joined():
+            job_dao.cache.clear()
+            return bm_dao.get_bookmarked_jobs(user_id)
+
+        assert [j.job_id for j in n_plus_one()] == [j.job_id for j in joined()]
+        before = _timeit(n_plus_one, repeat)
+        after = _timeit(joined, repeat)
+        print(f"[bookmarks] jobs={jobs} bookmarks/user={bookmarks}")
+        print(f"  N+1 조회   : {before:8.2f} ms")
+        print(f"  JOIN 1회   : {after:8.2f} ms  (x{before / after:.1f})")
+    finally:
+        _cleanup(db)
+
+
+# ---------- 동시 지원 처리량 ----------
+def bench_apply(
+    threads: int = 16, jobs: int = 20, capacity: int = 5, attempts: int = 400
+):
+    """threads 개 스레드가 동시에 지원할 때의 처리량.
+    정원 초과/중복 지원이 없는지는 tests/test_applications.py 에서 확인한다."""
+    db = _temp_db("server", pool_size=threads)
+    try:
+        dao = JobDAO(db)
+        with db.transaction():
+            job_ids = [
+                dao.insert_job(Job(title=f"마감 임박 {i}", max_applicants=capacity))
+                for i in range(jobs)
+            ]
+        students = list(range(1, jobs * capacity))  # 정원 합보다 적은 학생 → 중복 시도 다수
+        counts = {APPLY_OK: 0, APPLY_DUPLICATE: 0, APPLY_FULL: 0}
+        lock = threading.Lock()
+
+        def worker(seed: int):
+            rnd = random.Random(seed)
+            app_dao = ApplicationDAO(db)
+            local = dict.fromkeys(counts, 0)
+            for _ in range(attempts):
+                result, _ = app_dao.apply(
+                    Application(
+                        user_id=rnd.choice(students),
+                        job_id=rnd.choice(job_ids),
+                        resume_id=None,
+                        status="제출",
+                        submitted_at=datetime.now(),
+                    )
+                )
+                local[result] += 1
+            with lock:
+                for k, v in local.items():
+                    counts[k] += v
+
+        start = time.perf_counter()
+        pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        total = threads * attempts
+        print(f"[apply] threads={threads} jobs={jobs} capacity={capacity} 시도={total}")
+        print(f"  {total / elapsed:8.0f} 건/s  결과={counts}")
+    finally:
+        _cleanup(db)
+
+
+# ---------- 공고 10만 건 적재: __dict__ + 이름 조회 vs __slots__ + 위치 매핑 ----------
+class _DictJob:
+    """__slots__ 도입 전 Job 과 같은 모양의 비교용 클래스"""
+
+    def __init__(
+        self, job_id=None, title=None, description=None, category=None,
+        location=None, job_type=None, work_hours=None, salary=None,
+        requirements=None, deadline=None, created_at=None, department=None,
+        max_applicants=None,
+    ):
+        self.job_id = job_id
+        self.title = title
+        self.description = description
+        self.category = category
+        self.location = location
+        self.job_type = job_type
+        self.work_hours = work_hours
+        self.salary = salary
+        self.requirements = requirements
+        self.deadline = deadline
+        self.created_at = created_at
+        self.department = department
+        self.max_applicants = max_applicants
+
+
+def _parse_dt_legacy(s):
+    if s is None:
+        return None
+    try:
+        return datetime.fromisoformat(s)
+    except Exception:
+        return None
+
+
+def _legacy_row_to_job(row) -> _DictJob:
+    # 예전 JobDAO._build_job 방식: 컬럼 이름으로 하나씩 조회
+    return _DictJob(
+        job_id=row["job_id"],
+        title=row["title"],
+        description=row["description"],
+        category=row["category"],
+        location=row["location"],
+        job_type=row["job_type"],
+        work_hours=row["work_hours"],
+        salary=row["salary"],
+        requirements=row["requirements"],
+        deadline=_parse_dt_legacy(row["deadline"]),
+        created_at=_parse_dt_legacy(row["created_at"]),
+        department=row["department"],
+        max_applicants=row["max_applicants"],
+    )
+
+
+def _measure(fn):
+    """(결과, 걸린 시간 ms, 결과가 차지한 메모리 MiB)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, size / (1024 * 1024)
+
+
+def bench_job_rows(count: int = 100_000):
+    db = _temp_db("bulk-load")
+    try:
+        base = datetime(2025, 3, 1)
+        db.execute_many(
+            "INSERT INTO jobs (title, description, category, location, salary, "
+            "deadline, created_at, max_applicants) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    f"근로 공고 {i}",
+                    "도서관 대출 반납 업무 보조",
+                    random.choice(["장기", "단기", "일일"]),
+                    random.choice(["본관", "도서관", "학생식당"]),
+                    9860 + i % 500,
+                    db.dt_codec.encode(base + timedelta(days=30, minutes=i)),
+                    db.dt_codec.encode(base + timedelta(minutes=i)),
+                    5,
+                )
+                for i in range(count)
+            ],
+        )
+        rows = db.execute_query(f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs").fetchall()
+        # 지연 컬럼 없이 전체 컬럼을 채우는 변환기 (__slots__ + 위치 매핑만 비교).
+        # 날짜는 양쪽 모두 캐시 없이 파싱해서 decode_datetime 캐시 효과가 섞이지 않게 한다
+        # (행마다 시각도 모두 다르다).
+        parse = decode_datetime.__wrapped__
+        eager = RowMapper(Job, JOB_COLUMNS, {"deadline": parse, "created_at": parse})
+
+        before, before_ms, before_mb = _measure(lambda: [_legacy_row_to_job(r) for r in rows])
+        del before
+        after, after_ms, after_mb = _measure(lambda: eager.map_all(rows))
+        del after
+        print(f"[job_rows] 공고 {count:,} 건 변환 (행 fetch 제외)")
+        print(f"  __dict__ + 이름 조회  : {before_ms:8.1f} ms  {before_mb:7.1f} MiB")
+        print(
+            f"  __slots__ + 위치 매핑 : {after_ms:8.1f} ms  {after_mb:7.1f} MiB"
+            f"  (시간 x{before_ms / after_ms:.2f}, 메모리 {after_mb / before_mb:.0%})"
+        )
+    finally:
+        _cleanup(db)
+
+
+# ---------- 공고 목록 페이지: 전체 Job vs "list" projection ----------
+def bench_job_list(jobs: int = 20000, page_size: int = 50, repeat: int = 5):
+    db = _temp_db()
+    try:
+        _seed_jobs(db, jobs)
+        dao = JobDAO(db)
+
+        def walk(projection):
+            # 캐시 효과를 빼기 위해 매번 identity map 을 비우고 전체 페이지를 넘긴다
+            dao.cache.clear()
+            page = dao.get_jobs_page(page_size, projection=projection)
+            n = len(page.items)
+            while page.next_token:
+                page = dao.get_jobs_page(
+                    page_size, after=page.next_token, projection=projection
+                )
+                n += len(page.items)
+            return n
+
+        assert walk(None) == walk("list") == jobs
+        full = _timeit(lambda: walk(None), repeat)
+        listed = _timeit(lambda: walk("list"), repeat)
+        _, _, full_mb = _measure(lambda: [j for j in dao.find_jobs()])
+        dao.cache.clear()
+        _, _, list_mb = _measure(
+            lambda: dao.get_jobs_page(jobs, projection="list").items
+        )
+        print(f"[job_list] jobs={jobs} page_size={page_size} (전체 페이지 순회)")
+        print(f"  전체 Job        : {full:8.1f} ms  (전체 적재 {full_mb:6.1f} MiB)")
+        print(
+            f"  list projection : {listed:8.1f} ms  (전체 적재 {list_mb:6.1f} MiB)"
+            f"  (x{full / listed:.1f})"
+        )
+    finally:
+        _cleanup(db)
+
+
+# ---------- 본문 크기에 따른 목록 조회: 본문 즉시 로딩 vs 지연 로딩 ----------
+def bench_deferred_text(jobs: int = 5000, repeat: int = 5):
+    eager = RowMapper(
+        Job, JOB_COLUMNS, {"deadline": decode_datetime, "created_at": decode_datetime}
+    )
+    for text_kb in (0, 4, 16):
+        db = _temp_db()
+        try:
+            body = "가" * (text_kb * 1024 // 3)  # UTF-8 한글 3바이트
+            db.execute_many(
+                "INSERT INTO jobs (title, description, requirements, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (f"공고 {i}", body, body, db.dt_codec.encode(datetime(2025, 3, 1)))
+                    for i in range(jobs)
+                ],
+            )
+
+            def load(mapper):
+                cur = db.execute_query(
+                    f"SELECT {mapper.select()} FROM jobs ORDER BY created_at DESC"
+                )
+                return mapper.map_all(cur.fetchall())
+
+            eager_ms = _timeit(lambda: load(eager), repeat)
+            lazy_ms = _timeit(lambda: load(JOB_MAPPER), repeat)
+            _, _, eager_mb = _measure(lambda: load(eager))
+            _, _, lazy_mb = _measure(lambda: load(JOB_MAPPER))
+            print(
+                f"[deferred] 본문 {text_kb:2d}KB x2, 공고 {jobs}: "
+                f"즉시 {eager_ms:7.1f} ms {eager_mb:6.1f} MiB | "
+                f"지연 {lazy_ms:7.1f} ms {lazy_mb:6.1f} MiB"
+            )
+        finally:
+            _cleanup(db)
+
+
+# ---------- 날짜 변환: 캐시 유무, ISO 문자열 vs epoch 정수 저장 ----------
+def bench_datetimes(jobs: int = 50000, repeat: int = 5):
+    base = datetime(2025, 3, 1)
+    # 일괄 등록 데이터처럼 같은 시각이 반복되는 값 (서로 다른 값 500개)
+    values = [(base + timedelta(minutes=i % 500)).isoformat() for i in range(jobs)]
+    decode_datetime.cache_clear()
+    uncached_ms = _timeit(lambda: [decode_datetime.__wrapped__(v) for v in values], repeat)
+    cached_ms = _timeit(lambda: [decode_datetime(v) for v in values], repeat)
+    print(f"[datetimes] 문자열 {jobs:,} 개 변환 (서로 다른 값 500)")
+    print(f"  fromisoformat 매번 : {uncached_ms:8.1f} ms")
+    print(f"  메모이즈           : {cached_ms:8.1f} ms  {decode_datetime.cache_info()}")
+
+    for mode in ("iso", "epoch"):
+        db = _temp_db(datetime_mode=mode)
+        try:
+            _seed_jobs(db, jobs)
+            dao = JobDAO(db)
+            frm, to = base + timedelta(days=40), base + timedelta(days=50)
+            params = (db.dt_codec.encode(frm), db.dt_codec.encode(to))
+
+            def sql_only():
+                return db.execute_query(
+                    "SELECT job_id, deadline, created_at FROM jobs "
+                    "WHERE deadline BETWEEN ? AND ? ORDER BY created_at DESC",
+                    params,
+                ).fetchall()
+
+            def entities():
+                dao.cache.clear()
+                return dao.find_jobs(deadline_from=frm, deadline_to=to)
+
+            found = len(sql_only())
+            sql_ms = _timeit(sql_only, repeat)
+            entity_ms = _timeit(entities, repeat)
+            size = os.path.getsize(db.db_path) / (1024 * 1024)
+            print(
+                f"  [{mode:5s}] 마감일 범위 + 최신순 {found:,} 건: "
+                f"SQL {sql_ms:7.1f} ms | Job 변환 포함 {entity_ms:7.1f} ms | DB {size:5.1f} MiB"
+            )
+        finally:
+            _cleanup(db)
+
+
+BENCHMARKS = {
+    "bookmarks": bench_bookmarks,
+    "apply": bench_apply,
+    "job_rows": bench_job_rows,
+    "job_list": bench_job_list,
+    "deferred": bench_deferred_text,
+    "datetimes": bench_datetimes,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="한기 WORKS 데이터 계층 벤치마크")
+    parser.add_argument("name", choices=sorted(BENCHMARKS) + ["all"])
+    args = parser.parse_args()
+    random.seed(42)
+    names = sorted(BENCHMARKS) if args.name == "all" else [args.name]
+    for name in names:
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """크기 제한 + LRU 교체 + 선택적 TTL 을 가진 프로세스 내 캐시 (스레드 안전).
+
+    hits / misses / evictions / expirations / invalidations 카운터로
+    적중률을 보고 maxsize 를 정할 수 있다.
+
+    invalidate() / clear() 할 때마다 generation 이 올라가므로, 조회 시작 전에 읽어 둔
+    generation 으로 put() 하면 조회 도중 무효화된 값(이미 낡은 행)은 저장되지 않는다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize 는 1 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.generation = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """카운터를 건드리지 않는 조회 (이미 get() 으로 놓친 키를 다시 볼 때)"""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            self.generation += 1
+            if self._data.pop(key, _MISSING) is _MISSING:
+                return False
+            self.invalidations += 1
+            return True
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "generation": self.generation,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+            self.expirations = self.invalidations = 0
+
+
+class SearchResultCache(LRUCache):
+    """검색어 → 결과 id 목록 캐시. 조회 도중 무효화 처리는 LRUCache 와 같다."""
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None):
+        super().__init__(maxsize, ttl)
+        self.prefix_hits = 0
+
+    def longest_prefix(self, key: str) -> Optional[tuple]:
+        """key 의 가장 긴 (자기 자신 제외) 접두어 중 캐시된 것의 (접두어, 값).
+        통계에는 prefix_hits 로만 기록한다."""
+        now = time.monotonic()
+        with self._lock:
+            for n in range(len(key) - 1, 0, -1):
+                entry = self._data.get(key[:n])
+                if entry is None:
+                    continue
+                value, expires_at = entry
+                if expires_at is not None and now >= expires_at:
+                    continue
+                self._data.move_to_end(key[:n])
+                self.prefix_hits += 1
+                return key[:n], value
+        return None
+
+    def stats(self) -> dict:
+        data = super().stats()
+        data["prefix_hits"] = self.prefix_hits
+        return data
@@ -1,11 +1,21 @@
 # dao.py
-from typing import List, Optional
-from datetime import datetime
-from database_manager import DatabaseManager
+import base64
+import json
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from batch_loader import BatchLoader
+from cache import LRUCache, SearchResultCache
+from database_manager import DatabaseManager, create_job_search_index
+from deferred import NOT_LOADED, pending
+from datetime_codec import decode_datetime
+from row_mapper import RowMapper
+from search_index import NgramIndex
 from entities import (
     User,
     Job,
     Application,
+    ApplicationEvent,
     Resume,
     Timetable,
     Bookmark,
@@ -15,6 +25,266 @@ from entities import (
 )
 
 
+# ========== 행 → 엔티티 변환기 ==========
+# 컬럼 순서는 각 엔티티 생성자 인자 순서와 같다. 조회 SQL 은 이 목록으로 시작해야 한다.
+USER_MAPPER = RowMapper(
+    User,
+    ("user_id", "username", "password", "email", "phone", "student_id",
+     "department", "role"),
+)
+JOB_COLUMNS = (
+    "job_id", "title", "description", "category", "location", "job_type",
+    "work_hours", "salary", "requirements", "deadline", "created_at",
+    "department", "max_applicants",
+)
+# 큰 텍스트 컬럼은 SELECT 하지 않고 처음 읽을 때 가져온다 (prefetch_deferred 참고)
+JOB_DEFERRED = ("description", "requirements")
+JOB_MAPPER = RowMapper(
+    Job,
+    JOB_COLUMNS,
+    {"deadline": decode_datetime, "created_at": decode_datetime},
+    deferred=JOB_DEFERRED,
+    deferred_value=NOT_LOADED,
+)
+APPLICATION_MAPPER = RowMapper(
+    Application,
+    ("application_id", "user_id", "job_id", "resume_id", "status", "submitted_at"),
+    {"submitted_at": decode_datetime},
+)
+APPLICATION_EVENT_MAPPER = RowMapper(
+    ApplicationEvent,
+    ("event_id", "application_id", "status", "ts"),
+    {"ts": decode_datetime},
+)
+RESUME_MAPPER = RowMapper(
+    Resume,
+    ("resume_id", "user_id", "title", "content", "is_default", "created_at",
+     "updated_at"),
+    {"is_default": bool, "created_at": decode_datetime, "updated_at": decode_datetime},
+    deferred=("content",),
+    deferred_value=NOT_LOADED,
+)
+TIMETABLE_MAPPER = RowMapper(
+    Timetable,
+    ("timetable_id", "user_id", "semester", "schedule_data", "created_at"),
+    {"created_at": decode_datetime},
+)
+BOOKMARK_MAPPER = RowMapper(
+    Bookmark,
+    ("bookmark_id", "user_id", "job_id", "created_at"),
+    {"created_at": decode_datetime},
+)
+FAQ_MAPPER = RowMapper(FAQ, ("faq_id", "category", "question", "answer"))
+INQUIRY_MAPPER = RowMapper(
+    Inquiry,
+    ("inquiry_id", "user_id", "title", "content", "answer", "status",
+     "created_at", "answered_at"),
+    {"created_at": decode_datetime, "answered_at": decode_datetime},
+    deferred=("content",),
+    deferred_value=NOT_LOADED,
+)
+
+_JOB_COLS = JOB_MAPPER.select()
+_JOB_COLS_J = JOB_MAPPER.select("j")
+
+
+def _job_projection(name: str, columns: Tuple[str, ...]) -> RowMapper:
+    row_cls = namedtuple(f"Job{name.capitalize()}Row", columns)
+    converters = {c: decode_datetime for c in ("deadline", "created_at") if c in columns}
+    return RowMapper(row_cls, columns, converters)
+
+
+# 목록 화면용 공고 projection: 필요한 컬럼만 읽어 namedtuple 로 돌려준다.
+# Job 객체를 만들지 않고 identity map 에도 넣지 않으며, 본문(description/requirements)
+# 이 없는 projection 은 그만큼 덜 읽는다. 상세 화면은 JobDAO.get_job_by_id 로 전체 Job 을 쓴다.
+JOB_PROJECTIONS: Dict[str, RowMapper] = {
+    "list": _job_projection("list", ("job_id", "title")),
+    "card": _job_projection(
+        "card",
+        ("job_id", "title", "category", "location", "job_type", "salary", "deadline"),
+    ),
+    "detail": _job_projection("detail", JOB_COLUMNS),
+}
+
+
+# ========== Keyset 페이지네이션 ==========
+class Page:
+    """한 페이지 분량의 결과.
+    next_token / prev_token 을 다음 호출의 after / before 로 넘기면 이어서 조회한다."""
+
+    def __init__(
+        self,
+        items: list,
+        next_token: Optional[str] = None,
+        prev_token: Optional[str] = None,
+    ):
+        self.items = items
+        self.next_token = next_token
+        self.prev_token = prev_token
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_token is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_token is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def encode_page_token(key: Tuple[Any, int]) -> str:
+    raw = json.dumps(list(key), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_page_token(token: str) -> Tuple[Any, int]:
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except Exception:
+        raise ValueError("잘못된 페이지 토큰입니다.")
+    return sort_value, row_id
+
+
+def fetch_keyset_page(
+    db_manager: DatabaseManager,
+    table: str,
+    sort_col: str,
+    id_col: str,
+    where: str,
+    params: tuple,
+    page_size: int,
+    mapper: Callable,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    columns: str = "*",
+) -> Page:
+    """(sort_col DESC, id_col DESC) 순서로 page_size 개를 keyset 방식으로 조회.
+
+    OFFSET 을 쓰지 않으므로 몇 번째 페이지든 인덱스 탐색 한 번이면 된다.
+    sort_col 이 NULL 인 행은 맨 뒤에 id 역순으로 온다.
+    columns 에는 mapper 가 기대하는 컬럼 목록(RowMapper.select())을 넘긴다.
+    페이지 토큰용으로 sort_col, id_col 을 그 뒤에 한 번 더 읽는다.
+    """
+    if page_size < 1:
+        raise ValueError("page_size 는 1 이상이어야 합니다.")
+    if after is not None and before is not None:
+        raise ValueError("after 와 before 는 동시에 지정할 수 없습니다.")
+
+    def query(extra: str, extra_params: tuple, ascending: bool, limit: int) -> list:
+        direction = "ASC" if ascending else "DESC"
+        cur = db_manager.execute_query(
+            f"SELECT {columns}, {sort_col}, {id_col} FROM {table} WHERE ({where}) AND {extra} "
+            f"ORDER BY {sort_col} {direction}, {id_col} {direction} LIMIT ?",
+            (*params, *extra_params, limit),
+        )
+        return cur.fetchall()
+
+    want = page_size + 1  # 하나 더 읽어서 다음 페이지 존재 여부 확인
+    if before is None:
+        if after is None:
+            rows = query("1", (), False, want)
+        else:
+            sort_value, row_id = decode_page_token(after)
+            if sort_value is None:
+                rows = query(f"{sort_col} IS NULL AND {id_col} < ?", (row_id,), False, want)
+            else:
+                rows = query(
+                    f"({sort_col}, {id_col}) < (?, ?)", (sort_value, row_id), False, want
+                )
+                if len(rows) < want:
+                    rows += query(f"{sort_col} IS NULL", (), False, want - len(rows))
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        has_next, has_prev = has_more, after is not None
+    else:
+        # 역방향으로 읽은 뒤 뒤집는다
+        sort_value, row_id = decode_page_token(before)
+        if sort_value is None:
+            rows = query(f"{sort_col} IS NULL AND {id_col} > ?", (row_id,), True, want)
+            if len(rows) < want:
+                rows += query(f"{sort_col} IS NOT NULL", (), True, want - len(rows))
+        else:
+            rows = query(
+                f"({sort_col}, {id_col}) > (?, ?)", (sort_value, row_id), True, want
+            )
+        has_more = len(rows) > page_size
+        rows = rows[:page_size][::-1]
+        has_next, has_prev = True, has_more
+
+    next_token = prev_token = None
+    if rows and has_next:
+        next_token = encode_page_token((rows[-1][sort_col], rows[-1][id_col]))
+    if rows and has_prev:
+        prev_token = encode_page_token((rows[0][sort_col], rows[0][id_col]))
+    return Page([mapper(r) for r in rows], next_token, prev_token)
+
+
+# ========== id 목록 일괄 조회 ==========
+# 구버전 SQLite 의 바인딩 변수 한도(999) 안에 들도록 IN 목록을 나눈다
+MAX_IN_PARAMS = 500
+
+
+def fetch_by_ids(
+    db_manager: DatabaseManager,
+    table: str,
+    id_col: str,
+    ids,
+    mapper: Callable,
+    columns: str = "*",
+) -> Dict[int, Any]:
+    """WHERE id IN (...) 로 조회해 {id: 엔티티} 반환. 없는 id 는 빠진다."""
+    unique = list(dict.fromkeys(i for i in ids if i is not None))
+    result: Dict[int, Any] = {}
+    for start in range(0, len(unique), MAX_IN_PARAMS):
+        chunk = unique[start:start + MAX_IN_PARAMS]
+        placeholders = ", ".join("?" for _ in chunk)
+        cur = db_manager.execute_query(
+            f"SELECT {columns} FROM {table} WHERE {id_col} IN ({placeholders})",
+            tuple(chunk),
+        )
+        for r in cur.fetchall():
+            result[r[id_col]] = mapper(r)
+    return result
+
+
+def prefetch_deferred(
+    db_manager: DatabaseManager,
+    table: str,
+    id_col: str,
+    objs,
+    fields: Tuple[str, ...],
+) -> int:
+    """objs 중 지연 컬럼(fields)을 아직 안 읽은 것만 골라 MAX_IN_PARAMS 개씩
+    한 쿼리로 채운다. 그 사이 지워진 행의 값은 None. 채운 객체 수를 반환."""
+    todo: Dict[int, list] = {}
+    targets = pending(objs, fields)
+    for o in targets:
+        todo.setdefault(getattr(o, id_col), []).append(o)
+    ids = list(todo)
+    cols = ", ".join(fields)
+    for start in range(0, len(ids), MAX_IN_PARAMS):
+        chunk = ids[start:start + MAX_IN_PARAMS]
+        placeholders = ", ".join("?" for _ in chunk)
+        cur = db_manager.execute_query(
+            f"SELECT {id_col}, {cols} FROM {table} WHERE {id_col} IN ({placeholders})",
+            tuple(chunk),
+        )
+        for r in cur.fetchall():
+            for o in todo.pop(r[0]):
+                for i, f in enumerate(fields, 1):
+                    setattr(o, f, r[i])
+    for objs_left in todo.values():
+        for o in objs_left:
+            for f in fields:
+                setattr(o, f, None)
+    return len(targets)
+
+
 # ========== UserDAO ==========
 class UserDAO:
     def __init__(self, db_manager: DatabaseManager):
@@ -38,39 +308,93 @@ class UserDAO:
         )
         return cur.lastrowid
 
-    def _row_to_user(self, row) -> User:
-        return User(
-            user_id=row["user_id"],
-            username=row["username"],
-            password=row["password"],
-            email=row["email"],
-            phone=row["phone"],
-            student_id=row["student_id"],
-            department=row["department"],
-            role=row["role"],
-        )
+    _row_to_user = staticmethod(USER_MAPPER.map)
 
     def get_user_by_username(self, username: str) -> Optional[User]:
         cur = self.db_manager.execute_query(
-            "SELECT * FROM users WHERE username = ?", (username,)
+            f"SELECT {USER_MAPPER.select()} FROM users WHERE username = ?", (username,)
         )
         row = cur.fetchone()
         return self._row_to_user(row) if row else None
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         cur = self.db_manager.execute_query(
-            "SELECT * FROM users WHERE user_id = ?", (user_id,)
+            f"SELECT {USER_MAPPER.select()} FROM users WHERE user_id = ?", (user_id,)
         )
         row = cur.fetchone()
         return self._row_to_user(row) if row else None
 
+    def get_users_by_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        return fetch_by_ids(
+            self.db_manager, "users", "user_id", user_ids, self._row_to_user,
+            USER_MAPPER.select(),
+        )
+
 
 # ========== JobDAO ==========
 class JobDAO:
+    # trigram 토크나이저는 3글자 미만 검색어를 색인으로 찾을 수 없다
+    FTS_MIN_KEYWORD = 3
+
+    # n-gram 색인 대상 컬럼
+    SEARCH_COLUMNS = ("title", "description", "location")
+
+    # 공고 캐시 (identity map). TTL 이 None 이면 쓰기 무효화로만 갱신된다.
+    CACHE_SIZE = 10000
+    CACHE_TTL: Optional[float] = None
+    SEARCH_CACHE_SIZE = 256
+    _ALL_JOBS_KEY = "__all__"
+    # LIKE 는 ASCII 만 대소문자를 구분하지 않는다 (검색 캐시 키 / 접두어 거르기 규칙)
+    _ASCII_LOWER = str.maketrans(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"
+    )
+
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        self._fts_available: Optional[bool] = None
+        self.ngram_index = NgramIndex(db_manager, "job")
+        # 같은 DB 의 모든 JobDAO 가 하나의 캐시를 공유한다
+        self.cache: LRUCache = db_manager.cache(
+            "jobs", lambda: LRUCache(self.CACHE_SIZE, self.CACHE_TTL)
+        )
+        self.search_cache: SearchResultCache = db_manager.cache(
+            "job_search", lambda: SearchResultCache(self.SEARCH_CACHE_SIZE)
+        )
+
+    # ---------- 캐시 ----------
+    def _invalidate(self, job_id: Optional[int] = None):
+        """쓰기 후 호출. 해당 공고와 목록 캐시를 지우고, 바깥 트랜잭션이
+        나중에 롤백되면 그 사이에 캐시된 미커밋 값도 다시 지운다."""
+        self._evict(job_id)
+        if self.db_manager.in_transaction():
+            self.db_manager.on_rollback(lambda: self._invalidate(job_id))
+            # 커밋 전까지 다른 스레드는 이전 행을 읽어 캐시에 다시 넣을 수 있으므로
+            # 커밋 뒤에 한 번 더 지운다 (generation 도 올라가 진행 중인 조회의 put 도 막힌다)
+            self.db_manager.on_commit(lambda: self._evict(job_id))
+
+    def _evict(self, job_id: Optional[int]):
+        if job_id is not None:
+            self.cache.invalidate(job_id)
+        self.cache.invalidate(self._ALL_JOBS_KEY)
+        # 어떤 쓰기든 검색 결과를 바꿀 수 있다
+        self.search_cache.clear()
+
+    def cache_stats(self) -> dict:
+        return self.cache.stats()
+
+    def search_cache_stats(self) -> dict:
+        return self.search_cache.stats()
 
     def insert_job(self, job: Job) -> int:
+        with self.db_manager.transaction():
+            job_id = self._insert_job(job)
+            self.ngram_index.index(
+                job_id, (job.title, job.description, job.location)
+            )
+            self._invalidate(job_id)
+        return job_id
+
+    def _insert_job(self, job: Job) -> int:
         cur = self.db_manager.execute_query(
             """
             INSERT INTO jobs (
@@ -89,10 +413,8 @@ class JobDAO:
                 job.work_hours,
                 job.salary,
                 job.requirements,
-                job.deadline.isoformat() if isinstance(job.deadline, datetime) else None,
-                job.created_at.isoformat()
-                if isinstance(job.created_at, datetime)
-                else None,
+                self.db_manager.dt_codec.encode(job.deadline),
+                self.db_manager.dt_codec.encode(job.created_at),
                 job.department,
                 job.max_applicants,
             ),
@@ -104,119 +426,596 @@ class JobDAO:
             return False
         fields = []
         params = []
+        adapt = self.db_manager.dt_codec.adapt
         for k, v in data.items():
             fields.append(f"{k} = ?")
-            params.append(v)
+            params.append(adapt(v))
         params.append(job_id)
         query = f"UPDATE jobs SET {', '.join(fields)} WHERE job_id = ?"
-        cur = self.db_manager.execute_query(query, tuple(params))
-        return cur.rowcount > 0
+        with self.db_manager.transaction():
+            cur = self.db_manager.execute_query(query, tuple(params))
+            updated = cur.rowcount > 0
+            self._invalidate(job_id)
+            if updated and any(k in self.SEARCH_COLUMNS for k in data):
+                self._reindex(job_id)
+        return updated
 
     def delete_job(self, job_id: int) -> bool:
+        with self.db_manager.transaction():
+            cur = self.db_manager.execute_query(
+                "DELETE FROM jobs WHERE job_id = ?", (job_id,)
+            )
+            self.ngram_index.remove(job_id)
+            self._invalidate(job_id)
+        return cur.rowcount > 0
+
+    def _reindex(self, job_id: int):
         cur = self.db_manager.execute_query(
-            "DELETE FROM jobs WHERE job_id = ?", (job_id,)
+            "SELECT title, description, location FROM jobs WHERE job_id = ?",
+            (job_id,),
         )
-        return cur.rowcount > 0
+        row = cur.fetchone()
+        if row:
+            self.ngram_index.index(job_id, tuple(row))
 
-    def _parse_dt(self, s: Optional[str]) -> Optional[datetime]:
-        if s is None:
-            return None
-        try:
-            return datetime.fromisoformat(s)
-        except Exception:
-            return None
+    def _row_to_job(self, row, generation: Optional[int] = None) -> Job:
+        """캐시에 같은 공고가 있으면 그 객체를 재사용 (행 변환/날짜 파싱 생략).
+        호출자가 이미 get() 으로 적중/실패를 셌으므로 peek 으로 본다. generation 은
+        조회 전에 읽어 둔 값으로, 그 사이 무효화가 있었으면 캐시에 넣지 않는다."""
+        job = self.cache.peek(row[0])
+        if job is None:
+            job = self._build_job(row)
+            self.cache.put(job.job_id, job, generation)
+        return job
 
-    def _row_to_job(self, row) -> Job:
-        return Job(
-            job_id=row["job_id"],
-            title=row["title"],
-            description=row["description"],
-            category=row["category"],
-            location=row["location"],
-            job_type=row["job_type"],
-            work_hours=row["work_hours"],
-            salary=row["salary"],
-            requirements=row["requirements"],
-            deadline=self._parse_dt(row["deadline"]),
-            created_at=self._parse_dt(row["created_at"]),
-            department=row["department"],
-            max_applicants=row["max_applicants"],
-        )
+    def _job_mapper(self) -> Callable:
+        """조회 SQL 실행 직전에 만든다: 현재 generation 으로 캐시에 넣는 변환 함수"""
+        generation = self.cache.generation
+        return lambda row: self._row_to_job(row, generation)
+
+    def _build_job(self, row) -> Job:
+        job = JOB_MAPPER.map(row)
+        job._deferred_loader = self._load_text
+        return job
+
+    def _load_text(self, job: Job):
+        self.prefetch_text([job])
+
+    def prefetch_text(self, jobs) -> int:
+        """description/requirements 가 필요한 공고 목록의 본문을 한 번에 읽어 둔다"""
+        return prefetch_deferred(self.db_manager, "jobs", "job_id", jobs, JOB_DEFERRED)
 
     def get_job_by_id(self, job_id: int) -> Optional[Job]:
+        job = self.cache.get(job_id)
+        if job is not None:
+            return job
+        generation = self.cache.generation
         cur = self.db_manager.execute_query(
-            "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
+            f"SELECT {_JOB_COLS} FROM jobs WHERE job_id = ?", (job_id,)
         )
         row = cur.fetchone()
-        return self._row_to_job(row) if row else None
+        return self._row_to_job(row, generation) if row else None
+
+    def get_jobs_by_ids(self, job_ids: List[int]) -> Dict[int, Job]:
+        found: Dict[int, Job] = {}
+        missing = []
+        for jid in job_ids:
+            job = self.cache.get(jid)
+            if job is None:
+                missing.append(jid)
+            else:
+                found[jid] = job
+        if missing:
+            found.update(
+                fetch_by_ids(
+                    self.db_manager, "jobs", "job_id", missing, self._job_mapper(),
+                    _JOB_COLS,
+                )
+            )
+        return found
+
+    def loader(self) -> BatchLoader:
+        """화면 한 번을 그리는 동안 쓸 공고 일괄 조회기"""
+        return BatchLoader(self.get_jobs_by_ids)
 
     def get_all_jobs(self) -> List[Job]:
+        cached = self.cache.get(self._ALL_JOBS_KEY)
+        if cached is not None:
+            return list(cached)
+        generation = self.cache.generation
+        cur = self.db_manager.execute_query(
+            f"SELECT {_JOB_COLS} FROM jobs ORDER BY created_at DESC"
+        )
+        rows = cur.fetchall()
+        if len(rows) >= self.cache.maxsize:
+            # 전체 목록이 캐시보다 크면 넣어 봐야 서로를 밀어낼 뿐이고, __all__ 튜플은
+            # 크기 제한 밖에서 모든 객체를 붙잡는다. 이미 캐시된 객체만 재사용한다.
+            peek = self.cache.peek
+            return [peek(r[0]) or self._build_job(r) for r in rows]
+        jobs = [self._row_to_job(r, generation) for r in rows]
+        self.cache.put(self._ALL_JOBS_KEY, tuple(jobs), generation)
+        return jobs
+
+    # ---------- 필터 / 패싯 ----------
+    # 값 일치(문자열 또는 목록)로 거를 수 있는 컬럼. facet_counts 의 대상이기도 하다.
+    FACET_FIELDS = ("category", "location", "job_type", "department")
+
+    def _build_filter(self, filters: dict) -> Tuple[str, list]:
+        """필터 dict 를 WHERE 절과 파라미터로 변환.
+
+        - category / location / job_type / department: 값 하나 또는 값 목록
+        - min_salary / max_salary: 시급 범위 (포함)
+        - deadline_from / deadline_to: 마감일 범위 (datetime, 포함)
+        - not_expired: True 이면 마감일이 없거나 지나지 않은 공고만
+        """
+        clauses = []
+        params: list = []
+        for key, value in filters.items():
+            if value is None:
+                continue
+            if key in self.FACET_FIELDS:
+                if isinstance(value, (list, tuple, set)):
+                    values = list(value)
+                    if not values:
+                        clauses.append("0")
+                        continue
+                    clauses.append(f"{key} IN ({', '.join('?' for _ in values)})")
+                    params.extend(values)
+                else:
+                    clauses.append(f"{key} = ?")
+                    params.append(value)
+            elif key == "min_salary":
+                clauses.append("salary >= ?")
+                params.append(value)
+            elif key == "max_salary":
+                clauses.append("salary <= ?")
+                params.append(value)
+            elif key == "deadline_from":
+                clauses.append("deadline >= ?")
+                params.append(self.db_manager.dt_codec.encode(value))
+            elif key == "deadline_to":
+                clauses.append("deadline <= ?")
+                params.append(self.db_manager.dt_codec.encode(value))
+            elif key == "not_expired":
+                if value:
+                    clauses.append("(deadline IS NULL OR deadline >= ?)")
+                    params.append(self.db_manager.dt_codec.now())
+            else:
+                raise ValueError(f"알 수 없는 필터: {key}")
+        where = " AND ".join(clauses) if clauses else "1"
+        return where, params
+
+    def find_jobs(self, **filters) -> List[Job]:
+        """모든 필터를 하나의 SQL 로 적용한 공고 목록 (최신순)"""
+        where, params = self._build_filter(filters)
+        to_job = self._job_mapper()
         cur = self.db_manager.execute_query(
-            "SELECT * FROM jobs ORDER BY created_at DESC"
+            f"SELECT {_JOB_COLS} FROM jobs WHERE {where} ORDER BY created_at DESC",
+            tuple(params),
         )
-        return [self._row_to_job(r) for r in cur.fetchall()]
+        return [to_job(r) for r in cur.fetchall()]
 
-    def search_jobs(self, keyword: str) -> List[Job]:
+    def get_jobs_page(
+        self,
+        page_size: int = 50,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        projection: Optional[str] = None,
+        **filters,
+    ) -> Page:
+        """최신순 공고 한 페이지. find_jobs 와 같은 필터를 쓸 수 있다.
+        projection 을 주면 Job 대신 그 projection 의 namedtuple 을 담는다."""
+        where, params = self._build_filter(filters)
+        mapper, columns = self._job_mapper(), _JOB_COLS
+        if projection is not None:
+            pm = self.projection(projection)
+            mapper, columns = pm.map, pm.select()
+        return fetch_keyset_page(
+            self.db_manager, "jobs", "created_at", "job_id",
+            where, tuple(params), page_size, mapper, after, before, columns,
+        )
+
+    @staticmethod
+    def projection(name: str) -> RowMapper:
+        """JOB_PROJECTIONS 의 이름 → 변환기"""
+        try:
+            return JOB_PROJECTIONS[name]
+        except KeyError:
+            raise ValueError(f"알 수 없는 projection: {name}")
+
+    def facet_counts(self, field: str, **filters) -> Dict[Optional[str], int]:
+        """field 값별 공고 수. field 자신에 대한 필터는 무시한다
+        (탭 버튼마다 '그 탭을 눌렀을 때' 개수를 보여주기 위함)."""
+        if field not in self.FACET_FIELDS:
+            raise ValueError(f"패싯으로 쓸 수 없는 컬럼: {field}")
+        filters = {k: v for k, v in filters.items() if k != field}
+        where, params = self._build_filter(filters)
+        cur = self.db_manager.execute_query(
+            f"SELECT {field} AS value, COUNT(*) AS cnt FROM jobs "
+            f"WHERE {where} GROUP BY {field}",
+            tuple(params),
+        )
+        return {r["value"]: r["cnt"] for r in cur.fetchall()}
+
+    # ---------- 검색 ----------
+    def has_search_index(self) -> bool:
+        if self._fts_available is None:
+            cur = self.db_manager.execute_query(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+            )
+            self._fts_available = cur.fetchone() is not None
+        return self._fts_available
+
+    def rebuild_search_index(self) -> bool:
+        """검색 인덱스를 (없으면 만들고) jobs 전체로 다시 색인"""
+        with self.db_manager.transaction() as conn:
+            self._fts_available = create_job_search_index(conn.cursor())
+        return self._fts_available
+
+    def search_jobs(
+        self, keyword: str, rank: bool = False, recency_boost: float = 0.0
+    ) -> List[Job]:
+        """제목/설명/위치에 keyword 가 포함된 공고.
+
+        기본 정렬은 최신순. rank=True 이면 bm25 관련도순이며,
+        recency_boost 가 클수록 최근 공고가 앞으로 온다.
+        검색 인덱스가 없거나 검색어가 너무 짧으면 LIKE 스캔으로 같은 결과를 만든다.
+
+        최신순 결과는 검색어별로 캐시한다. "도서" 다음 "도서관" 처럼 캐시된
+        검색어를 늘린 검색은 DB 를 다시 뒤지지 않고 앞 결과 안에서 거른다.
+        """
+        if rank:
+            return self._search_uncached(keyword, rank, recency_boost)
+
+        key = keyword.translate(self._ASCII_LOWER)
+        generation = self.search_cache.generation
+        ids = self.search_cache.get(key)
+        if ids is not None:
+            found = self.get_jobs_by_ids(list(ids))
+            return [found[i] for i in ids if i in found]
+
+        jobs = self._refine_cached_prefix(keyword, key)
+        if jobs is None:
+            jobs = self._search_uncached(keyword, rank, recency_boost)
+        self.search_cache.put(key, tuple(j.job_id for j in jobs), generation)
+        return jobs
+
+    def _refine_cached_prefix(self, keyword: str, key: str) -> Optional[List[Job]]:
+        """key 의 접두어 검색 결과가 캐시돼 있으면 그 후보 안에서만 거른다.
+        keyword 를 포함하는 공고는 접두어도 반드시 포함하므로 결과는 같다.
+
+        _search_uncached 의 모든 경로(FTS/ngram/LIKE)는 LIKE 로 최종 확인하므로
+        여기서도 LIKE 와 같은 규칙(ASCII 만 대소문자 무시)으로 비교한다.
+        "caf" → "café" 처럼 ASCII 밖 문자가 섞여도 캐시 여부와 관계없이 결과가 같다."""
+        if "%" in keyword or "_" in keyword:
+            # LIKE 와일드카드는 파이썬 부분 문자열 비교로 흉내 내지 않는다
+            return None
+        cached = self.search_cache.longest_prefix(key)
+        if cached is None:
+            return None
+        _prefix, candidate_ids = cached
+        found = self.get_jobs_by_ids(list(candidate_ids))
+
+        def contains(text: Optional[str]) -> bool:
+            return text is not None and key in text.translate(self._ASCII_LOWER)
+
+        candidates = [found[jid] for jid in candidate_ids if jid in found]
+        # 제목/위치로 확인되지 않는 후보만 본문을 한 번에 읽는다 (행마다 지연 로딩 방지)
+        self.prefetch_text(
+            [j for j in candidates if not (contains(j.title) or contains(j.location))]
+        )
+        return [
+            j for j in candidates
+            if contains(j.title) or contains(j.description) or contains(j.location)
+        ]
+
+    def _search_uncached(
+        self, keyword: str, rank: bool, recency_boost: float
+    ) -> List[Job]:
+        if "%" in keyword or "_" in keyword:
+            # LIKE 와일드카드 의미는 색인으로 후보를 좁힐 수 없다
+            return self._search_like(keyword)
+        if len(keyword) >= self.FTS_MIN_KEYWORD and self.has_search_index():
+            return self._search_fts(keyword, rank, recency_boost)
+        if self.ngram_index.can_search(keyword):
+            # "식당" 처럼 trigram 으로 못 찾는 짧은 한글 검색어
+            return self._search_ngram(keyword)
+        return self._search_like(keyword)
+
+    def _search_ngram(self, keyword: str) -> List[Job]:
+        # 색인으로 후보를 좁힌 뒤 LIKE 로 원문 확인 (결과는 LIKE 검색과 동일)
+        subquery, sub_params = self.ngram_index.candidate_subquery(keyword)
         like = f"%{keyword}%"
+        to_job = self._job_mapper()
         cur = self.db_manager.execute_query(
-            """
-            SELECT * FROM jobs
+            f"""
+            SELECT {_JOB_COLS} FROM jobs
+            WHERE job_id IN ({subquery})
+              AND (title LIKE ? OR description LIKE ? OR location LIKE ?)
+            ORDER BY created_at DESC
+            """,
+            (*sub_params, like, like, like),
+        )
+        return [to_job(r) for r in cur.fetchall()]
+
+    def _search_fts(self, keyword: str, rank: bool, recency_boost: float) -> List[Job]:
+        # 큰따옴표로 감싼 문자열 = trigram 부분 문자열 검색.
+        # trigram 은 ASCII 밖 문자(é 등)의 대소문자도 무시하므로 후보를 LIKE 로
+        # 다시 확인한다 (_search_ngram 과 같은 방식, 결과는 LIKE 검색과 동일)
+        match = '"' + keyword.replace('"', '""') + '"'
+        like = f"%{keyword}%"
+        if rank:
+            order = (
+                "bm25(jobs_fts) - ? * COALESCE("
+                "1.0 / (1.0 + MAX(julianday('now', 'localtime') - "
+                f"{self.db_manager.dt_codec.julianday_sql('j.created_at')}, 0)), 0)"
+            )
+            order_params = (recency_boost,)
+        else:
+            order = "j.created_at DESC"
+            order_params = ()
+        to_job = self._job_mapper()
+        cur = self.db_manager.execute_query(
+            f"""
+            SELECT {_JOB_COLS_J} FROM jobs_fts
+            JOIN jobs j ON j.job_id = jobs_fts.rowid
+            WHERE jobs_fts MATCH ?
+              AND (j.title LIKE ? OR j.description LIKE ? OR j.location LIKE ?)
+            ORDER BY {order}
+            """,
+            (match, like, like, like, *order_params),
+        )
+        return [to_job(r) for r in cur.fetchall()]
+
+    def _search_like(self, keyword: str) -> List[Job]:
+        like = f"%{keyword}%"
+        to_job = self._job_mapper()
+        cur = self.db_manager.execute_query(
+            f"""
+            SELECT {_JOB_COLS} FROM jobs
             WHERE title LIKE ? OR description LIKE ? OR location LIKE ?
             ORDER BY created_at DESC
             """,
             (like, like, like),
         )
-        return [self._row_to_job(r) for r in cur.fetchall()]
+        return [to_job(r) for r in cur.fetchall()]
 
 
 # ========== ApplicationDAO ==========
+_MISSING_STATUS = object()  # status 컬럼이 NULL 인 지원서와 구분하기 위한 표식
+
+# ApplicationDAO.apply 결과
+APPLY_OK = "ok"
+APPLY_DUPLICATE = "duplicate"  # 이미 같은 공고에 지원함
+APPLY_FULL = "full"  # 모집 인원(max_applicants) 마감
+APPLY_NO_JOB = "no_job"  # 공고가 없음 (삭제됨)
+
+# ApplicationDAO.update_statuses 의 지원서별 결과
+STATUS_UPDATED = "updated"
+STATUS_UNCHANGED = "unchanged"  # 이미 바꾸려는 상태임
+STATUS_CONFLICT = "conflict"  # 현재 상태가 expected_status 와 다름
+STATUS_NOT_FOUND = "not_found"
+
+
+_INSERT_EVENT_SQL = (
+    "INSERT INTO application_events (application_id, status, ts) VALUES (?, ?, ?)"
+)
+
+
 class ApplicationDAO:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
 
+    def apply(self, app: Application) -> Tuple[str, Optional[int]]:
+        """중복 지원과 모집 인원 초과를 막으며 지원서를 넣는다. (결과, application_id).
+
+        INSERT ... SELECT 한 문장이 job_stats 카운터로 정원을 확인하고
+        (user_id, job_id) 유일 인덱스로 중복을 거른다. 지원서와 이력 행은 쓰기 작업
+        하나로 실행되며 (쓰기 큐가 켜져 있으면 쓰기 스레드, 아니면 BEGIN IMMEDIATE)
+        쓰기 락을 먼저 잡으므로 여러 스레드/프로세스가 동시에 지원해도 정원을 넘지 않는다.
+        max_applicants 가 비어 있거나 0 이하면 인원 제한이 없다.
+        """
+        params = (
+            app.user_id,
+            app.resume_id,
+            app.status,
+            self.db_manager.dt_codec.encode(app.submitted_at),
+            app.job_id,
+        )
+        event_ts = self.db_manager.dt_codec.encode(app.submitted_at or datetime.now())
+
+        def write(conn) -> Tuple[str, Optional[int]]:
+            cur = conn.execute(
+                """
+                INSERT INTO applications (user_id, job_id, resume_id, status, submitted_at)
+                SELECT ?, j.job_id, ?, ?, ?
+                FROM jobs j
+                LEFT JOIN job_stats s ON s.job_id = j.job_id
+                WHERE j.job_id = ?
+                  AND (j.max_applicants IS NULL OR j.max_applicants <= 0
+                       OR COALESCE(s.applicant_count, 0) < j.max_applicants)
+                ON CONFLICT (user_id, job_id) DO NOTHING
+                """,
+                params,
+            )
+            if cur.rowcount > 0:
+                app_id = cur.lastrowid
+                conn.execute(_INSERT_EVENT_SQL, (app_id, app.status, event_ts))
+                return APPLY_OK, app_id
+            # 실패 원인은 같은 작업 안에서 확인하므로 그 사이 상태가 바뀌지 않는다
+            row = conn.execute(
+                """
+                SELECT
+                    EXISTS (SELECT 1 FROM applications
+                            WHERE user_id = ? AND job_id = ?) AS duplicate,
+                    EXISTS (SELECT 1 FROM jobs WHERE job_id = ?) AS job_exists
+                """,
+                (app.user_id, app.job_id, app.job_id),
+            ).fetchone()
+            if row["duplicate"]:
+                return APPLY_DUPLICATE, None
+            if not row["job_exists"]:
+                return APPLY_NO_JOB, None
+            return APPLY_FULL, None
+
+        return self.db_manager.run_write(write)
+
+    def update_statuses(
+        self,
+        app_ids: List[int],
+        new_status: str,
+        expected_status: Optional[str] = None,
+    ) -> Dict[int, str]:
+        """여러 지원서의 상태를 한 트랜잭션(커밋 1번)으로 바꾸고 {id: 결과} 반환.
+        바뀐 지원서마다 application_events 에 이력이 같은 트랜잭션으로 남는다.
+
+        expected_status 를 주면 현재 상태가 그것인 지원서만 바꾼다 (예: "제출" → "합격").
+        현재 상태를 먼저 읽고 executemany 한 번으로 갱신하며, BEGIN IMMEDIATE 로
+        쓰기 락을 잡고 읽으므로 그 사이에 다른 쓰기가 끼어들지 않는다.
+        """
+        ids = list(dict.fromkeys(app_ids))
+        outcomes: Dict[int, str] = {}
+        with self.db_manager.transaction(immediate=True):
+            current = fetch_by_ids(
+                self.db_manager, "applications", "application_id", ids,
+                lambda r: r["status"], "application_id, status",
+            )
+            to_update = []
+            for app_id in ids:
+                status = current.get(app_id, _MISSING_STATUS)
+                if status is _MISSING_STATUS:
+                    outcomes[app_id] = STATUS_NOT_FOUND
+                elif status == new_status:
+                    outcomes[app_id] = STATUS_UNCHANGED
+                elif expected_status is not None and status != expected_status:
+                    outcomes[app_id] = STATUS_CONFLICT
+                else:
+                    outcomes[app_id] = STATUS_UPDATED
+                    to_update.append(app_id)
+            if to_update:
+                self.db_manager.execute_many(
+                    "UPDATE applications SET status = ? WHERE application_id = ?",
+                    [(new_status, app_id) for app_id in to_update],
+                )
+                self._record_events([(app_id, new_status) for app_id in to_update])
+        return outcomes
+
+    def update_statuses_by_job(
+        self,
+        job_id: int,
+        new_status: str,
+        expected_status: Optional[str] = None,
+    ) -> Dict[int, str]:
+        """공고 하나의 지원서(expected_status 를 주면 그 상태인 것만)를 일괄 변경"""
+        where, params = "job_id = ?", [job_id]
+        if expected_status is not None:
+            where += " AND status = ?"
+            params.append(expected_status)
+        with self.db_manager.transaction(immediate=True):
+            cur = self.db_manager.execute_query(
+                f"SELECT application_id FROM applications WHERE {where}", params
+            )
+            ids = [r["application_id"] for r in cur.fetchall()]
+            return self.update_statuses(ids, new_status, expected_status)
+
+    def get_applicant_count(self, job_id: int) -> int:
+        row = self.db_manager.execute_query(
+            "SELECT applicant_count FROM job_stats WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return row["applicant_count"] if row else 0
+
     def insert_application(self, app: Application) -> int:
-        cur = self.db_manager.execute_query(
-            """
-            INSERT INTO applications (user_id, job_id, resume_id, status, submitted_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                app.user_id,
-                app.job_id,
-                app.resume_id,
-                app.status,
-                app.submitted_at.isoformat()
-                if isinstance(app.submitted_at, datetime)
-                else None,
-            ),
+        """지원서와 첫 이력 행을 쓰기 작업 하나로 저장"""
+        params = (
+            app.user_id,
+            app.job_id,
+            app.resume_id,
+            app.status,
+            self.db_manager.dt_codec.encode(app.submitted_at),
         )
-        return cur.lastrowid
+        event_ts = self.db_manager.dt_codec.encode(app.submitted_at or datetime.now())
 
-    def _parse_dt(self, s: Optional[str]) -> Optional[datetime]:
-        if s is None:
-            return None
-        try:
-            return datetime.fromisoformat(s)
-        except Exception:
-            return None
+        def write(conn) -> int:
+            cur = conn.execute(
+                """
+                INSERT INTO applications (user_id, job_id, resume_id, status, submitted_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                params,
+            )
+            app_id = cur.lastrowid
+            conn.execute(_INSERT_EVENT_SQL, (app_id, app.status, event_ts))
+            return app_id
+
+        return self.db_manager.run_write(write)
 
-    def _row_to_app(self, row) -> Application:
-        return Application(
-            application_id=row["application_id"],
-            user_id=row["user_id"],
-            job_id=row["job_id"],
-            resume_id=row["resume_id"],
-            status=row["status"],
-            submitted_at=self._parse_dt(row["submitted_at"]),
+    # ---------- 상태 변경 이력 ----------
+    def _record_events(self, changes: List[Tuple[int, str]], ts: Optional[datetime] = None):
+        """(application_id, status) 목록을 이력에 추가. 호출자의 트랜잭션에 참여한다."""
+        if not changes:
+            return
+        ts_value = self.db_manager.dt_codec.encode(ts or datetime.now())
+        self.db_manager.execute_many(
+            _INSERT_EVENT_SQL, [(app_id, status, ts_value) for app_id, status in changes]
         )
 
+    def get_events_by_application_ids(
+        self, app_ids: List[int]
+    ) -> Dict[int, List[ApplicationEvent]]:
+        """여러 지원서의 이력을 (MAX_IN_PARAMS 개씩) 한 쿼리로 읽어 {id: 시간순 이력}"""
+        unique = list(dict.fromkeys(i for i in app_ids if i is not None))
+        result: Dict[int, List[ApplicationEvent]] = {i: [] for i in unique}
+        for start in range(0, len(unique), MAX_IN_PARAMS):
+            chunk = unique[start:start + MAX_IN_PARAMS]
+            placeholders = ", ".join("?" for _ in chunk)
+            cur = self.db_manager.execute_query(
+                f"""
+                SELECT {APPLICATION_EVENT_MAPPER.select()} FROM application_events
+                WHERE application_id IN ({placeholders})
+                ORDER BY application_id, ts, event_id
+                """,
+                tuple(chunk),
+            )
+            for event in APPLICATION_EVENT_MAPPER.map_all(cur.fetchall()):
+                result[event.application_id].append(event)
+        return result
+
+    def load_events(self, apps: List[Application]) -> List[Application]:
+        """apps 각각의 events 를 한 번에 채워 넣고 apps 를 그대로 반환"""
+        events = self.get_events_by_application_ids([a.application_id for a in apps])
+        for a in apps:
+            a.events = events.get(a.application_id, [])
+        return apps
+
+    _row_to_app = staticmethod(APPLICATION_MAPPER.map)
+
     def get_applications_by_user(self, user_id: int) -> List[Application]:
         cur = self.db_manager.execute_query(
-            "SELECT * FROM applications WHERE user_id = ? ORDER BY submitted_at DESC",
+            f"SELECT {APPLICATION_MAPPER.select()} FROM applications "
+            "WHERE user_id = ? ORDER BY submitted_at DESC",
             (user_id,),
         )
         return [self._row_to_app(r) for r in cur.fetchall()]
 
+    def get_applications_by_ids(self, app_ids: List[int]) -> Dict[int, Application]:
+        return fetch_by_ids(
+            self.db_manager, "applications", "application_id", app_ids, self._row_to_app,
+            APPLICATION_MAPPER.select(),
+        )
+
+    def get_applications_page_by_user(
+        self,
+        user_id: int,
+        page_size: int = 50,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Page:
+        return fetch_keyset_page(
+            self.db_manager, "applications", "submitted_at", "application_id",
+            "user_id = ?", (user_id,), page_size, self._row_to_app, after, before,
+            APPLICATION_MAPPER.select(),
+        )
+
 
 # ========== ResumeDAO ==========
 class ResumeDAO:
@@ -234,12 +1033,8 @@ class ResumeDAO:
                 resume.title,
                 resume.content,
                 1 if resume.is_default else 0,
-                resume.created_at.isoformat()
-                if isinstance(resume.created_at, datetime)
-                else None,
-                resume.updated_at.isoformat()
-                if isinstance(resume.updated_at, datetime)
-                else None,
+                self.db_manager.dt_codec.encode(resume.created_at),
+                self.db_manager.dt_codec.encode(resume.updated_at),
             ),
         )
         return cur.lastrowid
@@ -249,36 +1044,32 @@ class ResumeDAO:
             return False
         fields = []
         params = []
+        adapt = self.db_manager.dt_codec.adapt
         for k, v in data.items():
             fields.append(f"{k} = ?")
-            params.append(v)
+            params.append(adapt(v))
         params.append(resume_id)
         query = f"UPDATE resumes SET {', '.join(fields)} WHERE resume_id = ?"
         cur = self.db_manager.execute_query(query, tuple(params))
         return cur.rowcount > 0
 
-    def _parse_dt(self, s: Optional[str]) -> Optional[datetime]:
-        if s is None:
-            return None
-        try:
-            return datetime.fromisoformat(s)
-        except Exception:
-            return None
-
     def _row_to_resume(self, row) -> Resume:
-        return Resume(
-            resume_id=row["resume_id"],
-            user_id=row["user_id"],
-            title=row["title"],
-            content=row["content"],
-            is_default=bool(row["is_default"]),
-            created_at=self._parse_dt(row["created_at"]),
-            updated_at=self._parse_dt(row["updated_at"]),
+        resume = RESUME_MAPPER.map(row)
+        resume._deferred_loader = self._load_content
+        return resume
+
+    def _load_content(self, resume: Resume):
+        self.prefetch_content([resume])
+
+    def prefetch_content(self, resumes) -> int:
+        return prefetch_deferred(
+            self.db_manager, "resumes", "resume_id", resumes, ("content",)
         )
 
     def get_default_resume(self, user_id: int) -> Optional[Resume]:
         cur = self.db_manager.execute_query(
-            "SELECT * FROM resumes WHERE user_id = ? AND is_default = 1",
+            f"SELECT {RESUME_MAPPER.select()} FROM resumes "
+            "WHERE user_id = ? AND is_default = 1",
             (user_id,),
         )
         row = cur.fetchone()
@@ -300,34 +1091,17 @@ class TimetableDAO:
                 timetable.user_id,
                 timetable.semester,
                 timetable.schedule_data,
-                timetable.created_at.isoformat()
-                if isinstance(timetable.created_at, datetime)
-                else None,
+                self.db_manager.dt_codec.encode(timetable.created_at),
             ),
         )
         return cur.lastrowid
 
-    def _parse_dt(self, s: Optional[str]) -> Optional[datetime]:
-        if s is None:
-            return None
-        try:
-            return datetime.fromisoformat(s)
-        except Exception:
-            return None
-
-    def _row_to_timetable(self, row) -> Timetable:
-        return Timetable(
-            timetable_id=row["timetable_id"],
-            user_id=row["user_id"],
-            semester=row["semester"],
-            schedule_data=row["schedule_data"],
-            created_at=self._parse_dt(row["created_at"]),
-        )
+    _row_to_timetable = staticmethod(TIMETABLE_MAPPER.map)
 
     def get_latest_timetable(self, user_id: int) -> Optional[Timetable]:
         cur = self.db_manager.execute_query(
-            """
-            SELECT * FROM timetables
+            f"""
+            SELECT {TIMETABLE_MAPPER.select()} FROM timetables
             WHERE user_id = ?
             ORDER BY created_at DESC
             LIMIT 1
@@ -342,6 +1116,7 @@ class TimetableDAO:
 class BookmarkDAO:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        self.job_dao = JobDAO(db_manager)
 
     def insert_bookmark(self, bm: Bookmark) -> int:
         cur = self.db_manager.execute_query(
@@ -352,13 +1127,43 @@ class BookmarkDAO:
             (
                 bm.user_id,
                 bm.job_id,
-                bm.created_at.isoformat()
-                if isinstance(bm.created_at, datetime)
-                else None,
+                self.db_manager.dt_codec.encode(bm.created_at),
             ),
         )
         return cur.lastrowid
 
+    def add_bookmark(
+        self, user_id: int, job_id: int, created_at: Optional[datetime] = None
+    ) -> bool:
+        """스크랩 추가. 이미 스크랩한 공고면 아무것도 하지 않고 False."""
+        ts = self.db_manager.dt_codec.encode(created_at or datetime.now())
+        cur = self.db_manager.execute_query(
+            """
+            INSERT INTO bookmarks (user_id, job_id, created_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT (user_id, job_id) DO NOTHING
+            """,
+            (user_id, job_id, ts),
+        )
+        return cur.rowcount > 0
+
+    def add_bookmarks(
+        self, user_id: int, job_ids: List[int], created_at: Optional[datetime] = None
+    ) -> int:
+        """여러 공고를 한 번에 스크랩. 새로 추가된 개수를 반환."""
+        if not job_ids:
+            return 0
+        ts = self.db_manager.dt_codec.encode(created_at or datetime.now())
+        cur = self.db_manager.execute_many(
+            """
+            INSERT INTO bookmarks (user_id, job_id, created_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT (user_id, job_id) DO NOTHING
+            """,
+            [(user_id, jid, ts) for jid in dict.fromkeys(job_ids)],
+        )
+        return cur.rowcount
+
     def delete_bookmark(self, user_id: int, job_id: int) -> bool:
         cur = self.db_manager.execute_query(
             "DELETE FROM bookmarks WHERE user_id = ? AND job_id = ?",
@@ -366,6 +1171,61 @@ class BookmarkDAO:
         )
         return cur.rowcount > 0
 
+    def delete_bookmarks(self, user_id: int, job_ids: List[int]) -> int:
+        """여러 공고의 스크랩을 한 번에 해제. 삭제된 개수를 반환."""
+        ids = list(dict.fromkeys(job_ids))
+        if not ids:
+            return 0
+
+        def write(conn) -> int:
+            # 청크가 여러 개여도 쓰기 작업 하나로 처리되어 일부만 지워지는 일이 없다
+            removed = 0
+            for i in range(0, len(ids), MAX_IN_PARAMS):
+                chunk = ids[i:i + MAX_IN_PARAMS]
+                placeholders = ", ".join("?" for _ in chunk)
+                cur = conn.execute(
+                    f"DELETE FROM bookmarks WHERE user_id = ? AND job_id IN ({placeholders})",
+                    (user_id, *chunk),
+                )
+                removed += cur.rowcount
+            return removed
+
+        return self.db_manager.run_write(write)
+
+    def toggle_bookmark(self, user_id: int, job_id: int) -> bool:
+        """스크랩돼 있으면 해제, 아니면 추가. 호출 후 스크랩 상태(True=스크랩됨)를 반환.
+
+        SQLite 에는 "있으면 지우고 없으면 넣는" 한 문장이 없으므로 INSERT ... DO NOTHING 을
+        먼저 시도하고, 이미 있을 때만 DELETE 한다. 두 문장은 쓰기 작업 하나로 실행된다.
+        """
+        ts = self.db_manager.dt_codec.encode(datetime.now())
+
+        def write(conn) -> bool:
+            cur = conn.execute(
+                """
+                INSERT INTO bookmarks (user_id, job_id, created_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT (user_id, job_id) DO NOTHING
+                """,
+                (user_id, job_id, ts),
+            )
+            if cur.rowcount > 0:
+                return True
+            conn.execute(
+                "DELETE FROM bookmarks WHERE user_id = ? AND job_id = ?",
+                (user_id, job_id),
+            )
+            return False
+
+        return self.db_manager.run_write(write)
+
+    def is_bookmarked(self, user_id: int, job_id: int) -> bool:
+        cur = self.db_manager.execute_query(
+            "SELECT 1 FROM bookmarks WHERE user_id = ? AND job_id = ?",
+            (user_id, job_id),
+        )
+        return cur.fetchone() is not None
+
     def get_bookmarked_job_ids(self, user_id: int) -> List[int]:
         cur = self.db_manager.execute_query(
             "SELECT job_id FROM bookmarks WHERE user_id = ? ORDER BY created_at DESC",
@@ -373,11 +1233,65 @@ class BookmarkDAO:
         )
         return [r["job_id"] for r in cur.fetchall()]
 
+    def get_bookmarked_jobs(self, user_id: int, projection: Optional[str] = None) -> list:
+        """스크랩한 공고를 JOIN 한 번으로 조회 (스크랩 최신순).
+        삭제된 공고를 가리키는 스크랩은 빠진다 (get_orphan_bookmarks 참고).
+        projection 을 주면 Job 대신 그 projection 의 namedtuple 목록."""
+        mapper, columns = self.job_dao._job_mapper(), _JOB_COLS_J
+        if projection is not None:
+            pm = JobDAO.projection(projection)
+            mapper, columns = pm.map, pm.select("j")
+        cur = self.db_manager.execute_query(
+            f"""
+            SELECT {columns}
+            FROM bookmarks b
+            JOIN jobs j ON j.job_id = b.job_id
+            WHERE b.user_id = ?
+            ORDER BY b.created_at DESC
+            """,
+            (user_id,),
+        )
+        return [mapper(r) for r in cur.fetchall()]
+
+    _row_to_bookmark = staticmethod(BOOKMARK_MAPPER.map)
+
+    def get_orphan_bookmarks(self, user_id: Optional[int] = None) -> List[Bookmark]:
+        """이미 삭제된 공고를 가리키는 스크랩 (user_id 가 없으면 전체)"""
+        where = "j.job_id IS NULL"
+        params: tuple = ()
+        if user_id is not None:
+            where += " AND b.user_id = ?"
+            params = (user_id,)
+        cur = self.db_manager.execute_query(
+            f"""
+            SELECT {BOOKMARK_MAPPER.select("b")}
+            FROM bookmarks b
+            LEFT JOIN jobs j ON j.job_id = b.job_id
+            WHERE {where}
+            ORDER BY b.bookmark_id
+            """,
+            params,
+        )
+        return [self._row_to_bookmark(r) for r in cur.fetchall()]
+
+    def delete_orphan_bookmarks(self, user_id: Optional[int] = None) -> int:
+        query = (
+            "DELETE FROM bookmarks "
+            "WHERE NOT EXISTS (SELECT 1 FROM jobs j WHERE j.job_id = bookmarks.job_id)"
+        )
+        params: tuple = ()
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params = (user_id,)
+        cur = self.db_manager.execute_query(query, params)
+        return cur.rowcount
+
 
 # ========== ViewHistoryDAO ==========
 class ViewHistoryDAO:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        self.job_dao = JobDAO(db_manager)
 
     def insert_view(self, vh: ViewHistory) -> int:
         cur = self.db_manager.execute_query(
@@ -388,52 +1302,268 @@ class ViewHistoryDAO:
             (
                 vh.user_id,
                 vh.job_id,
-                vh.viewed_at.isoformat()
-                if isinstance(vh.viewed_at, datetime)
-                else None,
+                self.db_manager.dt_codec.encode(vh.viewed_at),
             ),
         )
         return cur.lastrowid
 
-    def get_recent_job_ids(self, user_id: int, limit: int = 10) -> List[int]:
+    def insert_views(self, views: List[ViewHistory]) -> int:
+        """여러 열람 기록을 executemany 한 번으로 저장 (호출자 트랜잭션에 참여)"""
+        if not views:
+            return 0
+        cur = self.db_manager.execute_many(
+            "INSERT INTO view_history (user_id, job_id, viewed_at) VALUES (?, ?, ?)",
+            [
+                (
+                    vh.user_id,
+                    vh.job_id,
+                    self.db_manager.dt_codec.encode(vh.viewed_at),
+                )
+                for vh in views
+            ],
+        )
+        return cur.rowcount
+
+    def update_view_times(self, changes: List[Tuple[int, int, datetime, datetime]]) -> int:
+        """(user_id, job_id, 저장된 viewed_at, 새 viewed_at) 목록으로 기존 행의 열람 시각을
+        갱신 (호출자 트랜잭션에 참여). history_id 는 그대로 유지된다."""
+        if not changes:
+            return 0
+        encode = self.db_manager.dt_codec.encode
+        cur = self.db_manager.execute_many(
+            "UPDATE view_history SET viewed_at = ? "
+            "WHERE user_id = ? AND job_id = ? AND viewed_at = ?",
+            [
+                (encode(new), user_id, job_id, encode(old))
+                for user_id, job_id, old, new in changes
+            ],
+        )
+        return cur.rowcount
+
+    # 원본 행과 일별 집계 행을 (job_id, viewed_at) 하나의 열람 목록으로 합친다
+    _USER_VIEWS_SQL = """
+        SELECT job_id, viewed_at FROM view_history WHERE user_id = ?
+        UNION ALL
+        SELECT job_id, last_viewed_at FROM view_history_daily WHERE user_id = ?
+    """
+
+    def get_recent_views(
+        self, user_id: int, limit: int = 10, projection: Optional[str] = None
+    ) -> List[Tuple[Any, Optional[datetime]]]:
+        """최근 본 공고를 중복 없이 limit 개, (Job, 마지막 열람 시각) 으로 반환.
+        압축된 일별 집계도 함께 보므로 오래된 열람도 빠지지 않는다.
+        projection 을 주면 Job 대신 그 projection 의 namedtuple."""
+        mapper, columns = self.job_dao._job_mapper(), _JOB_COLS_J
+        if projection is not None:
+            pm = JobDAO.projection(projection)
+            mapper, columns = pm.map, pm.select("j")
+        cur = self.db_manager.execute_query(
+            f"""
+            SELECT {columns}, MAX(v.viewed_at) AS last_viewed_at
+            FROM ({self._USER_VIEWS_SQL}) v
+            JOIN jobs j ON j.job_id = v.job_id
+            GROUP BY v.job_id
+            ORDER BY last_viewed_at DESC
+            LIMIT ?
+            """,
+            (user_id, user_id, limit),
+        )
+        return [
+            (mapper(r), decode_datetime(r["last_viewed_at"]))
+            for r in cur.fetchall()
+        ]
+
+    def get_popular_jobs(
+        self, since: Optional[datetime] = None, limit: int = 10
+    ) -> List[Tuple[Job, int]]:
+        """since 이후 열람 수가 많은 공고 (Job, 열람 수). since=None 이면 전체 기간.
+        압축된 기록은 일 단위이므로 since 가 속한 날은 하루 전체가 포함된다."""
+        raw_where, daily_where, params = "", "", []
+        if since is not None:
+            raw_where = "WHERE viewed_at >= ?"
+            daily_where = "WHERE day >= ?"
+            params = [self.db_manager.dt_codec.encode(since), since.date().isoformat()]
+        to_job = self.job_dao._job_mapper()
+        cur = self.db_manager.execute_query(
+            f"""
+            SELECT {_JOB_COLS_J}, SUM(v.views) AS view_count
+            FROM (
+                SELECT job_id, COUNT(*) AS views FROM view_history {raw_where}
+                GROUP BY job_id
+                UNION ALL
+                SELECT job_id, SUM(count) FROM view_history_daily {daily_where}
+                GROUP BY job_id
+            ) v
+            JOIN jobs j ON j.job_id = v.job_id
+            GROUP BY v.job_id
+            ORDER BY view_count DESC, v.job_id
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+        return [(to_job(r), r["view_count"]) for r in cur.fetchall()]
+
+    # ---------- 압축 ----------
+    def _expired_ids(self, cutoff: datetime, limit: int) -> List[int]:
         cur = self.db_manager.execute_query(
             """
-            SELECT job_id
-            FROM view_history
-            WHERE user_id = ?
-            ORDER BY viewed_at DESC
+            SELECT history_id FROM view_history
+            WHERE viewed_at < ?
+            ORDER BY viewed_at
             LIMIT ?
             """,
-            (user_id, limit),
+            (self.db_manager.dt_codec.encode(cutoff), limit),
         )
-        return [r["job_id"] for r in cur.fetchall()]
+        return [r["history_id"] for r in cur.fetchall()]
+
+    def _over_cap_users(self, per_user_cap: int) -> List[int]:
+        """시각이 있는 원본 기록이 per_user_cap 개를 넘는 사용자.
+        _user_overflow_ids 와 같이 viewed_at 이 NULL 인 행은 세지 않는다.
+        테이블 전체를 훑으므로 쓰기 트랜잭션 밖에서 compact() 시작 시 한 번만 부른다."""
+        cur = self.db_manager.execute_query(
+            """
+            SELECT user_id FROM view_history
+            WHERE viewed_at IS NOT NULL
+            GROUP BY user_id
+            HAVING COUNT(*) > ?
+            """,
+            (per_user_cap,),
+        )
+        return [r["user_id"] for r in cur.fetchall()]
+
+    def _user_overflow_ids(self, user_id: int, per_user_cap: int, limit: int) -> List[int]:
+        """한 사용자의 최근 per_user_cap 개를 넘는 원본 행 (최대 limit 개).
+        (user_id, viewed_at) 인덱스만 타므로 쓰기 락 안에서 불러도 짧다."""
+        cur = self.db_manager.execute_query(
+            """
+            SELECT history_id FROM view_history
+            WHERE user_id = ? AND viewed_at IS NOT NULL
+            ORDER BY viewed_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            (user_id, limit, per_user_cap),
+        )
+        return [r["history_id"] for r in cur.fetchall()]
+
+    def _roll_up(self, history_ids: List[int]) -> int:
+        """원본 행을 일별 집계에 더하고 삭제 (호출자 트랜잭션에 참여)"""
+        placeholders = ", ".join("?" for _ in history_ids)
+        day = self.db_manager.dt_codec.day_sql("viewed_at")
+        self.db_manager.execute_query(
+            f"""
+            INSERT INTO view_history_daily (user_id, job_id, day, count, last_viewed_at)
+            SELECT user_id, job_id, {day}, COUNT(*), MAX(viewed_at)
+            FROM view_history
+            WHERE history_id IN ({placeholders})
+            GROUP BY user_id, job_id, {day}
+            ON CONFLICT (user_id, job_id, day) DO UPDATE SET
+                count = count + excluded.count,
+                last_viewed_at = MAX(last_viewed_at, excluded.last_viewed_at)
+            """,
+            history_ids,
+        )
+        cur = self.db_manager.execute_query(
+            f"DELETE FROM view_history WHERE history_id IN ({placeholders})",
+            history_ids,
+        )
+        return cur.rowcount
+
+    def compact(
+        self,
+        retain_days: int = 90,
+        per_user_cap: int = 200,
+        batch_size: int = 500,
+        max_batches: Optional[int] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        """보존 기간(retain_days)이 지났거나 사용자별 상한(per_user_cap)을 넘는 원본
+        열람 기록을 view_history_daily 로 옮긴다.
+
+        batch_size 행씩 짧은 트랜잭션으로 나눠 처리하며, 쓰기 락 안에서는 인덱스를
+        타는 조회와 옮기기만 한다 (상한을 넘는 사용자 목록은 시작할 때 락 없이 한 번 계산).
+        max_batches 를 주면 그만큼만 하고 멈추고 (다음 호출에서 이어서 진행),
+        should_stop() 이 참이 되면 배치 사이에서 멈춘다. 옮긴 원본 행 수를 반환한다.
+        """
+        batch_size = min(batch_size, MAX_IN_PARAMS)
+        cutoff = datetime.now() - timedelta(days=retain_days)
+        over_cap = self._over_cap_users(per_user_cap)
+        moved = 0
+        batches = 0
+
+        def can_continue() -> bool:
+            if max_batches is not None and batches >= max_batches:
+                return False
+            return should_stop is None or not should_stop()
+
+        # 1) 보존 기간이 지난 기록 (viewed_at 인덱스)
+        while can_continue():
+            with self.db_manager.transaction(immediate=True):
+                ids = self._expired_ids(cutoff, batch_size)
+                if ids:
+                    moved += self._roll_up(ids)
+            if not ids:
+                break
+            batches += 1
+
+        # 2) 사용자별 상한을 넘는 기록 (사용자마다 (user_id, viewed_at) 인덱스)
+        for user_id in over_cap:
+            while can_continue():
+                with self.db_manager.transaction(immediate=True):
+                    ids = self._user_overflow_ids(user_id, per_user_cap, batch_size)
+                    if ids:
+                        moved += self._roll_up(ids)
+                if not ids:
+                    break
+                batches += 1
+                if len(ids) < batch_size:
+                    break
+        return moved
 
 
 # ========== FAQDAO ==========
 class FAQDAO:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        self.ngram_index = NgramIndex(db_manager, "faq")
+
+    _row_to_faq = staticmethod(FAQ_MAPPER.map)
 
     def get_all(self) -> List[FAQ]:
-        cur = self.db_manager.execute_query("SELECT * FROM faqs")
+        cur = self.db_manager.execute_query(f"SELECT {FAQ_MAPPER.select()} FROM faqs")
         rows = cur.fetchall()
-        return [
-            FAQ(
-                faq_id=r["faq_id"],
-                category=r["category"],
-                question=r["question"],
-                answer=r["answer"],
-            )
-            for r in rows
-        ]
+        return [self._row_to_faq(r) for r in rows]
 
     def insert_faq(self, faq: FAQ) -> int:
-        cur = self.db_manager.execute_query(
-            "INSERT INTO faqs (category, question, answer) VALUES (?, ?, ?)",
-            (faq.category, faq.question, faq.answer),
-        )
+        with self.db_manager.transaction():
+            cur = self.db_manager.execute_query(
+                "INSERT INTO faqs (category, question, answer) VALUES (?, ?, ?)",
+                (faq.category, faq.question, faq.answer),
+            )
+            self.ngram_index.index(cur.lastrowid, (faq.question, faq.answer))
         return cur.lastrowid
 
+    def search(self, keyword: str) -> List[FAQ]:
+        """질문/답변에 keyword 가 포함된 FAQ (bigram 색인 사용)"""
+        like = f"%{keyword}%"
+        if self.ngram_index.can_search(keyword):
+            subquery, sub_params = self.ngram_index.candidate_subquery(keyword)
+            cur = self.db_manager.execute_query(
+                f"""
+                SELECT {FAQ_MAPPER.select()} FROM faqs
+                WHERE faq_id IN ({subquery})
+                  AND (question LIKE ? OR answer LIKE ?)
+                ORDER BY faq_id
+                """,
+                (*sub_params, like, like),
+            )
+        else:
+            cur = self.db_manager.execute_query(
+                f"SELECT {FAQ_MAPPER.select()} FROM faqs "
+                "WHERE question LIKE ? OR answer LIKE ? ORDER BY faq_id",
+                (like, like),
+            )
+        return [self._row_to_faq(r) for r in cur.fetchall()]
+
 
 # ========== InquiryDAO ==========
 class InquiryDAO:
@@ -452,38 +1582,52 @@ class InquiryDAO:
                 inq.content,
                 inq.answer,
                 inq.status,
-                inq.created_at.isoformat()
-                if isinstance(inq.created_at, datetime)
-                else None,
-                inq.answered_at.isoformat()
-                if isinstance(inq.answered_at, datetime)
-                else None,
+                self.db_manager.dt_codec.encode(inq.created_at),
+                self.db_manager.dt_codec.encode(inq.answered_at),
             ),
         )
         return cur.lastrowid
 
+    def _row_to_inquiry(self, row) -> Inquiry:
+        inq = INQUIRY_MAPPER.map(row)
+        inq._deferred_loader = self._load_content
+        return inq
+
+    def _load_content(self, inq: Inquiry):
+        self.prefetch_content([inq])
+
+    def prefetch_content(self, inquiries) -> int:
+        return prefetch_deferred(
+            self.db_manager, "inquiries", "inquiry_id", inquiries, ("content",)
+        )
+
     def get_inquiries_by_user(self, user_id: int) -> List[Inquiry]:
         cur = self.db_manager.execute_query(
-            "SELECT * FROM inquiries WHERE user_id = ? ORDER BY created_at DESC",
+            f"SELECT {INQUIRY_MAPPER.select()} FROM inquiries "
+            "WHERE user_id = ? ORDER BY created_at DESC",
             (user_id,),
         )
         rows = cur.fetchall()
         res = []
         for r in rows:
-            res.append(
-                Inquiry(
-                    inquiry_id=r["inquiry_id"],
-                    user_id=r["user_id"],
-                    title=r["title"],
-                    content=r["content"],
-                    answer=r["answer"],
-                    status=r["status"],
-                    created_at=datetime.fromisoformat(r["created_at"])
-                    if r["created_at"]
-                    else None,
-                    answered_at=datetime.fromisoformat(r["answered_at"])
-                    if r["answered_at"]
-                    else None,
-                )
-            )
+            res.append(self._row_to_inquiry(r))
         return res
+
+    def get_inquiries_by_ids(self, inquiry_ids: List[int]) -> Dict[int, Inquiry]:
+        return fetch_by_ids(
+            self.db_manager, "inquiries", "inquiry_id", inquiry_ids, self._row_to_inquiry,
+            INQUIRY_MAPPER.select(),
+        )
+
+    def get_inquiries_page_by_user(
+        self,
+        user_id: int,
+        page_size: int = 50,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Page:
+        return fetch_keyset_page(
+            self.db_manager, "inquiries", "created_at", "inquiry_id",
+            "user_id = ?", (user_id,), page_size, self._row_to_inquiry, after, before,
+            INQUIRY_MAPPER.select(),
+        )
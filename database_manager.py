@@ -1,38 +1,1130 @@
 # database_manager.py
+import queue
+import re
 import sqlite3
-from typing import Optional
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Tuple, Optional, Union
 
+from datetime_codec import DATETIME_COLUMNS, DatetimeCodec, decode_datetime
+from query_profiler import BufferedCursor, QueryProfiler
+from search_index import document_ngrams
+
+
+# ========== 성능 프로파일 ==========
+# connect() 시 적용할 PRAGMA 묶음. 순서대로 실행된다.
+PERFORMANCE_PROFILES = {
+    # 단일 사용자 데스크톱 앱: WAL 로 읽기/쓰기 동시 진행, 커밋당 fsync 최소화
+    "desktop": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,  # 음수 = KiB 단위 (약 16MB)
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # 여러 스레드/프로세스가 동시에 접근하는 서버
+    "server": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 15000,
+    },
+    # 초기 적재/일괄 가져오기: 내구성보다 속도. 작업 후 다른 프로파일로 다시 연결할 것
+    "bulk-load": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -256000,
+        "mmap_size": 512 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+}
+
+PRAGMA_NAMES = (
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "busy_timeout",
+)
+
+
+# ========== 스키마 마이그레이션 ==========
+# (버전, 설명, 단계 목록). 단계는 SQL 문자열 또는 cursor 를 받는 함수.
+# 버전은 PRAGMA user_version 에 기록되며, 모든 단계는 여러 번 실행해도 안전해야 한다.
+MigrationStep = Union[str, Callable[[sqlite3.Cursor], None]]
+
+def create_job_search_index(cur: sqlite3.Cursor) -> bool:
+    """jobs 의 FTS5(trigram) 검색 인덱스와 동기화 트리거를 만든다.
+    FTS5/trigram 을 지원하지 않는 SQLite 에서는 아무것도 하지 않고 False."""
+    try:
+        cur.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, description, location,
+                content='jobs', content_rowid='job_id',
+                tokenize='trigram'
+            )
+            """
+        )
+    except sqlite3.OperationalError:
+        return False
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, title, description, location)
+            VALUES (new.job_id, new.title, new.description, new.location);
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, description, location)
+            VALUES ('delete', old.job_id, old.title, old.description, old.location);
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_au
+        AFTER UPDATE OF title, description, location ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, description, location)
+            VALUES ('delete', old.job_id, old.title, old.description, old.location);
+            INSERT INTO jobs_fts (rowid, title, description, location)
+            VALUES (new.job_id, new.title, new.description, new.location);
+        END
+        """
+    )
+    # 이미 있는 공고까지 색인
+    cur.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+    return True
+
+
+# search_ngrams 에 색인되는 (scope, 테이블, id 컬럼, 텍스트 컬럼들)
+NGRAM_SOURCES = (
+    ("job", "jobs", "job_id", ("title", "description", "location")),
+    ("faq", "faqs", "faq_id", ("question", "answer")),
+)
+
+
+def create_ngram_index(cur: sqlite3.Cursor):
+    """한글 부분 문자열 검색용 bigram 역색인을 만들고 기존 데이터를 색인"""
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS search_ngrams (
+            scope   TEXT NOT NULL,
+            gram    TEXT NOT NULL,
+            doc_id  INTEGER NOT NULL,
+            PRIMARY KEY (scope, gram, doc_id)
+        ) WITHOUT ROWID
+        """
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_search_ngrams_doc "
+        "ON search_ngrams (scope, doc_id)"
+    )
+    for scope, table, id_col, text_cols in NGRAM_SOURCES:
+        rows = cur.execute(
+            f"SELECT {id_col}, {', '.join(text_cols)} FROM {table}"
+        ).fetchall()
+        cur.executemany(
+            "INSERT OR IGNORE INTO search_ngrams (scope, gram, doc_id) VALUES (?, ?, ?)",
+            [
+                (scope, g, r[0])
+                for r in rows
+                for g in document_ngrams(tuple(r)[1:])
+            ],
+        )
+
+
+def retype_datetime_columns(cur: sqlite3.Cursor):
+    """DATETIME_COLUMNS 의 선언 타입을 TEXT → TIMESTAMP(NUMERIC affinity) 로 바꾼다.
+
+    TEXT affinity 컬럼에는 정수를 넣어도 문자열로 저장되므로 epoch 저장 방식을
+    쓰려면 필요하다. ISO 문자열은 NUMERIC affinity 에서도 그대로 문자열로 남는다.
+    SQLite 는 컬럼 타입 변경을 지원하지 않으므로 테이블을 새로 만들어 복사한 뒤
+    인덱스/트리거를 다시 만든다. 이미 TIMESTAMP 인 테이블은 건너뛴다.
+    """
+    for table, columns in DATETIME_COLUMNS.items():
+        row = cur.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table,),
+        ).fetchone()
+        if row is None:
+            continue
+        sql = row[0]
+        for col in columns:
+            sql = re.sub(rf"(\b{col}\s+)TEXT\b", r"\1TIMESTAMP", sql)
+        if sql == row[0]:
+            continue
+        dependents = cur.execute(
+            "SELECT sql FROM sqlite_master "
+            "WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL",
+            (table,),
+        ).fetchall()
+        seq = cur.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)
+        ).fetchone()
+        tmp = f"{table}__retype"
+        cur.execute(re.sub(rf"^CREATE TABLE \"?{table}\"?", f"CREATE TABLE {tmp}", sql))
+        cur.execute(f"INSERT INTO {tmp} SELECT * FROM {table}")
+        cur.execute(f"DROP TABLE {table}")
+        cur.execute(f"ALTER TABLE {tmp} RENAME TO {table}")
+        for (dep_sql,) in dependents:
+            cur.execute(dep_sql)
+        if seq is not None:
+            cur.execute("DELETE FROM sqlite_sequence WHERE name = ?", (table,))
+            cur.execute(
+                "INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, seq[0])
+            )
+
+
+def convert_datetime_columns(cur: sqlite3.Cursor, codec: DatetimeCodec) -> int:
+    """모든 날짜 컬럼 값을 codec 의 저장 방식으로 다시 쓴다. 바뀐 행 수를 돌려준다.
+
+    같은 시각이 반복되는 경우가 많아 서로 다른 값만 변환해 임시 매핑 테이블에
+    넣고, 컬럼마다 UPDATE 한 번으로 바꾼다. 해석할 수 없는 값은 그대로 둔다.
+    """
+    source_type = "text" if codec.mode == "epoch" else "integer"
+    cur.execute("CREATE TEMP TABLE IF NOT EXISTS datetime_map (old PRIMARY KEY, new)")
+    changed = 0
+    for table, columns in DATETIME_COLUMNS.items():
+        for col in columns:
+            values = cur.execute(
+                f"SELECT DISTINCT {col} FROM {table} WHERE typeof({col}) = ?",
+                (source_type,),
+            ).fetchall()
+            pairs = [(v, codec.encode(decode_datetime(v))) for (v,) in values]
+            pairs = [p for p in pairs if p[1] is not None]
+            if not pairs:
+                continue
+            cur.execute("DELETE FROM temp.datetime_map")
+            cur.executemany("INSERT INTO temp.datetime_map (old, new) VALUES (?, ?)", pairs)
+            cur.execute(
+                f"""
+                UPDATE {table}
+                SET {col} = (SELECT new FROM temp.datetime_map WHERE old = {table}.{col})
+                WHERE {col} IN (SELECT old FROM temp.datetime_map)
+                """
+            )
+            changed += cur.rowcount
+    cur.execute("DROP TABLE temp.datetime_map")
+    return changed
+
+
+MIGRATIONS: List[Tuple[int, str, List[MigrationStep]]] = [
+    (
+        1,
+        "사용자별 조회용 보조 인덱스",
+        [
+            # ApplicationDAO.get_applications_by_user / keyset 페이지.
+            # (정렬 컬럼 DESC, id DESC) 순서는 오름차순 인덱스를 역방향으로 읽어야
+            # rowid 까지 정렬된 채로 나온다. 내림차순 인덱스는 동점 구간을 다시 정렬한다.
+            "CREATE INDEX IF NOT EXISTS idx_applications_user_submitted "
+            "ON applications (user_id, submitted_at)",
+            # BookmarkDAO.get_bookmarked_job_ids
+            "CREATE INDEX IF NOT EXISTS idx_bookmarks_user_created "
+            "ON bookmarks (user_id, created_at DESC)",
+            # ViewHistoryDAO._user_overflow_ids (사용자별 상한을 넘는 기록 압축)
+            "CREATE INDEX IF NOT EXISTS idx_view_history_user_viewed "
+            "ON view_history (user_id, viewed_at DESC)",
+            # TimetableDAO.get_latest_timetable
+            "CREATE INDEX IF NOT EXISTS idx_timetables_user_created "
+            "ON timetables (user_id, created_at DESC)",
+            # ResumeDAO.get_default_resume
+            "CREATE INDEX IF NOT EXISTS idx_resumes_user_default "
+            "ON resumes (user_id, is_default)",
+            # InquiryDAO.get_inquiries_by_user / keyset 페이지
+            "CREATE INDEX IF NOT EXISTS idx_inquiries_user_created "
+            "ON inquiries (user_id, created_at)",
+        ],
+    ),
+    (
+        2,
+        "공고 목록 정렬용 인덱스",
+        [
+            # JobDAO.get_all_jobs / search_jobs / keyset 페이지 (역방향으로 읽는다)
+            "CREATE INDEX IF NOT EXISTS idx_jobs_created "
+            "ON jobs (created_at)",
+        ],
+    ),
+    (
+        3,
+        "공고 전문 검색(FTS5) 인덱스",
+        [create_job_search_index],
+    ),
+    (
+        4,
+        "공고/FAQ 한글 bigram 색인",
+        [create_ngram_index],
+    ),
+    (
+        5,
+        "공고 패싯 필터용 인덱스",
+        [
+            # JobDAO.find_jobs / facet_counts
+            "CREATE INDEX IF NOT EXISTS idx_jobs_category_created "
+            "ON jobs (category, created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_jobs_job_type_created "
+            "ON jobs (job_type, created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location)",
+            "CREATE INDEX IF NOT EXISTS idx_jobs_department ON jobs (department)",
+            "CREATE INDEX IF NOT EXISTS idx_jobs_deadline ON jobs (deadline)",
+        ],
+    ),
+    (
+        6,
+        "최근 본 공고(중복 제거) 조회용 커버링 인덱스",
+        [
+            # ViewHistoryDAO.get_recent_views
+            "CREATE INDEX IF NOT EXISTS idx_view_history_user_job_viewed "
+            "ON view_history (user_id, job_id, viewed_at)",
+        ],
+    ),
+    (
+        7,
+        "열람 기록 일별 집계 테이블 (오래된 원본 행 압축용)",
+        [
+            # ViewHistoryDAO.compact 가 보존 기간/사용자별 상한을 넘는 원본 행을 옮겨 담는다
+            """
+            CREATE TABLE IF NOT EXISTS view_history_daily (
+                user_id INTEGER NOT NULL,
+                job_id INTEGER NOT NULL,
+                day TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                last_viewed_at TEXT NOT NULL,
+                PRIMARY KEY (user_id, job_id, day)
+            ) WITHOUT ROWID
+            """,
+            # ViewHistoryDAO.get_popular_jobs (기간 내 집계분)
+            "CREATE INDEX IF NOT EXISTS idx_view_history_daily_day "
+            "ON view_history_daily (day, job_id, count)",
+            # 보존 기간이 지난 원본 행 선택 + 기간 내 인기 공고 집계
+            "CREATE INDEX IF NOT EXISTS idx_view_history_viewed "
+            "ON view_history (viewed_at, job_id)",
+        ],
+    ),
+    (
+        8,
+        "스크랩 중복 제거 + (user_id, job_id) 유일 인덱스",
+        [
+            # 같은 공고를 여러 번 스크랩한 행은 가장 먼저 만든 것만 남긴다
+            "DELETE FROM bookmarks WHERE bookmark_id NOT IN "
+            "(SELECT MIN(bookmark_id) FROM bookmarks GROUP BY user_id, job_id)",
+            # BookmarkDAO.add_bookmark 의 ON CONFLICT 대상 + 스크랩 여부 조회
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_bookmarks_user_job "
+            "ON bookmarks (user_id, job_id)",
+        ],
+    ),
+    (
+        9,
+        "지원 중복 제거 + 유일 인덱스, 공고별 지원자 수(job_stats) 카운터",
+        [
+            "DELETE FROM applications WHERE application_id NOT IN "
+            "(SELECT MIN(application_id) FROM applications GROUP BY user_id, job_id)",
+            # ApplicationDAO.apply 의 ON CONFLICT 대상
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_applications_user_job "
+            "ON applications (user_id, job_id)",
+            # 지원할 때마다 COUNT(*) 하지 않도록 트리거로 유지하는 지원자 수
+            """
+            CREATE TABLE IF NOT EXISTS job_stats (
+                job_id INTEGER PRIMARY KEY,
+                applicant_count INTEGER NOT NULL DEFAULT 0
+            )
+            """,
+            "DELETE FROM job_stats",
+            "INSERT INTO job_stats (job_id, applicant_count) "
+            "SELECT job_id, COUNT(*) FROM applications GROUP BY job_id",
+            """
+            CREATE TRIGGER IF NOT EXISTS job_stats_app_ai AFTER INSERT ON applications BEGIN
+                INSERT OR IGNORE INTO job_stats (job_id, applicant_count) VALUES (new.job_id, 0);
+                UPDATE job_stats SET applicant_count = applicant_count + 1
+                WHERE job_id = new.job_id;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS job_stats_app_ad AFTER DELETE ON applications BEGIN
+                UPDATE job_stats SET applicant_count = applicant_count - 1
+                WHERE job_id = old.job_id;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS job_stats_app_au AFTER UPDATE OF job_id ON applications
+            WHEN old.job_id IS NOT new.job_id BEGIN
+                UPDATE job_stats SET applicant_count = applicant_count - 1
+                WHERE job_id = old.job_id;
+                INSERT OR IGNORE INTO job_stats (job_id, applicant_count) VALUES (new.job_id, 0);
+                UPDATE job_stats SET applicant_count = applicant_count + 1
+                WHERE job_id = new.job_id;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS job_stats_job_ad AFTER DELETE ON jobs BEGIN
+                DELETE FROM job_stats WHERE job_id = old.job_id;
+            END
+            """,
+        ],
+    ),
+    (
+        10,
+        "공고별 지원서 상태 일괄 변경용 인덱스",
+        [
+            # ApplicationDAO.update_statuses_by_job
+            "CREATE INDEX IF NOT EXISTS idx_applications_job_status "
+            "ON applications (job_id, status)",
+        ],
+    ),
+    (
+        11,
+        "지원서 상태 변경 이력(application_events)",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS application_events (
+                event_id INTEGER PRIMARY KEY,
+                application_id INTEGER NOT NULL,
+                status TEXT,
+                ts TEXT NOT NULL
+            )
+            """,
+            # ApplicationDAO.get_events_by_application_ids
+            "CREATE INDEX IF NOT EXISTS idx_application_events_app_ts "
+            "ON application_events (application_id, ts)",
+            # 기존 지원서: 제출 이벤트 + (제출이 아니면) 현재 상태.
+            # 현재 상태로 바뀐 실제 시각은 남아 있지 않으므로 제출 시각으로 대신한다.
+            # 다시 실행해도 이미 있는 이벤트는 넣지 않는다.
+            """
+            INSERT INTO application_events (application_id, status, ts)
+            SELECT a.application_id, '제출', a.submitted_at FROM applications a
+            WHERE a.submitted_at IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM application_events e
+                  WHERE e.application_id = a.application_id AND e.status = '제출'
+              )
+            """,
+            """
+            INSERT INTO application_events (application_id, status, ts)
+            SELECT a.application_id, a.status, a.submitted_at FROM applications a
+            WHERE a.submitted_at IS NOT NULL AND a.status IS NOT '제출'
+              AND NOT EXISTS (
+                  SELECT 1 FROM application_events e
+                  WHERE e.application_id = a.application_id AND e.status IS a.status
+              )
+            """,
+        ],
+    ),
+    (
+        12,
+        "날짜 컬럼 TIMESTAMP 타입 + 날짜 저장 방식 설정",
+        [
+            retype_datetime_columns,
+            """
+            CREATE TABLE IF NOT EXISTS settings (
+                key     TEXT PRIMARY KEY,
+                value   TEXT
+            )
+            """,
+            # 기존 DB 는 모두 ISO 문자열로 저장돼 있다
+            "INSERT OR IGNORE INTO settings (key, value) VALUES ('datetime_mode', 'iso')",
+        ],
+    ),
+]
+
+
+# ========== 커넥션 풀 ==========
+class PoolTimeoutError(RuntimeError):
+    """풀이 가득 차서 제한 시간 안에 커넥션을 얻지 못함"""
+
+
+class ConnectionPool:
+    """스레드별 sqlite3 커넥션 풀.
+
+    한 스레드는 checkin() 하기 전까지 같은 커넥션을 계속 사용한다.
+    DatabaseManager 는 트랜잭션 밖의 문장을 실행할 때마다(결과는 메모리로 읽어 둔 뒤)
+    그리고 가장 바깥 트랜잭션이 끝날 때 반납하므로, 작업 스레드가 release() 를
+    부르지 않아도 커넥션을 붙잡고 있지 않는다.
+    checkin 된 커넥션은 유휴 목록으로 돌아가 다른 스레드가 재사용하고,
+    idle_timeout 동안 쓰이지 않으면 닫힌다. 종료된 스레드가 반납하지 않은
+    커넥션은 풀이 가득 찼을 때 회수한다.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], sqlite3.Connection],
+        max_size: int = 8,
+        idle_timeout: float = 300.0,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size 는 1 이상이어야 합니다.")
+        self._factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._cond = threading.Condition()
+        self._idle: List[Tuple[sqlite3.Connection, float]] = []
+        self._in_use: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._size = 0
+
+    def current(self) -> Optional[sqlite3.Connection]:
+        """호출 스레드가 지금 들고 있는 커넥션 (없으면 None)"""
+        entry = self._in_use.get(threading.get_ident())
+        if entry is None or entry[0] is not threading.current_thread():
+            return None
+        return entry[1]
+
+    def checkout(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        ident = threading.get_ident()
+        me = threading.current_thread()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            entry = self._in_use.get(ident)
+            if entry is not None:
+                if entry[0] is me:
+                    return entry[1]
+                # 스레드 id 가 재사용된 경우: 죽은 스레드의 커넥션을 이어받는다
+                conn = entry[1]
+                self._reset(conn)
+                self._in_use[ident] = (me, conn)
+                return conn
+
+            while True:
+                self._evict_idle_locked()
+                if self._idle:
+                    conn, _ = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    conn = self._factory()
+                    self._size += 1
+                    break
+                if self._reclaim_dead_locked():
+                    continue
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"커넥션 풀이 가득 찼습니다 (max_size={self.max_size})"
+                    )
+                self._cond.wait(remaining)
+
+            self._in_use[ident] = (me, conn)
+            return conn
+
+    def checkin(self):
+        """호출 스레드의 커넥션을 풀에 반납"""
+        with self._cond:
+            entry = self._in_use.pop(threading.get_ident(), None)
+            if entry is None:
+                return
+            self._reset(entry[1])
+            self._idle.append((entry[1], time.monotonic()))
+            self._cond.notify()
+
+    def evict_idle(self) -> int:
+        """idle_timeout 을 넘긴 유휴 커넥션을 닫고 닫은 개수를 반환"""
+        with self._cond:
+            return self._evict_idle_locked()
+
+    def close_all(self):
+        with self._cond:
+            for conn, _ in self._idle:
+                conn.close()
+            for _, conn in self._in_use.values():
+                conn.close()
+            self._idle.clear()
+            self._in_use.clear()
+            self._size = 0
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+            }
+
+    def _reset(self, conn: sqlite3.Connection):
+        # 끝나지 않은 트랜잭션을 다음 사용자에게 넘기지 않는다
+        if conn.in_transaction:
+            conn.rollback()
+
+    def _evict_idle_locked(self) -> int:
+        if self.idle_timeout is None:
+            return 0
+        now = time.monotonic()
+        keep = []
+        closed = 0
+        # 가장 오래 쉰 것부터 닫되, 풀의 마지막 커넥션은 남겨 둔다
+        for conn, since in self._idle:
+            if now - since > self.idle_timeout and self._size > 1:
+                conn.close()
+                self._size -= 1
+                closed += 1
+            else:
+                keep.append((conn, since))
+        self._idle = keep
+        return closed
+
+    def _reclaim_dead_locked(self) -> bool:
+        reclaimed = False
+        for ident, (thread, conn) in list(self._in_use.items()):
+            if not thread.is_alive():
+                del self._in_use[ident]
+                self._reset(conn)
+                self._idle.append((conn, time.monotonic()))
+                reclaimed = True
+        return reclaimed
+
+
+# ========== 단일 쓰기 스레드 ==========
+WRITE_VERBS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def is_write_query(query: str) -> bool:
+    words = query.split(None, 1)
+    return bool(words) and words[0].upper() in WRITE_VERBS
+
+
+class WriteResult:
+    """쓰기 큐에서 실행된 문장의 결과.
+    DAO 가 사용하는 커서 속성(lastrowid, rowcount)과 호환된다."""
+
+    description = None
+
+    def __init__(self, lastrowid: Optional[int], rowcount: int):
+        self.lastrowid = lastrowid
+        self.rowcount = rowcount
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self) -> list:
+        return []
+
+
+class WriteQueue:
+    """모든 쓰기를 전용 스레드 하나에서 직렬로 실행하는 큐.
+
+    어느 스레드에서든 submit() 으로 작업을 넣으면 Future 를 돌려받는다.
+    쓰기 스레드는 큐에 쌓인 작업을 최대 max_batch 개까지 모아 한 트랜잭션으로
+    커밋한다 (group commit). 작업마다 SAVEPOINT 를 두므로 실패한 작업만
+    되돌려지고 그 Future 에 예외가 전달된다.
+    여러 문장이 한 단위여야 하는 쓰기는 submit_call(fn) 으로 넣으면 fn(conn) 이
+    작업 하나(SAVEPOINT 하나)로 실행되고 그 반환값이 Future 의 결과가 된다.
+    fn 안에서 부르는 execute_query / DAO / transaction() 도 그 작업에 참여한다.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_manager: "DatabaseManager", max_batch: int = 256):
+        self.db_manager = db_manager
+        self.max_batch = max_batch
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="db-writer", daemon=True
+        )
+        # stop() 이후에는 새 작업을 받지 않는다. 확인과 put 을 한 락으로 묶어
+        # _STOP 뒤에 작업이 끼어들지 못하게 한다.
+        self._submit_lock = threading.Lock()
+        self._stopping = False
+        self.batches = 0
+        self.writes = 0
+
+    def start(self):
+        self._thread.start()
+
+    def is_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, query: str, params=None, many: bool = False) -> Future:
+        return self._enqueue(query, params, many)
+
+    def submit_call(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        return self._enqueue(fn, None, False)
+
+    def _enqueue(self, query, params, many: bool) -> Future:
+        if self.is_writer_thread():
+            # 쓰기 스레드가 자기 뒤의 작업을 기다리면 영원히 끝나지 않는다
+            raise RuntimeError("쓰기 작업 안에서는 쓰기 큐에 작업을 넣을 수 없습니다.")
+        fut: Future = Future()
+        with self._submit_lock:
+            if self._stopping or not self._thread.is_alive():
+                raise RuntimeError("쓰기 스레드가 실행 중이 아닙니다.")
+            self._queue.put((fut, query, params, many))
+        return fut
+
+    def stop(self, timeout: Optional[float] = None):
+        """남은 작업을 모두 커밋한 뒤 쓰기 스레드를 종료"""
+        with self._submit_lock:
+            if not self._stopping:
+                self._stopping = True
+                self._queue.put(self._STOP)
+        if self._thread.ident is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        error: BaseException = RuntimeError("쓰기 스레드가 종료되어 작업이 실행되지 않았습니다.")
+        try:
+            conn = self.db_manager.connect()
+            try:
+                stopping = False
+                while not stopping:
+                    job = self._queue.get()
+                    if job is self._STOP:
+                        break
+                    batch = [job]
+                    while len(batch) < self.max_batch:
+                        try:
+                            job = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if job is self._STOP:
+                            stopping = True
+                            break
+                        batch.append(job)
+                    self._commit_batch(conn, batch)
+            finally:
+                self.db_manager.release()
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._fail_remaining(error)
+
+    def _fail_remaining(self, error: BaseException):
+        # 스레드가 끝난 뒤 큐에 남은 작업은 실행되지 않으므로 기다리는 호출자를 깨운다
+        with self._submit_lock:
+            self._stopping = True
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is self._STOP:
+                continue
+            fut = job[0]
+            if fut.set_running_or_notify_cancel():
+                fut.set_exception(error)
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch: list):
+        db = self.db_manager
+        outcomes = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # 배치 동안 쓰기 스레드는 트랜잭션 안에 있는 것으로 본다. 작업 fn 이 부르는
+            # execute_query / DAO / transaction() 은 커밋하지 않고 이 트랜잭션(SAVEPOINT)에
+            # 참여하며, on_commit/on_rollback 훅은 배치 커밋/작업 롤백 때 실행된다.
+            db._tx_depth = 1
+            for fut, query, params, many in batch:
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                hooks_start = len(db._rollback_hooks)
+                commit_hooks_start = len(db._commit_hooks)
+                conn.execute("SAVEPOINT write_job")
+                try:
+                    if callable(query):
+                        result = query(conn)
+                    else:
+                        if many:
+                            cur = conn.executemany(query, params)
+                        elif params is None:
+                            cur = conn.execute(query)
+                        else:
+                            cur = conn.execute(query, params)
+                        result = WriteResult(cur.lastrowid, cur.rowcount)
+                    conn.execute("RELEASE SAVEPOINT write_job")
+                    outcomes.append((fut, result, None))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT write_job")
+                    conn.execute("RELEASE SAVEPOINT write_job")
+                    del db._commit_hooks[commit_hooks_start:]
+                    db._run_rollback_hooks(hooks_start)
+                    outcomes.append((fut, None, e))
+            db._tx_depth = 0
+            conn.commit()
+        except Exception as e:
+            # BEGIN/COMMIT 자체가 실패하면 배치 전체가 실패한다
+            db._tx_depth = 0
+            if conn.in_transaction:
+                conn.rollback()
+            del db._commit_hooks[:]
+            db._run_rollback_hooks(0)
+            for fut, _query, _params, _many in batch:
+                if fut.running():
+                    fut.set_exception(e)
+                elif not fut.done() and fut.set_running_or_notify_cancel():
+                    fut.set_exception(e)
+            return
+
+        self.batches += 1
+        self.writes += len(outcomes)
+        del db._rollback_hooks[:]
+        committed = db._commit_hooks[:]
+        del db._commit_hooks[:]
+        for hook in committed:
+            hook()
+        # 커밋 이후에 결과를 알려서, 호출자는 항상 영속화된 결과를 본다
+        for fut, result, error in outcomes:
+            if error is None:
+                fut.set_result(result)
+            else:
+                fut.set_exception(error)
 
-import sqlite3
-from typing import Any, List, Tuple, Optional
 
 class DatabaseManager:
     """SQLite 데이터베이스 연결 및 쿼리 실행"""
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        profile: Optional[str] = None,
+        pool_size: int = 8,
+        idle_timeout: float = 300.0,
+        datetime_mode: Optional[str] = None,
+        pool_timeout: Optional[float] = 30.0,
+    ):
+        if profile is not None and profile not in PERFORMANCE_PROFILES:
+            raise ValueError(f"알 수 없는 성능 프로파일: {profile}")
+        # 날짜 저장 방식. None 이면 DB 에 기록된 방식을 따른다 (create_tables 참고)
+        self.datetime_mode = datetime_mode
+        self.dt_codec = DatetimeCodec(datetime_mode or "iso")
         self.db_path = db_path
-        self.connection: Optional[sqlite3.Connection] = None
+        self.profile = profile
+        self.pool = ConnectionPool(self._open_connection, pool_size, idle_timeout)
+        # 풀이 가득 찼을 때 기다리는 최대 시간. 넘으면 PoolTimeoutError (None = 무한 대기)
+        self.pool_timeout = pool_timeout
+        self.write_queue: Optional[WriteQueue] = None
+        self.profiler: Optional[QueryProfiler] = None
+        # DAO 인스턴스들이 공유하는 프로세스 내 캐시 (이름별)
+        self._caches: Dict[str, Any] = {}
+        self._caches_lock = threading.Lock()
+        # 스레드별 상태 (transaction() 중첩 깊이 등)
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """호출 스레드에 할당된 커넥션"""
+        return self.pool.current()
+
+    @property
+    def _tx_depth(self) -> int:
+        # transaction() 중첩 깊이. 0 이면 execute_query 가 문장마다 커밋한다.
+        return getattr(self._local, "tx_depth", 0)
+
+    @_tx_depth.setter
+    def _tx_depth(self, value: int):
+        self._local.tx_depth = value
+
+    def _open_connection(self) -> sqlite3.Connection:
+        if self.db_path == ":memory:":
+            # 풀의 모든 커넥션이 같은 메모리 DB 를 보도록 공유 캐시 URI 사용
+            conn = sqlite3.connect(
+                f"file:hangi_mem_{id(self)}?mode=memory&cache=shared",
+                uri=True,
+                check_same_thread=False,
+            )
+        else:
+            # 스레드 간 재사용은 풀이 한 번에 한 스레드만 쓰도록 보장한다
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        self._apply_profile(conn)
+        return conn
 
     def connect(self):
-        if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row
-        return self.connection
+        return self.pool.checkout(self.pool_timeout)
+
+    def _release_if_idle(self):
+        # 트랜잭션 밖이면 문장 하나가 끝날 때마다 커넥션을 풀에 돌려준다
+        if self._tx_depth == 0:
+            self.pool.checkin()
+
+    def release(self):
+        """작업 스레드가 DB 작업을 마치면 커넥션을 풀에 돌려준다"""
+        if self._tx_depth > 0:
+            raise RuntimeError("트랜잭션 진행 중에는 커넥션을 반납할 수 없습니다.")
+        self.pool.checkin()
+
+    def _apply_profile(self, conn: sqlite3.Connection):
+        if self.profile is None:
+            return
+        for name, value in PERFORMANCE_PROFILES[self.profile].items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
+    def get_pragmas(self) -> dict:
+        """현재 연결에 실제로 적용된 PRAGMA 값 조회"""
+        conn = self.connect()
+        try:
+            return {
+                name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+                for name in PRAGMA_NAMES
+            }
+        finally:
+            self._release_if_idle()
 
     def disconnect(self):
-        if self.connection is not None:
-            self.connection.close()
-            self.connection = None
+        """모든 스레드의 커넥션을 닫는다"""
+        self.disable_write_queue()
+        self.pool.close_all()
+
+    def cache(self, name: str, factory: Callable[[], Any]) -> Any:
+        """name 으로 공유 캐시를 얻는다 (처음이면 factory() 로 생성).
+        같은 DB 를 쓰는 여러 DAO 인스턴스가 같은 캐시를 보고 같이 무효화하기 위함."""
+        with self._caches_lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                cache = self._caches[name] = factory()
+            return cache
+
+    # ---------- 쓰기 큐 ----------
+    def enable_write_queue(self, max_batch: int = 256) -> WriteQueue:
+        """이후 트랜잭션 밖의 쓰기 문장은 모두 전용 쓰기 스레드를 거친다"""
+        if self.write_queue is None:
+            self.write_queue = WriteQueue(self, max_batch)
+            self.write_queue.start()
+        return self.write_queue
 
+    def disable_write_queue(self):
+        if self.write_queue is not None:
+            self.write_queue.stop()
+            self.write_queue = None
+
+    def submit_write(self, query: str, params=None, many: bool = False) -> Future:
+        """쓰기 큐에 작업을 넣고 Future 를 반환 (결과는 WriteResult)"""
+        if self.write_queue is None:
+            raise RuntimeError("enable_write_queue() 를 먼저 호출하세요.")
+        return self.write_queue.submit(query, params, many)
+
+    def run_write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """여러 문장으로 된 쓰기 fn(conn) 을 한 단위로 실행하고 반환값을 돌려준다.
+        쓰기 큐가 켜져 있으면 쓰기 스레드의 작업 하나로, 아니면 IMMEDIATE 트랜잭션으로
+        (이미 트랜잭션 안이면 그 안의 SAVEPOINT 로) 실행한다."""
+        wq = self.write_queue
+        if wq is not None and self._tx_depth == 0 and not wq.is_writer_thread():
+            return wq.submit_call(fn).result()
+        with self.transaction(immediate=True) as conn:
+            return fn(conn)
+
+    def _use_write_queue(self, query: str) -> bool:
+        # 명시적 트랜잭션 안의 쓰기는 그 트랜잭션의 커넥션에서 직접 실행한다
+        wq = self.write_queue
+        return (
+            wq is not None
+            and self._tx_depth == 0
+            and not wq.is_writer_thread()
+            and is_write_query(query)
+        )
+
+    # ---------- 프로파일링 ----------
+    def enable_profiling(
+        self,
+        slow_threshold_ms: float = 50.0,
+        slow_log_path: Optional[str] = None,
+        explain_slow: bool = True,
+    ) -> QueryProfiler:
+        """execute_query / execute_many 의 문장별 통계 수집을 켠다"""
+        self.profiler = QueryProfiler(slow_threshold_ms, slow_log_path, explain_slow)
+        return self.profiler
+
+    def disable_profiling(self) -> Optional[QueryProfiler]:
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def explain(self, query: str, params=None) -> List[str]:
+        """EXPLAIN QUERY PLAN 결과의 detail 열 목록"""
+        conn = self.connect()
+        sql = "EXPLAIN QUERY PLAN " + query
+        try:
+            rows = conn.execute(sql) if params is None else conn.execute(sql, params)
+            return [r[3] for r in rows]
+        finally:
+            self._release_if_idle()
+
+    def _profiled(self, run: Callable[[], Any], query: str, params):
+        profiler = self.profiler
+        start = time.perf_counter()
+        cur = run()
+        if cur.description is not None:
+            cur = BufferedCursor(cur)
+            rows = len(cur)
+        else:
+            rows = max(cur.rowcount, 0)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        profiler.record(query, params, elapsed_ms, rows, self.explain)
+        return cur
+
+    # ---------- 실행 ----------
     def execute_query(self, query: str, params: tuple = None):
+        if self.profiler is not None:
+            return self._profiled(
+                lambda: self._execute(query, params), query, params
+            )
+        return self._execute(query, params)
+
+    def execute_many(self, query: str, seq_of_params) -> sqlite3.Cursor:
+        """같은 문장을 여러 파라미터로 실행하고 한 번만 커밋"""
+        if self.profiler is not None:
+            # 첫 파라미터 행을 대표로 넘겨 EXPLAIN QUERY PLAN 이 바인딩할 수 있게 한다
+            if not isinstance(seq_of_params, (list, tuple)):
+                seq_of_params = list(seq_of_params)
+            first = seq_of_params[0] if seq_of_params else None
+            return self._profiled(
+                lambda: self._execute_many(query, seq_of_params), query, first
+            )
+        return self._execute_many(query, seq_of_params)
+
+    def _execute(self, query: str, params: tuple = None):
+        if self._use_write_queue(query):
+            return self.submit_write(query, params).result()
         conn = self.connect()
         cur = conn.cursor()
-        if params is None:
-            cur.execute(query)
+        if self._tx_depth > 0:
+            if params is None:
+                cur.execute(query)
+            else:
+                cur.execute(query, params)
+            return cur
+        try:
+            if params is None:
+                cur.execute(query)
+            else:
+                cur.execute(query, params)
+            conn.commit()
+            # 커넥션을 반납하므로 결과는 미리 읽어 둔다
+            return BufferedCursor(cur)
+        except BaseException:
+            # 암묵적 BEGIN 으로 열린 쓰기 트랜잭션을 남기지 않는다
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._release_if_idle()
+
+    def _execute_many(self, query: str, seq_of_params):
+        if self._use_write_queue(query):
+            return self.submit_write(query, list(seq_of_params), many=True).result()
+        conn = self.connect()
+        cur = conn.cursor()
+        if self._tx_depth > 0:
+            cur.executemany(query, seq_of_params)
+            return cur
+        try:
+            cur.executemany(query, seq_of_params)
+            conn.commit()
+            return BufferedCursor(cur)
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._release_if_idle()
+
+    # ---------- 트랜잭션 ----------
+    def in_transaction(self) -> bool:
+        return self._tx_depth > 0
+
+    def on_rollback(self, callback: Callable[[], None]):
+        """현재 트랜잭션(또는 그 안의 SAVEPOINT)이 롤백되면 callback 실행.
+        캐시처럼 DB 밖에 있는 상태를 되돌릴 때 쓴다. 트랜잭션 밖이면 무시."""
+        if self._tx_depth > 0:
+            self._rollback_hooks.append(callback)
+
+    def on_commit(self, callback: Callable[[], None]):
+        """가장 바깥 트랜잭션이 커밋된 뒤 callback 실행 (롤백되면 버림).
+        트랜잭션 밖이면 문장마다 이미 커밋되므로 바로 실행한다."""
+        if self._tx_depth > 0:
+            self._commit_hooks.append(callback)
         else:
-            cur.execute(query, params)
-        conn.commit()
-        return cur
+            callback()
+
+    @property
+    def _rollback_hooks(self) -> List[Callable[[], None]]:
+        hooks = getattr(self._local, "rollback_hooks", None)
+        if hooks is None:
+            hooks = self._local.rollback_hooks = []
+        return hooks
+
+    @property
+    def _commit_hooks(self) -> List[Callable[[], None]]:
+        hooks = getattr(self._local, "commit_hooks", None)
+        if hooks is None:
+            hooks = self._local.commit_hooks = []
+        return hooks
+
+    def _run_rollback_hooks(self, start: int):
+        hooks = self._rollback_hooks
+        pending = hooks[start:]
+        del hooks[start:]
+        for hook in pending:
+            hook()
+
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """with 블록 안의 모든 쿼리를 하나의 커밋으로 묶는다 (unit of work).
+
+        - 가장 바깥 범위: BEGIN ... COMMIT. 예외가 나면 전체 ROLLBACK.
+        - 중첩 범위: SAVEPOINT. 예외가 나면 그 범위만 되돌리고 예외를 다시 던진다.
+          바깥 범위가 예외를 잡으면 나머지 작업은 그대로 커밋된다.
+        - 블록 안에서 호출된 DAO/Manager 의 execute_query 는 커밋하지 않고 참여만 한다.
+        - immediate=True 이면 시작 시점에 쓰기 락을 잡는다 (BEGIN IMMEDIATE).
+          읽은 뒤 쓰는 단위는 반드시 immediate=True 로 연다. WAL 에서 deferred
+          트랜잭션은 읽은 뒤 다른 커넥션이 커밋하면 쓰기로 올라갈 때 곧바로
+          SQLITE_BUSY 로 실패한다 (스냅샷이 낡아 busy timeout 으로 재시도되지 않음).
+        - on_commit 으로 등록한 함수는 가장 바깥 COMMIT 이 끝난 뒤 실행된다.
+        """
+        conn = self.connect()
+        depth = self._tx_depth
+        savepoint = f"sp_{depth}"
+        if depth == 0:
+            try:
+                if conn.in_transaction:
+                    # 트랜잭션 밖의 문장은 바로 커밋/롤백되므로 열려 있으면 버그다
+                    conn.rollback()
+                    raise RuntimeError("닫히지 않은 암묵적 트랜잭션이 남아 있습니다.")
+                conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            except BaseException:
+                self._release_if_idle()
+                raise
+        else:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        self._tx_depth = depth + 1
+        hooks_start = len(self._rollback_hooks)
+        commit_hooks_start = len(self._commit_hooks)
+        try:
+            yield conn
+        except BaseException:
+            self._tx_depth = depth
+            if depth == 0:
+                conn.rollback()
+                self._release_if_idle()
+            else:
+                conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            del self._commit_hooks[commit_hooks_start:]
+            self._run_rollback_hooks(hooks_start)
+            raise
+        self._tx_depth = depth
+        if depth == 0:
+            try:
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                self._release_if_idle()
+                del self._commit_hooks[:]
+                self._run_rollback_hooks(hooks_start)
+                raise
+            self._release_if_idle()
+            del self._rollback_hooks[:]
+            committed = self._commit_hooks[:]
+            del self._commit_hooks[:]
+            for hook in committed:
+                hook()
+        else:
+            conn.execute(f"RELEASE SAVEPOINT {savepoint}")
 
     def create_tables(self):
         """필요한 테이블 전부 생성"""
@@ -68,8 +1160,8 @@ class DatabaseManager:
                 work_hours      TEXT,
                 salary          INTEGER,
                 requirements    TEXT,
-                deadline        TEXT,
-                created_at      TEXT,
+                deadline        TIMESTAMP,
+                created_at      TIMESTAMP,
                 department      TEXT,
                 max_applicants  INTEGER
             )
@@ -85,8 +1177,8 @@ class DatabaseManager:
                 title       TEXT,
                 content     TEXT,
                 is_default  INTEGER DEFAULT 0,
-                created_at  TEXT,
-                updated_at  TEXT
+                created_at  TIMESTAMP,
+                updated_at  TIMESTAMP
             )
             """
         )
@@ -100,7 +1192,7 @@ class DatabaseManager:
                 job_id          INTEGER NOT NULL,
                 resume_id       INTEGER,
                 status          TEXT,
-                submitted_at    TEXT
+                submitted_at    TIMESTAMP
             )
             """
         )
@@ -113,7 +1205,7 @@ class DatabaseManager:
                 user_id         INTEGER NOT NULL,
                 semester        TEXT,
                 schedule_data   TEXT,
-                created_at      TEXT
+                created_at      TIMESTAMP
             )
             """
         )
@@ -125,7 +1217,7 @@ class DatabaseManager:
                 bookmark_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id     INTEGER NOT NULL,
                 job_id      INTEGER NOT NULL,
-                created_at  TEXT
+                created_at  TIMESTAMP
             )
             """
         )
@@ -137,7 +1229,7 @@ class DatabaseManager:
                 history_id  INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id     INTEGER NOT NULL,
                 job_id      INTEGER NOT NULL,
-                viewed_at   TEXT
+                viewed_at   TIMESTAMP
             )
             """
         )
@@ -164,10 +1256,79 @@ class DatabaseManager:
                 content     TEXT,
                 answer      TEXT,
                 status      TEXT,
-                created_at  TEXT,
-                answered_at TEXT
+                created_at  TIMESTAMP,
+                answered_at TIMESTAMP
             )
             """
         )
 
         conn.commit()
+        self._release_if_idle()
+
+        self.migrate()
+        self.load_datetime_mode()
+
+    # ---------- 마이그레이션 ----------
+    def get_schema_version(self) -> int:
+        conn = self.connect()
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            self._release_if_idle()
+
+    def migrate(self, target: Optional[int] = None) -> int:
+        """저장된 user_version 보다 새로운 마이그레이션만 순서대로 적용"""
+        current = self.get_schema_version()
+        latest = MIGRATIONS[-1][0] if MIGRATIONS else 0
+        if target is None:
+            target = latest
+        if current >= target:
+            return current
+
+        for version, _desc, steps in MIGRATIONS:
+            if version <= current or version > target:
+                continue
+            # 버전 하나 = 트랜잭션 하나. 실패하면 해당 버전 전체가 롤백된다.
+            with self.transaction() as conn:
+                cur = conn.cursor()
+                for step in steps:
+                    if callable(step):
+                        step(cur)
+                    else:
+                        cur.execute(step)
+                cur.execute(f"PRAGMA user_version = {int(version)}")
+            current = version
+        return current
+
+    # ---------- 날짜 저장 방식 ----------
+    def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self.execute_query(
+            "SELECT value FROM settings WHERE key = ?", (key,)
+        ).fetchone()
+        return default if row is None else row[0]
+
+    def load_datetime_mode(self) -> DatetimeCodec:
+        """DB 에 기록된 날짜 저장 방식으로 dt_codec 을 맞춘다.
+        생성자에서 다른 방식을 지정했으면 기존 값을 그 방식으로 변환한다."""
+        stored = self.get_setting("datetime_mode", "iso")
+        if self.datetime_mode is not None and self.datetime_mode != stored:
+            self.set_datetime_mode(self.datetime_mode)
+        else:
+            self.dt_codec = DatetimeCodec(stored)
+        return self.dt_codec
+
+    def set_datetime_mode(self, mode: str) -> int:
+        """날짜 저장 방식을 바꾸고 모든 날짜 컬럼을 변환한다 (한 트랜잭션).
+        바뀐 행 수를 돌려준다. DAO 들이 dt_codec 을 공유하므로 바로 새 방식으로 읽고 쓴다."""
+        codec = DatetimeCodec(mode)
+        with self.transaction(immediate=True) as conn:
+            cur = conn.cursor()
+            changed = convert_datetime_columns(cur, codec)
+            cur.execute(
+                "INSERT INTO settings (key, value) VALUES ('datetime_mode', ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (mode,),
+            )
+        self.dt_codec = codec
+        self.datetime_mode = mode
+        return changed
@@ -0,0 +1,92 @@
+# datetime_codec.py
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Union
+
+
+# 저장 방식
+#   iso   : "2025-03-01T09:00:00" 문자열 (기본값, 사람이 읽기 쉬움)
+#   epoch : 1970-01-01 00:00 부터의 마이크로초 정수. ORDER BY / 범위 조건이 정수 비교가 된다.
+# 앱 전체가 naive 로컬 시각을 쓰므로 epoch 도 시간대 없이 계산한다.
+DATETIME_MODES = ("iso", "epoch")
+
+EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_MICROS_PER_DAY = 86_400_000_000
+_JULIAN_EPOCH = 2440587.5  # 1970-01-01 00:00 의 율리우스일
+
+# 날짜/시각 컬럼 목록 (저장 방식 전환 시 변환 대상)
+DATETIME_COLUMNS = {
+    "jobs": ("deadline", "created_at"),
+    "applications": ("submitted_at",),
+    "application_events": ("ts",),
+    "resumes": ("created_at", "updated_at"),
+    "timetables": ("created_at",),
+    "bookmarks": ("created_at",),
+    "view_history": ("viewed_at",),
+    "view_history_daily": ("last_viewed_at",),
+    "inquiries": ("created_at", "answered_at"),
+}
+
+
+@lru_cache(maxsize=8192)
+def decode_datetime(value: Union[str, int, None]) -> Optional[datetime]:
+    """DB 값(ISO 문자열 또는 epoch 마이크로초) → datetime.
+
+    비어 있거나 형식이 틀리면 None. 같은 시각 문자열이 반복되는 경우가 많아
+    (일괄 등록/시드 데이터) 결과를 메모이즈한다. datetime 은 불변이므로 공유해도 안전하다.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, int):
+        return EPOCH + timedelta(0, 0, value)
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class DatetimeCodec:
+    """DAO 공통 날짜 변환기. DatabaseManager.dt_codec 으로 공유한다."""
+
+    __slots__ = ("mode",)
+
+    decode = staticmethod(decode_datetime)
+
+    def __init__(self, mode: str = "iso"):
+        if mode not in DATETIME_MODES:
+            raise ValueError(f"알 수 없는 날짜 저장 방식: {mode}")
+        self.mode = mode
+
+    def encode(self, value) -> Union[str, int, None]:
+        """datetime → 저장 값. datetime 이 아니면 None"""
+        if not isinstance(value, datetime):
+            return None
+        if self.mode == "iso":
+            return value.isoformat()
+        if value.tzinfo is not None:
+            value = value.astimezone().replace(tzinfo=None)
+        return (value - EPOCH) // _MICROSECOND
+
+    def adapt(self, value):
+        """UPDATE 용 값 변환: datetime 이면 encode, 아니면 그대로"""
+        return self.encode(value) if isinstance(value, datetime) else value
+
+    def now(self) -> Union[str, int]:
+        return self.encode(datetime.now())
+
+    # ---------- SQL 조각 ----------
+    def day_sql(self, column: str) -> str:
+        """컬럼 값의 날짜("YYYY-MM-DD") 식"""
+        if self.mode == "iso":
+            return f"substr({column}, 1, 10)"
+        return f"date({column} / 1000000, 'unixepoch')"
+
+    def julianday_sql(self, column: str) -> str:
+        """컬럼 값의 율리우스일 식 (julianday('now', 'localtime') 과 비교 가능)"""
+        if self.mode == "iso":
+            return f"julianday({column})"
+        return f"({column} / {_MICROS_PER_DAY}.0 + {_JULIAN_EPOCH})"
+
+    def __repr__(self) -> str:
+        return f"DatetimeCodec({self.mode!r})"
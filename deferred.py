@@ -0,0 +1,58 @@
+# deferred.py
+from typing import Any, Iterable
+
+
+class _NotLoaded:
+    """아직 DB 에서 읽지 않은 지연 컬럼 값 표식"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<not loaded>"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+NOT_LOADED = _NotLoaded()
+
+
+class Deferred:
+    """큰 텍스트 컬럼용 지연 로딩 디스크립터.
+
+    값은 "_<이름>" 슬롯에 저장한다. 값이 NOT_LOADED 인 상태로 처음 읽히면
+    객체의 _deferred_loader(obj) 를 불러 그 객체의 지연 컬럼을 한 번에 채운 뒤
+    값을 돌려준다. loader 가 없으면(직접 만든 객체 등) None 을 돌려준다.
+    """
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, obj, objtype=None) -> Any:
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if value is NOT_LOADED:
+            loader = obj._deferred_loader
+            if loader is None:
+                return None
+            loader(obj)
+            value = getattr(obj, self.slot)
+            if value is NOT_LOADED:  # 그 사이 행이 지워진 경우
+                value = None
+                setattr(obj, self.slot, None)
+        return value
+
+    def __set__(self, obj, value: Any):
+        setattr(obj, self.slot, value)
+
+
+def is_loaded(obj, name: str) -> bool:
+    return getattr(obj, "_" + name) is not NOT_LOADED
+
+
+def pending(objs: Iterable, names: Iterable[str]) -> list:
+    """names 중 하나라도 아직 안 읽은 객체 목록"""
+    names = list(names)
+    return [o for o in objs if any(not is_loaded(o, n) for n in names)]
@@ -3,10 +3,23 @@ from datetime import datetime, date
 from typing import Optional, List, Dict
 import json
 
+from deferred import Deferred
+
 
 class User:
     """사용자 엔티티"""
 
+    __slots__ = (
+        "user_id",
+        "username",
+        "password",
+        "email",
+        "phone",
+        "student_id",
+        "department",
+        "role",
+    )
+
     def __init__(
         self,
         user_id: int = None,
@@ -48,6 +61,27 @@ class User:
 class Job:
     """근로장학 공고 엔티티"""
 
+    __slots__ = (
+        "job_id",
+        "title",
+        "_description",
+        "category",
+        "location",
+        "job_type",
+        "work_hours",
+        "salary",
+        "_requirements",
+        "deadline",
+        "created_at",
+        "department",
+        "max_applicants",
+        "_deferred_loader",
+    )
+
+    # 수 KB 가 될 수 있는 본문은 처음 읽을 때 가져온다 (JobDAO 가 loader 를 붙인다)
+    description = Deferred()
+    requirements = Deferred()
+
     def __init__(
         self,
         job_id: int = None,
@@ -64,6 +98,7 @@ class Job:
         department: str = None,
         max_applicants: int = None,
     ):
+        self._deferred_loader = None
         self.job_id = job_id
         self.title = title
         self.description = description
@@ -115,6 +150,16 @@ class Job:
 class Application:
     """지원서 엔티티"""
 
+    __slots__ = (
+        "application_id",
+        "user_id",
+        "job_id",
+        "resume_id",
+        "status",
+        "submitted_at",
+        "events",
+    )
+
     def __init__(
         self,
         application_id: int = None,
@@ -130,6 +175,8 @@ class Application:
         self.resume_id = resume_id
         self.status = status
         self.submitted_at = submitted_at
+        # application_events 에서 읽어 온 상태 변경 이력 (ApplicationDAO.load_events)
+        self.events: Optional[List["ApplicationEvent"]] = None
 
     def get_status(self) -> str:
         return self.status
@@ -138,21 +185,57 @@ class Application:
         self.status = status
 
     def get_timeline(self) -> List[Dict]:
+        """저장된 상태 변경 이력. 이력을 읽어 오지 않았으면 제출 시점만 알 수 있다."""
+        if self.events is not None:
+            return [
+                {
+                    "status": e.status,
+                    "timestamp": e.ts.isoformat() if e.ts else None,
+                }
+                for e in self.events
+            ]
         timeline = []
         if self.submitted_at:
             timeline.append(
                 {"status": "제출", "timestamp": self.submitted_at.isoformat()}
             )
-        if self.status != "제출":
-            timeline.append(
-                {"status": self.status, "timestamp": datetime.now().isoformat()}
-            )
         return timeline
 
 
+class ApplicationEvent:
+    """지원서 상태 변경 이력 한 건 (application_events, 추가만 한다)"""
+
+    __slots__ = ("event_id", "application_id", "status", "ts")
+
+    def __init__(
+        self,
+        event_id: int = None,
+        application_id: int = None,
+        status: str = None,
+        ts: Optional[datetime] = None,
+    ):
+        self.event_id = event_id
+        self.application_id = application_id
+        self.status = status
+        self.ts = ts
+
+
 class Resume:
     """이력서 엔티티"""
 
+    __slots__ = (
+        "resume_id",
+        "user_id",
+        "title",
+        "_content",
+        "is_default",
+        "created_at",
+        "updated_at",
+        "_deferred_loader",
+    )
+
+    content = Deferred()
+
     def __init__(
         self,
         resume_id: int = None,
@@ -163,6 +246,7 @@ class Resume:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
     ):
+        self._deferred_loader = None
         self.resume_id = resume_id
         self.user_id = user_id
         self.title = title
@@ -195,6 +279,8 @@ class Resume:
 class Timetable:
     """시간표 엔티티"""
 
+    __slots__ = ("timetable_id", "user_id", "semester", "schedule_data", "created_at")
+
     def __init__(
         self,
         timetable_id: int = None,
@@ -246,6 +332,8 @@ class Timetable:
 
 
 class Bookmark:
+    __slots__ = ("bookmark_id", "user_id", "job_id", "created_at")
+
     def __init__(
         self,
         bookmark_id: int = None,
@@ -260,6 +348,8 @@ class Bookmark:
 
 
 class ViewHistory:
+    __slots__ = ("history_id", "user_id", "job_id", "viewed_at")
+
     def __init__(
         self,
         history_id: int = None,
@@ -274,6 +364,8 @@ class ViewHistory:
 
 
 class FAQ:
+    __slots__ = ("faq_id", "category", "question", "answer")
+
     def __init__(
         self,
         faq_id: int = None,
@@ -288,6 +380,20 @@ class FAQ:
 
 
 class Inquiry:
+    __slots__ = (
+        "inquiry_id",
+        "user_id",
+        "title",
+        "_content",
+        "answer",
+        "status",
+        "created_at",
+        "answered_at",
+        "_deferred_loader",
+    )
+
+    content = Deferred()
+
     def __init__(
         self,
         inquiry_id: int = None,
@@ -299,6 +405,7 @@ class Inquiry:
         created_at: Optional[datetime] = None,
         answered_at: Optional[datetime] = None,
     ):
+        self._deferred_loader = None
         self.inquiry_id = inquiry_id
         self.user_id = user_id
         self.title = title
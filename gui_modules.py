@@ -1,8 +1,8 @@
 # gui_modules.py
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
-from typing import List
 
+from dao import APPLY_DUPLICATE, APPLY_FULL, APPLY_OK
 from entities import Job, User
 from managers import (
     UserManager,
@@ -145,8 +145,12 @@ class MainWindow:
         self.faq_manager = faq_manager
         self.inquiry_manager = inquiry_manager
 
-        self.jobs: List[Job] = []
+        # 목록에 보이는 행 (Job 또는 job_id/title 만 있는 "list" projection)
+        self.jobs: list = []
         self.current_filter = "전체"
+        # 목록 페이지네이션 상태 (검색 결과는 한 번에 표시하므로 None)
+        self.next_page_token = None
+        self.page_filters = {}
 
         self.search_var = tk.StringVar()
 
@@ -241,6 +245,7 @@ class MainWindow:
         tab_frame.pack(fill="x", padx=20, pady=10)
 
         self.tab_buttons = {}
+        self.tab_names = {}
         for i, (name, key) in enumerate(
             [("장소별", "장소별"), ("장기", "장기"), ("단기", "단기"), ("일일", "일일")]
         ):
@@ -254,6 +259,7 @@ class MainWindow:
             )
             btn.grid(row=0, column=i, padx=5)
             self.tab_buttons[key] = btn
+            self.tab_names[key] = name
 
         self._update_tab_style()
 
@@ -323,6 +329,14 @@ class MainWindow:
             width=15,
             command=self.on_apply_click,
         ).pack(side="left", padx=5)
+        self.more_button = tk.Button(
+            btn_frame,
+            text="더 보기",
+            width=10,
+            state="disabled",
+            command=self.on_more_click,
+        )
+        self.more_button.pack(side="right", padx=5)
 
         # 하단 탭바
         bottom = tk.Frame(self.main_frame, bg="#F5F5F7", height=50)
@@ -376,38 +390,76 @@ class MainWindow:
             else:
                 btn.config(bg="white", fg="black")
 
+    def _refresh_tab_counts(self):
+        counts = self.job_manager.facet_counts("category")
+        for key, btn in self.tab_buttons.items():
+            if key in ("장소별", "전체"):
+                continue
+            btn.config(text=f"{self.tab_names[key]} ({counts.get(key, 0)})")
+
     def apply_filter(self):
         if self.current_filter in ("장소별", "전체"):
             self.load_jobs()
             return
 
-        all_jobs = self.job_manager.get_all_jobs()
-        self.jobs = [
-            j for j in all_jobs if (j.category or "") == self.current_filter
-        ]
-        self.refresh_job_listbox()
+        self._load_first_page(category=self.current_filter)
 
     # ---------- 데이터 ----------
+    PAGE_SIZE = 50
+
     def load_jobs(self):
-        self.jobs = self.job_manager.get_all_jobs()
+        self._refresh_tab_counts()
+        self._load_first_page()
+
+    def _load_first_page(self, **filters):
+        self.page_filters = filters
+        # 목록에는 번호와 제목만 쓰므로 "list" projection 으로 읽고,
+        # 전체 Job 은 선택했을 때(on_job_select) 가져온다
+        page = self.job_manager.get_jobs_page(
+            self.PAGE_SIZE, projection="list", **filters
+        )
+        self.jobs = list(page.items)
+        self.next_page_token = page.next_token
         self.refresh_job_listbox()
 
-    def refresh_job_listbox(self):
-        self.job_listbox.delete(0, tk.END)
-        for job in self.jobs:
+    def on_more_click(self):
+        if not self.next_page_token:
+            return
+        page = self.job_manager.get_jobs_page(
+            self.PAGE_SIZE, after=self.next_page_token, projection="list",
+            **self.page_filters
+        )
+        self.jobs.extend(page.items)
+        self.next_page_token = page.next_token
+        self._insert_job_rows(page.items)
+        self._update_more_button()
+
+    def _insert_job_rows(self, jobs: list):
+        for job in jobs:
             title = job.title or "(제목 없음)"
             self.job_listbox.insert(tk.END, f"[{job.job_id}] {title}")
+
+    def _update_more_button(self):
+        self.more_button.config(
+            state="normal" if self.next_page_token else "disabled"
+        )
+
+    def refresh_job_listbox(self):
+        self.job_listbox.delete(0, tk.END)
+        self._insert_job_rows(self.jobs)
+        self._update_more_button()
         self.detail_title.config(text="공고를 선택하면 상세 정보가 표시됩니다.")
         self.detail_body.config(text="")
 
     def get_selected_job(self) -> Job:
+        """선택한 행의 전체 Job (목록 행은 projection 이므로 여기서 읽는다)"""
         sel = self.job_listbox.curselection()
         if not sel:
             return None
         idx = sel[0]
         if idx < 0 or idx >= len(self.jobs):
             return None
-        return self.jobs[idx]
+        return self.job_manager.get_job(self.jobs[idx].job_id)
 
     # ---------- 이벤트 ----------
     def on_job_select(self, event=None):
@@ -461,6 +513,7 @@ class MainWindow:
             self.load_jobs()
             return
         self.jobs = self.job_manager.search_jobs(keyword)
+        self.next_page_token = None
         self.refresh_job_listbox()
 
     # ---------- 공고 등록 ----------
@@ -636,14 +689,18 @@ class MainWindow:
             )
             return
 
-        app = self.application_manager.apply_to_job(
+        result, app = self.application_manager.submit_application(
             self.current_user.user_id, job.job_id, resume.resume_id
         )
-        if app:
+        if result == APPLY_OK:
             messagebox.showinfo(
                 "지원 완료",
                 f"[{job.job_id}] {job.title} 공고에 통합 이력서로 지원했습니다.",
             )
+        elif result == APPLY_DUPLICATE:
+            messagebox.showwarning("중복 지원", "이미 지원한 공고입니다.")
+        elif result == APPLY_FULL:
+            messagebox.showwarning("모집 마감", "모집 인원이 모두 찼습니다.")
         else:
             messagebox.showerror("지원 실패", "지원 중 오류가 발생했습니다.")
 
@@ -752,6 +809,15 @@ class MyPageWindow:
             width=12,
             command=self.show_history_tab,
         ).pack(side="left", padx=5)
+        tk.Button(
+            tab_frame,
+            text="문의 내역",
+            relief="solid",
+            bd=1,
+            bg="white",
+            width=12,
+            command=self.show_inquiry_tab,
+        ).pack(side="left", padx=5)
 
         # 서브탭 (디자인용)
         sub_frame = tk.Frame(self.win, bg="white")
@@ -867,13 +933,45 @@ class MyPageWindow:
             row=2, column=0, columnspan=2, pady=10
         )
 
+    # 지원 현황/문의 내역은 첫 페이지만 읽고 나머지는 "더 보기" 로 이어 붙인다
+    PAGE_SIZE = 20
+
+    def _show_paged_list(self, card, fetch_page, render, empty_text: str):
+        """fetch_page(after) 가 돌려준 Page 를 render(items) 의 줄들로 목록에 채운다"""
+        page = fetch_page(None)
+        if not page.items:
+            tk.Label(
+                card,
+                text=empty_text,
+                bg="#F7F3EF",
+                fg="#444",
+            ).pack(pady=40)
+            return
+
+        listbox = tk.Listbox(card, width=70)
+        listbox.pack(padx=20, pady=10, fill="both", expand=True)
+        more_button = tk.Button(card, text="더 보기", width=10)
+        more_button.pack(pady=(0, 10))
+        next_token = [None]
+
+        def show(page):
+            for line in render(page.items):
+                listbox.insert(tk.END, line)
+            next_token[0] = page.next_token
+            more_button.config(state="normal" if page.next_token else "disabled")
+
+        def on_more():
+            if next_token[0]:
+                show(fetch_page(next_token[0]))
+
+        more_button.config(command=on_more)
+        show(page)
+
     def show_application_tab(self):
         self._clear_content()
         card = tk.Frame(self.content_frame, bg="#F7F3EF")
         card.pack(fill="both", expand=True)
 
-        apps = self.application_manager.get_applications_by_user(self.user.user_id)
-
         tk.Label(
             card,
             text="지원 현황",
@@ -881,23 +979,32 @@ class MyPageWindow:
             font=("맑은 고딕", 12, "bold"),
         ).pack(pady=10)
 
-        if not apps:
-            tk.Label(
-                card,
-                text="아직 지원한 공고가 없습니다.",
-                bg="#F7F3EF",
-                fg="#444",
-            ).pack(pady=40)
-            return
-
-        listbox = tk.Listbox(card, width=70)
-        listbox.pack(padx=20, pady=10, fill="both", expand=True)
-
-        for a in apps:
-            ts = a.submitted_at.strftime("%Y-%m-%d %H:%M") if a.submitted_at else "-"
-            listbox.insert(
-                tk.END, f"ID {a.application_id} | 공고 {a.job_id} | 상태 {a.status} | {ts}"
+        def fetch_page(after):
+            page = self.application_manager.get_applications_page(
+                self.user.user_id, self.PAGE_SIZE, after=after
             )
+            # 상태 변경 이력은 이 페이지의 지원서에 대해서만 한 번에 읽는다
+            self.application_manager.load_events(page.items)
+            return page
+
+        def render(apps):
+            # 공고 제목은 페이지의 지원 목록 전체에 대해 한 번의 쿼리로 가져온다
+            loader = self.application_manager.job_loader()
+            job_handles = [loader.load(a.job_id) for a in apps]
+            for a, handle in zip(apps, job_handles):
+                ts = a.submitted_at.strftime("%Y-%m-%d %H:%M") if a.submitted_at else "-"
+                job = handle.get()
+                job_title = job.title if job else "(삭제된 공고)"
+                yield f"ID {a.application_id} | [{a.job_id}] {job_title} | 상태 {a.status} | {ts}"
+                # 상태 변경 이력 (제출 외의 변경이 있을 때만)
+                if len(a.events or []) > 1:
+                    history = " → ".join(
+                        f"{e.status} {e.ts.strftime('%m-%d %H:%M') if e.ts else '-'}"
+                        for e in a.events
+                    )
+                    yield f"    {history}"
+
+        self._show_paged_list(card, fetch_page, render, "아직 지원한 공고가 없습니다.")
 
     def show_bookmark_tab(self):
         self._clear_content()
@@ -911,7 +1018,9 @@ class MyPageWindow:
             font=("맑은 고딕", 12, "bold"),
         ).pack(pady=10)
 
-        jobs = self.bookmark_manager.get_bookmarked_jobs(self.user.user_id)
+        jobs = self.bookmark_manager.get_bookmarked_jobs(
+            self.user.user_id, projection="list"
+        )
         if not jobs:
             tk.Label(
                 card,
@@ -938,7 +1047,9 @@ class MyPageWindow:
             font=("맑은 고딕", 12, "bold"),
         ).pack(pady=10)
 
-        jobs = self.view_history_manager.get_recent_jobs(self.user.user_id, limit=10)
+        jobs = self.view_history_manager.get_recent_jobs(
+            self.user.user_id, limit=10, projection="list"
+        )
         if not jobs:
             tk.Label(
                 card,
@@ -953,6 +1064,29 @@ class MyPageWindow:
         for j in jobs:
             listbox.insert(tk.END, f"[{j.job_id}] {j.title}")
 
+    def show_inquiry_tab(self):
+        self._clear_content()
+        card = tk.Frame(self.content_frame, bg="#F7F3EF")
+        card.pack(fill="both", expand=True)
+
+        tk.Label(
+            card,
+            text="문의 내역",
+            bg="#F7F3EF",
+            font=("맑은 고딕", 12, "bold"),
+        ).pack(pady=10)
+
+        def fetch_page(after):
+            return self.inquiry_manager.get_user_inquiries_page(
+                self.user.user_id, self.PAGE_SIZE, after=after
+            )
+
+        def render(inquiries):
+            for q in inquiries:
+                ts = q.created_at.strftime("%Y-%m-%d %H:%M") if q.created_at else "-"
+                yield f"[{q.status or '-'}] {q.title} | {ts}"
+
+        self._show_paged_list(card, fetch_page, render, "문의 내역이 없습니다.")
 
 # ==========================
 # FAQ & Inquiry
@@ -16,6 +16,7 @@ from gui_modules import LoginWindow, MainWindow
 
 
 DB_PATH = "hangi_works.db"
+DB_PROFILE = "desktop"
 
 
 class App:
@@ -24,7 +25,7 @@ class App:
         self.root.title("한기 WORKS - 근로장학 관리 시스템")
         self.root.geometry("1200x800")
 
-        self.db_manager = DatabaseManager(DB_PATH)
+        self.db_manager = DatabaseManager(DB_PATH, profile=DB_PROFILE)
         self.db_manager.create_tables()
 
         # Managers
@@ -33,7 +34,8 @@ class App:
         self.resume_manager = ResumeManager(self.db_manager)
         self.application_manager = ApplicationManager(self.db_manager)
         self.bookmark_manager = BookmarkManager(self.db_manager)
-        self.view_history_manager = ViewHistoryManager(self.db_manager)
+        # 공고 선택마다 INSERT + 커밋하지 않도록 열람 기록은 모아서 저장
+        self.view_history_manager = ViewHistoryManager(self.db_manager, buffered=True)
         self.timetable_manager = TimetableManager(self.db_manager)
         self.faq_manager = FAQManager(self.db_manager)
         self.inquiry_manager = InquiryManager(self.db_manager)
@@ -41,6 +43,12 @@ class App:
         # FAQ 기본 데이터
         self.faq_manager.seed_default_faqs()
 
+        # 열람 기록 압축은 실행할 때마다 조금씩 진행. UI 가 멈추지 않도록 백그라운드에서
+        # 돌리고, 종료 시 view_history_manager.close() 가 멈춘다
+        self.view_history_manager.compact_history_in_background(max_batches=20)
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # 로그인 화면부터 시작
         self.current_user = None
         LoginWindow(self.root, self.user_manager, self.on_login_success)
@@ -61,6 +69,17 @@ class App:
             self.inquiry_manager,
         )
 
+    def on_close(self):
+        # 버퍼에 남은 열람 기록을 저장한 뒤 종료. 저장에 실패해도 (로그는 recorder 가
+        # 남긴다) 창은 닫는다
+        try:
+            self.view_history_manager.close()
+        except Exception:
+            pass
+        finally:
+            self.db_manager.disconnect()
+            self.root.destroy()
+
     def run(self):
         self.root.mainloop()
 
@@ -1,6 +1,10 @@
 # managers.py
-from typing import Optional, List
-from datetime import datetime
+import atexit
+import logging
+import threading
+from typing import Dict, Optional, List, Tuple
+from datetime import datetime, timedelta
+from batch_loader import BatchLoader
 from database_manager import DatabaseManager
 from entities import (
     User,
@@ -23,9 +27,14 @@ from dao import (
     ViewHistoryDAO,
     FAQDAO,
     InquiryDAO,
+    Page,
+    APPLY_OK,
 )
 
 
+logger = logging.getLogger("hangi_works.view_recorder")
+
+
 # ========== UserManager ==========
 class UserManager:
     def __init__(self, db_manager: DatabaseManager):
@@ -49,18 +58,57 @@ class UserManager:
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         return self.user_dao.get_user_by_id(user_id)
 
+    def get_users_by_ids(self, user_ids: List[int]) -> Dict[int, User]:
+        return self.user_dao.get_users_by_ids(user_ids)
+
 
 # ========== JobManager ==========
 class JobManager:
     def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
         self.job_dao = JobDAO(db_manager)
 
     def get_all_jobs(self) -> List[Job]:
         return self.job_dao.get_all_jobs()
 
+    def get_job(self, job_id: int) -> Optional[Job]:
+        """상세 화면용 전체 Job (캐시 우선)"""
+        return self.job_dao.get_job_by_id(job_id)
+
+    def get_jobs_by_ids(self, job_ids: List[int]) -> Dict[int, Job]:
+        return self.job_dao.get_jobs_by_ids(job_ids)
+
+    def job_loader(self) -> BatchLoader:
+        return self.job_dao.loader()
+
+    def cache_stats(self) -> dict:
+        """공고 캐시 적중/미스/교체 횟수"""
+        return self.job_dao.cache_stats()
+
+    def search_cache_stats(self) -> dict:
+        return self.job_dao.search_cache_stats()
+
     def search_jobs(self, keyword: str) -> List[Job]:
         return self.job_dao.search_jobs(keyword)
 
+    def find_jobs(self, **filters) -> List[Job]:
+        return self.job_dao.find_jobs(**filters)
+
+    def get_jobs_page(
+        self,
+        page_size: int = 50,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        projection: Optional[str] = None,
+        **filters,
+    ) -> Page:
+        return self.job_dao.get_jobs_page(
+            page_size, after, before, projection=projection, **filters
+        )
+
+    def facet_counts(self, field: str, **filters) -> Dict[Optional[str], int]:
+        return self.job_dao.facet_counts(field, **filters)
+
     def delete_job(self, job_id: int) -> bool:
         return self.job_dao.delete_job(job_id)
 
@@ -68,10 +116,19 @@ class JobManager:
 # ========== ResumeManager ==========
 class ResumeManager:
     def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
         self.resume_dao = ResumeDAO(db_manager)
 
     def register_or_update_common_resume(
         self, user_id: int, title: str, content: str
+    ) -> Optional[Resume]:
+        # 조회 + 수정/추가를 하나의 트랜잭션으로 처리.
+        # 읽은 뒤 쓰므로 처음부터 쓰기 락을 잡는다 (transaction() 참고)
+        with self.db_manager.transaction(immediate=True):
+            return self._register_or_update_common_resume(user_id, title, content)
+
+    def _register_or_update_common_resume(
+        self, user_id: int, title: str, content: str
     ) -> Optional[Resume]:
         now = datetime.now()
         existing = self.resume_dao.get_default_resume(user_id)
@@ -81,7 +138,7 @@ class ResumeManager:
                 {
                     "title": title,
                     "content": content,
-                    "updated_at": now.isoformat(),
+                    "updated_at": now,
                 },
             )
             existing.title = title
@@ -109,10 +166,16 @@ class ResumeManager:
 class ApplicationManager:
     def __init__(self, db_manager: DatabaseManager):
         self.application_dao = ApplicationDAO(db_manager)
+        self.job_dao = JobDAO(db_manager)
 
-    def apply_to_job(
+    def job_loader(self) -> BatchLoader:
+        """지원 목록에 공고 정보를 붙일 때 쓰는 일괄 조회기"""
+        return self.job_dao.loader()
+
+    def submit_application(
         self, user_id: int, job_id: int, resume_id: int
-    ) -> Optional[Application]:
+    ) -> Tuple[str, Optional[Application]]:
+        """(결과, 지원서). 결과는 dao.APPLY_OK / APPLY_DUPLICATE / APPLY_FULL / APPLY_NO_JOB"""
         now = datetime.now()
         app = Application(
             user_id=user_id,
@@ -121,12 +184,64 @@ class ApplicationManager:
             status="제출",
             submitted_at=now,
         )
-        app_id = self.application_dao.insert_application(app)
+        result, app_id = self.application_dao.apply(app)
+        if result != APPLY_OK:
+            return result, None
         app.application_id = app_id
-        return app
+        return result, app
 
-    def get_applications_by_user(self, user_id: int) -> List[Application]:
-        return self.application_dao.get_applications_by_user(user_id)
+    def apply_to_job(
+        self, user_id: int, job_id: int, resume_id: int
+    ) -> Optional[Application]:
+        """지원 성공 시 지원서, 중복/마감 등으로 거절되면 None"""
+        return self.submit_application(user_id, job_id, resume_id)[1]
+
+    def get_applicant_count(self, job_id: int) -> int:
+        return self.application_dao.get_applicant_count(job_id)
+
+    def update_statuses(
+        self,
+        app_ids: List[int],
+        new_status: str,
+        expected_status: Optional[str] = None,
+    ) -> Dict[int, str]:
+        """지원서 상태 일괄 변경 (한 번에 커밋). {application_id: 결과} 반환,
+        결과는 dao.STATUS_UPDATED / STATUS_UNCHANGED / STATUS_CONFLICT / STATUS_NOT_FOUND"""
+        return self.application_dao.update_statuses(app_ids, new_status, expected_status)
+
+    def update_job_application_statuses(
+        self,
+        job_id: int,
+        new_status: str,
+        expected_status: Optional[str] = None,
+    ) -> Dict[int, str]:
+        """공고의 지원서를 상태 조건(expected_status)으로 골라 일괄 변경"""
+        return self.application_dao.update_statuses_by_job(
+            job_id, new_status, expected_status
+        )
+
+    def get_applications_by_user(
+        self, user_id: int, with_events: bool = False
+    ) -> List[Application]:
+        """with_events=True 이면 상태 변경 이력까지 한 번에 채워서 반환"""
+        apps = self.application_dao.get_applications_by_user(user_id)
+        if with_events:
+            self.application_dao.load_events(apps)
+        return apps
+
+    def load_events(self, apps: List[Application]) -> List[Application]:
+        return self.application_dao.load_events(apps)
+
+    def get_applications_page(
+        self,
+        user_id: int,
+        page_size: int = 50,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Page:
+        return self.application_dao.get_applications_page_by_user(
+            user_id, page_size, after, before
+        )
 
 
 # ========== TimetableManager ==========
@@ -154,51 +269,351 @@ class TimetableManager:
 class BookmarkManager:
     def __init__(self, db_manager: DatabaseManager):
         self.bookmark_dao = BookmarkDAO(db_manager)
-        self.job_dao = JobDAO(db_manager)
 
     def add_bookmark(self, user_id: int, job_id: int) -> bool:
-        now = datetime.now()
-        bm = Bookmark(user_id=user_id, job_id=job_id, created_at=now)
-        self.bookmark_dao.insert_bookmark(bm)
-        return True
+        """새로 스크랩했으면 True, 이미 스크랩돼 있었으면 False"""
+        return self.bookmark_dao.add_bookmark(user_id, job_id)
 
     def remove_bookmark(self, user_id: int, job_id: int) -> bool:
         return self.bookmark_dao.delete_bookmark(user_id, job_id)
 
-    def get_bookmarked_jobs(self, user_id: int) -> List[Job]:
-        job_ids = self.bookmark_dao.get_bookmarked_job_ids(user_id)
-        res = []
-        for jid in job_ids:
-            job = self.job_dao.get_job_by_id(jid)
-            if job:
-                res.append(job)
-        return res
+    def toggle_bookmark(self, user_id: int, job_id: int) -> bool:
+        """스크랩 상태를 뒤집고, 바뀐 상태(True=스크랩됨)를 반환"""
+        return self.bookmark_dao.toggle_bookmark(user_id, job_id)
+
+    def is_bookmarked(self, user_id: int, job_id: int) -> bool:
+        return self.bookmark_dao.is_bookmarked(user_id, job_id)
+
+    def add_bookmarks(self, user_id: int, job_ids: List[int]) -> int:
+        return self.bookmark_dao.add_bookmarks(user_id, job_ids)
+
+    def remove_bookmarks(self, user_id: int, job_ids: List[int]) -> int:
+        return self.bookmark_dao.delete_bookmarks(user_id, job_ids)
+
+    def get_bookmarked_jobs(self, user_id: int, projection: Optional[str] = None) -> list:
+        return self.bookmark_dao.get_bookmarked_jobs(user_id, projection)
+
+    def get_orphan_bookmarks(self, user_id: Optional[int] = None) -> List[Bookmark]:
+        """삭제된 공고를 가리키는 스크랩 목록"""
+        return self.bookmark_dao.get_orphan_bookmarks(user_id)
+
+    def cleanup_orphan_bookmarks(self, user_id: Optional[int] = None) -> int:
+        return self.bookmark_dao.delete_orphan_bookmarks(user_id)
 
 
 # ========== ViewHistoryManager ==========
+class _RecentView:
+    """BufferedViewRecorder 가 합치기 창 하나 동안 들고 있는 열람 상태"""
+
+    __slots__ = ("first_at", "view", "queued", "stored_at", "dirty")
+
+    def __init__(self, view: ViewHistory):
+        self.first_at = view.viewed_at  # 창의 시작 (첫 열람 시각)
+        self.view = view  # viewed_at 은 마지막 열람 시각
+        self.queued = True  # 아직 INSERT 대기 중
+        self.stored_at: Optional[datetime] = None  # DB 행에 저장된 viewed_at
+        self.dirty = False  # 저장된 행의 시각을 갱신해야 함
+
+
+class BufferedViewRecorder:
+    """열람 기록을 메모리에 모았다가 한 트랜잭션으로 저장하는 기록기.
+
+    record() 는 락 하나와 dict 연산만 하므로 UI 스레드에서 바로 불러도 된다.
+    같은 사용자가 같은 공고를 첫 열람부터 collapse_window 초 안에 다시 보면 새 행을
+    만들지 않고 그 행의 열람 시각만 마지막 열람으로 옮긴다. 아직 저장 전인 행이면
+    INSERT 할 값을, 이미 저장된 행이면 다음 flush 에서 UPDATE 할 값을 바꾼다.
+    쌓인 기록은 max_pending 개가 되거나 flush_interval 초가 지나면 백그라운드 스레드가
+    저장하고, close() 는 남은 기록을 모두 저장한 뒤 스레드를 멈춘다.
+    백그라운드 저장이 실패하면 로그를 남기고 flush_interval 부터 max_backoff 초까지
+    간격을 두 배씩 늘려 다시 시도한다. 실패가 이어지는 동안 저장 대기 중인 기록은
+    max_buffer 개까지만 두고 오래된 것부터 버린다 (dropped 로 셈).
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        vh_dao: ViewHistoryDAO,
+        max_pending: int = 100,
+        flush_interval: float = 2.0,
+        collapse_window: float = 10.0,
+        max_backoff: float = 60.0,
+        max_buffer: int = 10000,
+    ):
+        self.db_manager = db_manager
+        self.vh_dao = vh_dao
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.collapse_window = collapse_window
+        self.max_backoff = max_backoff
+        self.max_buffer = max_buffer
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # INSERT 대기 중인 열람
+        self._pending: List[_RecentView] = []
+        # 저장된 뒤 다시 열람되어 시각을 UPDATE 해야 하는 열람
+        self._touched: List[_RecentView] = []
+        # (user_id, job_id) → 합치기 창이 열려 있는 열람 (flush 를 넘어 유지)
+        self._recent: Dict[Tuple[int, int], _RecentView] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self.recorded = 0
+        self.collapsed = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.failures = 0
+        self._thread = threading.Thread(
+            target=self._run, name="view-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def record(self, user_id: int, job_id: int, viewed_at: Optional[datetime] = None):
+        now = viewed_at or datetime.now()
+        key = (user_id, job_id)
+        with self._lock:
+            self.recorded += 1
+            entry = self._recent.get(key)
+            if (
+                entry is not None
+                and (now - entry.first_at).total_seconds() <= self.collapse_window
+            ):
+                if now > entry.view.viewed_at:
+                    entry.view.viewed_at = now
+                if not entry.queued and not entry.dirty:
+                    entry.dirty = True
+                    self._touched.append(entry)
+                self.collapsed += 1
+                return
+            entry = _RecentView(ViewHistory(user_id=user_id, job_id=job_id, viewed_at=now))
+            self._pending.append(entry)
+            self._recent[key] = entry
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wake.set()
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """쌓인 기록을 한 트랜잭션으로 저장하고 새로 저장한 행 수를 반환"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                touched, self._touched = self._touched, []
+                # 저장 중에도 record() 가 시각을 바꿀 수 있으므로 값을 미리 떠 둔다
+                inserts = []
+                for entry in batch:
+                    entry.queued = False
+                    inserts.append((entry, entry.view.viewed_at))
+                updates = []
+                for entry in touched:
+                    entry.dirty = False
+                    # 아직 INSERT 되지 않은 열람은 INSERT 가 최신 시각을 쓴다
+                    if entry.stored_at is not None and entry.stored_at != entry.view.viewed_at:
+                        updates.append((entry, entry.stored_at, entry.view.viewed_at))
+                self._prune_recent()
+            if not inserts and not updates:
+                return 0
+            try:
+                with self.db_manager.transaction():
+                    self.vh_dao.insert_views(
+                        [
+                            ViewHistory(
+                                user_id=e.view.user_id, job_id=e.view.job_id, viewed_at=ts
+                            )
+                            for e, ts in inserts
+                        ]
+                    )
+                    self.vh_dao.update_view_times(
+                        [
+                            (e.view.user_id, e.view.job_id, old, new)
+                            for e, old, new in updates
+                        ]
+                    )
+            except Exception:
+                # 저장 실패 시 다음 flush 에서 다시 시도하도록 되돌려 놓는다
+                with self._lock:
+                    for entry, _ts in inserts:
+                        entry.queued = True
+                    self._pending = [e for e, _ts in inserts] + self._pending
+                    for entry, _old, _new in updates:
+                        if not entry.dirty:
+                            entry.dirty = True
+                            self._touched.append(entry)
+                    for entry in [e for e, _ts in inserts] + [e for e, _o, _n in updates]:
+                        self._recent.setdefault(
+                            (entry.view.user_id, entry.view.job_id), entry
+                        )
+                    self._trim_pending()
+                raise
+            with self._lock:
+                for entry, ts in inserts:
+                    entry.stored_at = ts
+                for entry, _old, new in updates:
+                    entry.stored_at = new
+            self.flushed += len(inserts)
+            return len(inserts)
+
+    def _trim_pending(self):
+        # 저장이 계속 실패해도 버퍼가 끝없이 자라지 않게 오래된 기록부터 버린다 (_lock 안에서 호출)
+        excess = len(self._pending) - self.max_buffer
+        if excess <= 0:
+            return
+        for entry in self._pending[:excess]:
+            entry.queued = False
+            key = (entry.view.user_id, entry.view.job_id)
+            if self._recent.get(key) is entry:
+                del self._recent[key]
+        del self._pending[:excess]
+        self.dropped += excess
+        logger.warning("열람 기록 저장 실패가 계속되어 오래된 기록 %d 건을 버렸습니다", excess)
+
+    def _prune_recent(self):
+        # 합치기 창이 끝난 열람은 더 이상 합칠 일이 없으므로 버린다 (_lock 안에서 호출)
+        cutoff = datetime.now() - timedelta(seconds=self.collapse_window)
+        self._recent = {k: e for k, e in self._recent.items() if e.first_at >= cutoff}
+
+    def close(self):
+        """남은 기록을 모두 저장하고 백그라운드 스레드를 종료.
+        마지막 저장이 실패하면 로그를 남기고 예외를 그대로 올린다 (스레드는 이미 멈춘 뒤)."""
+        if not self._stop.is_set():
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+        try:
+            self.flush()
+        except Exception:
+            logger.exception(
+                "종료 시 열람 기록 %d 건을 저장하지 못했습니다", self.pending_count()
+            )
+            raise
+
+    def _run(self):
+        interval = self.flush_interval
+        last_error = None
+        try:
+            while not self._stop.is_set():
+                self._wake.wait(interval)
+                self._wake.clear()
+                try:
+                    self.flush()
+                except Exception as e:
+                    self.failures += 1
+                    # 같은 오류가 반복되면 처음 한 번만 전체 로그를 남긴다
+                    error = (type(e), str(e))
+                    if error != last_error:
+                        logger.exception("열람 기록 저장 실패, %.0f초 뒤 다시 시도", interval)
+                        last_error = error
+                    else:
+                        logger.debug("열람 기록 저장 실패 반복: %s", e)
+                    interval = min(interval * 2, self.max_backoff)
+                else:
+                    if last_error is not None:
+                        logger.info("열람 기록 저장이 복구되었습니다")
+                    interval = self.flush_interval
+                    last_error = None
+        finally:
+            self.db_manager.release()
+
+
 class ViewHistoryManager:
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, buffered: bool = False, **buffer_options):
+        self.db_manager = db_manager
         self.vh_dao = ViewHistoryDAO(db_manager)
         self.job_dao = JobDAO(db_manager)
+        self.recorder: Optional[BufferedViewRecorder] = None
+        self._compactor: Optional[threading.Thread] = None
+        self._compact_stop = threading.Event()
+        if buffered:
+            self.enable_buffering(**buffer_options)
+
+    def enable_buffering(self, **buffer_options) -> BufferedViewRecorder:
+        """record_view 를 메모리 버퍼 + 일괄 저장 방식으로 전환"""
+        if self.recorder is None:
+            self.recorder = BufferedViewRecorder(
+                self.db_manager, self.vh_dao, **buffer_options
+            )
+            # GUI 종료 경로를 거치지 않고 끝나도 버퍼를 잃지 않도록
+            atexit.register(self.close)
+        return self.recorder
+
+    def flush(self) -> int:
+        return self.recorder.flush() if self.recorder else 0
+
+    def close(self):
+        # 백그라운드 압축은 진행 중인 배치까지만 하고 멈춘다 (다음 실행에서 이어서)
+        self._compact_stop.set()
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+        if self.recorder is not None:
+            self.recorder.close()
 
     def record_view(self, user_id: int, job_id: int):
+        if self.recorder is not None:
+            self.recorder.record(user_id, job_id)
+            return
         now = datetime.now()
         vh = ViewHistory(user_id=user_id, job_id=job_id, viewed_at=now)
         self.vh_dao.insert_view(vh)
 
-    def get_recent_jobs(self, user_id: int, limit: int = 10) -> List[Job]:
-        ids = self.vh_dao.get_recent_job_ids(user_id, limit)
-        res = []
-        for jid in ids:
-            job = self.job_dao.get_job_by_id(jid)
-            if job:
-                res.append(job)
-        return res
+    def get_recent_jobs(
+        self, user_id: int, limit: int = 10, projection: Optional[str] = None
+    ) -> list:
+        """최근 본 공고 (같은 공고는 한 번만)"""
+        return [job for job, _ in self.get_recent_views(user_id, limit, projection)]
+
+    def get_recent_views(
+        self, user_id: int, limit: int = 10, projection: Optional[str] = None
+    ) -> List[Tuple[Job, Optional[datetime]]]:
+        # 방금 본 공고도 목록에 보이도록 버퍼를 먼저 비운다
+        self.flush()
+        return self.vh_dao.get_recent_views(user_id, limit, projection)
+
+    def get_popular_jobs(
+        self, days: Optional[int] = 7, limit: int = 10
+    ) -> List[Tuple[Job, int]]:
+        """최근 days 일간 많이 본 공고 (Job, 열람 수). days=None 이면 전체 기간."""
+        self.flush()
+        since = None if days is None else datetime.now() - timedelta(days=days)
+        return self.vh_dao.get_popular_jobs(since, limit)
+
+    def compact_history(
+        self,
+        retain_days: int = 90,
+        per_user_cap: int = 200,
+        batch_size: int = 500,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """오래된 열람 기록을 일별 집계로 압축 (ViewHistoryDAO.compact 참고)"""
+        self.flush()
+        return self.vh_dao.compact(
+            retain_days, per_user_cap, batch_size, max_batches,
+            should_stop=self._compact_stop.is_set,
+        )
+
+    def compact_history_in_background(self, **options) -> threading.Thread:
+        """compact_history 를 백그라운드 스레드에서 실행 (UI 스레드를 막지 않도록).
+        이미 실행 중이면 그 스레드를 돌려준다. close() 가 멈추고 기다린다."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return self._compactor
+        self._compact_stop.clear()
+
+        def run():
+            try:
+                self.compact_history(**options)
+            finally:
+                self.db_manager.release()
+
+        self._compactor = threading.Thread(target=run, name="view-compactor", daemon=True)
+        self._compactor.start()
+        return self._compactor
 
 
 # ========== FAQManager ==========
 class FAQManager:
     def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
         self.faq_dao = FAQDAO(db_manager)
 
     def get_all_faqs(self) -> List[FAQ]:
@@ -208,6 +623,9 @@ class FAQManager:
     def get_all(self) -> List[FAQ]:
         return self.faq_dao.get_all()
 
+    def search_faqs(self, keyword: str) -> List[FAQ]:
+        return self.faq_dao.search(keyword)
+
     def seed_default_faqs(self):
         """처음 실행 시 FAQ가 비어 있으면 기본 몇 개 넣기"""
         cur_list = self.faq_dao.get_all()
@@ -217,8 +635,9 @@ class FAQManager:
             FAQ(category="지원", question="지원서는 어떻게 제출하나요?", answer="공고 선택 후 '선택 공고 지원' 버튼을 눌러주세요."),
             FAQ(category="이력서", question="통합 이력서는 무엇인가요?", answer="여러 공고에 공통으로 사용할 수 있는 기본 이력서입니다."),
         ]
-        for f in examples:
-            self.faq_dao.insert_faq(f)
+        with self.db_manager.transaction():
+            for f in examples:
+                self.faq_dao.insert_faq(f)
 
 
 # ========== InquiryManager ==========
@@ -243,3 +662,14 @@ class InquiryManager:
 
     def get_user_inquiries(self, user_id: int) -> List[Inquiry]:
         return self.inq_dao.get_inquiries_by_user(user_id)
+
+    def get_user_inquiries_page(
+        self,
+        user_id: int,
+        page_size: int = 50,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Page:
+        return self.inq_dao.get_inquiries_page_by_user(
+            user_id, page_size, after, before
+        )
@@ -0,0 +1,215 @@
+# query_profiler.py
+import json
+import logging
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+logger = logging.getLogger("hangi_works.slow_query")
+
+# 실행 시간 히스토그램 구간 (ms). 마지막 칸은 "그 이상"
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+_WS_RE = re.compile(r"\s+")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_sql(query: str) -> str:
+    """통계 키로 쓸 SQL 정규화: 공백 정리, 리터럴과 IN (?, ?, ...) 목록을 ? 로"""
+    q = _WS_RE.sub(" ", query).strip()
+    q = _STRING_RE.sub("?", q)
+    q = _NUMBER_RE.sub("?", q)
+    q = _IN_LIST_RE.sub("(?...)", q)
+    return q
+
+
+class QueryStats:
+    """정규화된 SQL 하나에 대한 누적 통계"""
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.calls = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms = 0.0
+        self.slow_calls = 0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.plan: Optional[List[str]] = None
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def has_table_scan(self) -> bool:
+        """EXPLAIN QUERY PLAN 에 전체 스캔(SCAN ...)이 있는지.
+        인덱스 순서로 훑는 'SCAN t USING INDEX' 도 모든 행을 읽으므로 포함한다.
+        FTS 등 가상 테이블 색인 조회(VIRTUAL TABLE INDEX)는 제외."""
+        if not self.plan:
+            return False
+        return any(
+            line.startswith("SCAN ")
+            and not line.startswith("SCAN CONSTANT")
+            and "VIRTUAL TABLE INDEX" not in line
+            for line in self.plan
+        )
+
+    def add(self, elapsed_ms: float, rows: int):
+        self.calls += 1
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.min_ms = elapsed_ms if self.min_ms is None else min(self.min_ms, elapsed_ms)
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                self.histogram[i] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "sql": self.sql,
+            "calls": self.calls,
+            "rows": self.rows,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "min_ms": round(self.min_ms or 0.0, 3),
+            "max_ms": round(self.max_ms, 3),
+            "slow_calls": self.slow_calls,
+            "histogram": dict(
+                zip([f"<={b}ms" for b in HISTOGRAM_BOUNDS_MS] + ["more"], self.histogram)
+            ),
+            "plan": self.plan,
+            "table_scan": self.has_table_scan(),
+        }
+
+
+class BufferedCursor:
+    """결과를 미리 모두 읽어 둔 커서.
+    SQLite 는 실제 작업 대부분을 fetch 시점에 하므로, 프로파일링 중에는
+    실행 시간에 fetch 까지 포함시키기 위해 이 커서를 돌려준다."""
+
+    def __init__(self, cur):
+        self._rows = cur.fetchall()
+        self._pos = 0
+        self.description = cur.description
+        self.lastrowid = cur.lastrowid
+        self.rowcount = cur.rowcount
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self):
+        while self._pos < len(self._rows):
+            yield self.fetchone()
+
+    def fetchone(self):
+        if self._pos >= len(self._rows):
+            return None
+        row = self._rows[self._pos]
+        self._pos += 1
+        return row
+
+    def fetchmany(self, size: int = 1) -> list:
+        rows = self._rows[self._pos:self._pos + size]
+        self._pos += len(rows)
+        return rows
+
+    def fetchall(self) -> list:
+        rows = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return rows
+
+
+class QueryProfiler:
+    """DatabaseManager.execute_query 의 문장별 실행 통계 수집기.
+
+    slow_threshold_ms 를 넘는 실행은 느린 쿼리 로그(logging + 선택적 JSONL 파일)에
+    남기고, 해당 SQL 의 EXPLAIN QUERY PLAN 을 한 번 캡처한다.
+    """
+
+    def __init__(
+        self,
+        slow_threshold_ms: float = 50.0,
+        slow_log_path: Optional[str] = None,
+        explain_slow: bool = True,
+    ):
+        self.slow_threshold_ms = slow_threshold_ms
+        self.slow_log_path = slow_log_path
+        self.explain_slow = explain_slow
+        self._stats: Dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        query: str,
+        params,
+        elapsed_ms: float,
+        rows: int,
+        explain: Optional[Callable[[str, object], List[str]]] = None,
+    ):
+        key = normalize_sql(query)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = QueryStats(key)
+            stats.add(elapsed_ms, rows)
+            slow = elapsed_ms >= self.slow_threshold_ms
+            if slow:
+                stats.slow_calls += 1
+            need_plan = slow and self.explain_slow and stats.plan is None
+        if not slow:
+            return
+
+        if need_plan and explain is not None:
+            try:
+                plan = explain(query, params)
+            except Exception as e:
+                plan = [f"(EXPLAIN 실패: {e})"]
+            with self._lock:
+                stats.plan = plan
+        self._log_slow(key, params, elapsed_ms, rows, stats.plan)
+
+    def _log_slow(self, sql: str, params, elapsed_ms: float, rows: int, plan):
+        logger.warning("slow query %.1fms rows=%d: %s", elapsed_ms, rows, sql)
+        if not self.slow_log_path:
+            return
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "elapsed_ms": round(elapsed_ms, 3),
+            "rows": rows,
+            "sql": sql,
+            "params": [repr(p) for p in params] if params else [],
+            "plan": plan,
+        }
+        with self._lock:
+            with open(self.slow_log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    # ---------- 조회 ----------
+    def get(self, query: str) -> Optional[QueryStats]:
+        return self._stats.get(normalize_sql(query))
+
+    def get_stats(self, order_by: str = "total_ms") -> List[QueryStats]:
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda s: getattr(s, order_by), reverse=True)
+
+    def table_scans(self) -> List[QueryStats]:
+        """계획이 캡처된 문장 중 전체 테이블 스캔을 하는 것"""
+        return [s for s in self.get_stats() if s.has_table_scan()]
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def dump(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                [s.to_dict() for s in self.get_stats()], f, ensure_ascii=False, indent=2
+            )
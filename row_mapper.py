@@ -0,0 +1,81 @@
+# row_mapper.py
+import inspect
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+
+class RowMapper:
+    """고정된 컬럼 순서의 행을 엔티티로 바꾸는 변환기.
+
+    columns 는 엔티티(또는 namedtuple) 생성자의 앞쪽 인자와 같은 순서여야 하며
+    (만들 때 확인한다), 조회 SQL 은 select() 가 만든 컬럼 목록으로 시작해야 한다. 변환 함수는 만들 때
+    한 번 생성해 두므로, 행마다 컬럼 이름으로 찾지 않고 row[0], row[1] ... 을
+    그대로 생성자에 위치 인자로 넘긴다. 목록 뒤에 붙은 추가 컬럼(예: MAX(...) AS ...)
+    은 무시되므로 호출자가 이름으로 읽으면 된다.
+
+    deferred 에 적은 컬럼은 SELECT 하지 않고 생성자에 deferred_value
+    (보통 deferred.NOT_LOADED) 를 넘긴다.
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        columns: Sequence[str],
+        converters: Optional[Dict[str, Callable]] = None,
+        deferred: Sequence[str] = (),
+        deferred_value=None,
+    ):
+        converters = converters or {}
+        params = list(inspect.signature(cls).parameters)
+        if list(columns) != params[:len(columns)]:
+            raise ValueError(
+                f"{cls.__name__} 생성자 인자 순서와 컬럼 순서가 다릅니다: {list(columns)}"
+            )
+        unknown = (set(converters) | set(deferred)) - set(columns)
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼: {sorted(unknown)}")
+        self.cls = cls
+        self.all_columns = tuple(columns)
+        self.deferred = tuple(deferred)
+        # 실제로 SELECT 하는 컬럼 (지연 컬럼 제외)
+        self.columns = tuple(c for c in columns if c not in self.deferred)
+        self.map = self._compile(
+            cls, self.all_columns, converters, self.deferred, deferred_value
+        )
+
+    @staticmethod
+    def _compile(
+        cls: type,
+        columns: Sequence[str],
+        converters: Dict[str, Callable],
+        deferred: Sequence[str],
+        deferred_value,
+    ):
+        namespace = {"_cls": cls, "_deferred": deferred_value}
+        args = []
+        i = 0
+        for col in columns:
+            if col in deferred:
+                args.append("_deferred")
+                continue
+            conv = converters.get(col)
+            if conv is None:
+                args.append(f"row[{i}]")
+            else:
+                namespace[f"_c{i}"] = conv
+                args.append(f"_c{i}(row[{i}])")
+            i += 1
+        source = f"def _map(row):\n    return _cls({', '.join(args)})\n"
+        exec(source, namespace)
+        return namespace["_map"]
+
+    def select(self, alias: Optional[str] = None) -> str:
+        """SELECT 절에 넣을 컬럼 목록 ("a.col1, a.col2, ...")"""
+        prefix = f"{alias}." if alias else ""
+        return ", ".join(prefix + c for c in self.columns)
+
+    def __call__(self, row):
+        return self.map(row)
+
+    def map_all(self, rows: Iterable) -> list:
+        m = self.map
+        return [m(r) for r in rows]
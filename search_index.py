@@ -0,0 +1,78 @@
+# search_index.py
+import re
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """색인/검색 공통 정규화: 소문자화 + 연속 공백을 한 칸으로"""
+    if not text:
+        return ""
+    return _WS_RE.sub(" ", text).strip().casefold()
+
+
+def ngrams(text: Optional[str], n: int = 2) -> Set[str]:
+    """문자 n-gram 집합.
+
+    한글 복합어("학생식당")는 띄어쓰기 단위 토크나이저로는 "식당"을 찾을 수 없으므로
+    글자 단위로 자른다. 공백도 포함해서 자르기 때문에 "도서관 야간" 같은
+    여러 단어 검색어도 부분 문자열 검색과 같은 후보를 만든다.
+    """
+    s = normalize_text(text)
+    if len(s) < n:
+        return set()
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+def document_ngrams(texts: Iterable[Optional[str]], n: int = 2) -> Set[str]:
+    grams: Set[str] = set()
+    for t in texts:
+        grams |= ngrams(t, n)
+    return grams
+
+
+class NgramIndex:
+    """search_ngrams 테이블 위의 문자 n-gram 역색인.
+
+    scope 로 문서 종류(공고, FAQ 등)를 구분한다. 검색은 검색어의 모든 n-gram 을
+    가진 문서 id 를 색인에서 찾는 것이며, 결과는 후보이므로 호출자가 원문으로
+    한 번 더 확인해야 한다 (candidate_subquery 참고).
+    """
+
+    def __init__(self, db_manager, scope: str, n: int = 2):
+        self.db_manager = db_manager
+        self.scope = scope
+        self.n = n
+
+    def can_search(self, keyword: str) -> bool:
+        return len(normalize_text(keyword)) >= self.n
+
+    def index(self, doc_id: int, texts: Iterable[Optional[str]]):
+        """문서 하나를 (다시) 색인. 호출자의 트랜잭션에 참여한다."""
+        self.remove(doc_id)
+        grams = document_ngrams(texts, self.n)
+        if grams:
+            self.db_manager.execute_many(
+                "INSERT OR IGNORE INTO search_ngrams (scope, gram, doc_id) VALUES (?, ?, ?)",
+                [(self.scope, g, doc_id) for g in grams],
+            )
+
+    def remove(self, doc_id: int):
+        self.db_manager.execute_query(
+            "DELETE FROM search_ngrams WHERE scope = ? AND doc_id = ?",
+            (self.scope, doc_id),
+        )
+
+    def candidate_subquery(self, keyword: str) -> Tuple[str, List]:
+        """keyword 의 n-gram 을 모두 포함하는 doc_id 를 고르는 서브쿼리와 파라미터.
+        `WHERE id IN (<subquery>)` 형태로 원문 확인 조건과 함께 쓴다."""
+        grams = sorted(ngrams(keyword, self.n))
+        placeholders = ", ".join("?" for _ in grams)
+        sql = (
+            "SELECT doc_id FROM search_ngrams "
+            f"WHERE scope = ? AND gram IN ({placeholders}) "
+            "GROUP BY doc_id HAVING COUNT(*) = ?"
+        )
+        return sql, [self.scope, *grams, len(grams)]
@@ -0,0 +1,30 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database_manager import DatabaseManager  # noqa: E402
+
+
+@pytest.fixture
+def make_db(tmp_path):
+    """임시 파일 DB 를 만들어 주는 팩토리. 테스트가 끝나면 모두 닫는다."""
+    dbs = []
+
+    def factory(profile: str = "server", **kwargs) -> DatabaseManager:
+        db = DatabaseManager(str(tmp_path / f"test_{len(dbs)}.db"), profile=profile, **kwargs)
+        db.create_tables()
+        dbs.append(db)
+        return db
+
+    yield factory
+    for db in dbs:
+        db.disconnect()
+
+
+@pytest.fixture
+def db(make_db) -> DatabaseManager:
+    return make_db()
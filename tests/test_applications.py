@@ -0,0 +1,163 @@
+# tests/test_applications.py
+import random
+import threading
+from datetime import datetime
+
+import pytest
+
+from dao import (
+    APPLY_DUPLICATE,
+    APPLY_FULL,
+    APPLY_NO_JOB,
+    APPLY_OK,
+    STATUS_CONFLICT,
+    STATUS_NOT_FOUND,
+    STATUS_UNCHANGED,
+    STATUS_UPDATED,
+    ApplicationDAO,
+    JobDAO,
+)
+from entities import Application, Job
+
+
+def _app(user_id, job_id):
+    return Application(
+        user_id=user_id, job_id=job_id, resume_id=None,
+        status="제출", submitted_at=datetime.now(),
+    )
+
+
+def _events(db, app_id):
+    return db.execute_query(
+        "SELECT status FROM application_events WHERE application_id = ?", (app_id,)
+    ).fetchall()
+
+
+def test_application_writes_go_through_write_queue(db):
+    job_id = JobDAO(db).insert_job(Job(title="학과 사무 보조", max_applicants=1))
+    dao = ApplicationDAO(db)
+    wq = db.enable_write_queue()
+    writes = wq.writes
+
+    result, app_id = dao.apply(_app(1, job_id))
+    assert result == APPLY_OK
+    # 지원서 INSERT 와 이력 INSERT 가 쓰기 작업 하나로 처리된다
+    assert wq.writes == writes + 1
+    assert [r["status"] for r in _events(db, app_id)] == ["제출"]
+
+    assert dao.apply(_app(1, job_id)) == (APPLY_DUPLICATE, None)
+    assert dao.apply(_app(2, job_id)) == (APPLY_FULL, None)
+    assert dao.apply(_app(2, job_id + 100)) == (APPLY_NO_JOB, None)
+
+    new_id = dao.insert_application(_app(3, job_id + 1))
+    assert wq.writes == writes + 5
+    assert [r["status"] for r in _events(db, new_id)] == ["제출"]
+    # 호출 스레드는 커넥션을 들고 있지 않다 (쓰기는 쓰기 스레드에서만)
+    assert db.connection is None
+
+
+@pytest.mark.parametrize("write_queue", [False, True])
+def test_concurrent_apply_never_exceeds_capacity(make_db, write_queue):
+    threads, jobs, capacity, attempts = 8, 10, 3, 60
+    db = make_db(pool_size=threads)
+    job_dao = JobDAO(db)
+    with db.transaction():
+        job_ids = [
+            job_dao.insert_job(Job(title=f"마감 임박 {i}", max_applicants=capacity))
+            for i in range(jobs)
+        ]
+    if write_queue:
+        db.enable_write_queue()
+    students = list(range(1, jobs * capacity))  # 정원 합보다 적은 학생 → 중복 시도 다수
+    errors = []
+
+    def worker(seed):
+        rnd = random.Random(seed)
+        dao = ApplicationDAO(db)
+        try:
+            for _ in range(attempts):
+                dao.apply(_app(rnd.choice(students), rnd.choice(job_ids)))
+        except Exception as e:  # 예: database is locked
+            errors.append(e)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join(60)
+
+    assert errors == []
+    over = db.execute_query(
+        "SELECT job_id FROM applications GROUP BY job_id HAVING COUNT(*) > ?",
+        (capacity,),
+    ).fetchall()
+    dup = db.execute_query(
+        "SELECT user_id FROM applications GROUP BY user_id, job_id HAVING COUNT(*) > 1"
+    ).fetchall()
+    drift = db.execute_query(
+        """
+        SELECT s.job_id FROM job_stats s
+        LEFT JOIN (SELECT job_id, COUNT(*) AS n FROM applications GROUP BY job_id) a
+          ON a.job_id = s.job_id
+        WHERE s.applicant_count != COALESCE(a.n, 0)
+        """
+    ).fetchall()
+    missing_events = db.execute_query(
+        """
+        SELECT a.application_id FROM applications a
+        WHERE NOT EXISTS (SELECT 1 FROM application_events e
+                          WHERE e.application_id = a.application_id)
+        """
+    ).fetchall()
+    assert over == []
+    assert dup == []
+    assert drift == []
+    assert missing_events == []
+    # 정원이 다 찰 만큼 시도했으므로 모든 공고가 정확히 정원만큼 찼다
+    total = db.execute_query("SELECT COUNT(*) FROM applications").fetchone()[0]
+    assert total == jobs * capacity
+
+
+def test_bulk_status_update_over_chunk_size(db):
+    dao = ApplicationDAO(db)
+    with db.transaction():
+        ids = [dao.insert_application(_app(user_id, 1)) for user_id in range(1, 651)]
+    # 이미 합격 / 다른 상태인 지원서를 섞는다
+    dao.update_statuses(ids[:5], "합격")
+    dao.update_statuses(ids[5:10], "취소")
+    unknown = [10_000, 10_001]
+
+    outcomes = dao.update_statuses(ids + unknown + ids[:3], "합격", expected_status="제출")
+
+    assert len(outcomes) == len(ids) + len(unknown)
+    assert all(outcomes[i] == STATUS_UNCHANGED for i in ids[:5])
+    assert all(outcomes[i] == STATUS_CONFLICT for i in ids[5:10])
+    assert all(outcomes[i] == STATUS_NOT_FOUND for i in unknown)
+    changed = ids[10:]
+    assert all(outcomes[i] == STATUS_UPDATED for i in changed)
+
+    # 바뀐 지원서마다 '합격' 이력이 정확히 한 줄
+    rows = db.execute_query(
+        "SELECT application_id, COUNT(*) FROM application_events "
+        "WHERE status = '합격' GROUP BY application_id"
+    ).fetchall()
+    counts = {r[0]: r[1] for r in rows}
+    assert set(counts) == set(ids[:5]) | set(changed)
+    assert all(c == 1 for c in counts.values())
+    statuses = db.execute_query(
+        "SELECT status, COUNT(*) FROM applications GROUP BY status"
+    ).fetchall()
+    assert dict((r[0], r[1]) for r in statuses) == {"합격": 645, "취소": 5}
+
+
+def test_bulk_status_update_by_job(db):
+    dao = ApplicationDAO(db)
+    ids = [dao.insert_application(_app(user_id, 7)) for user_id in range(1, 4)]
+    other = dao.insert_application(_app(1, 8))
+    dao.update_statuses([ids[0]], "취소")
+
+    outcomes = dao.update_statuses_by_job(7, "불합격", expected_status="제출")
+    assert outcomes == {ids[1]: STATUS_UPDATED, ids[2]: STATUS_UPDATED}
+    assert dao.update_statuses_by_job(7, "불합격", expected_status="제출") == {}
+    assert [e[0] for e in _events(db, other)] == ["제출"]
+    assert [e[0] for e in _events(db, ids[1])] == ["제출", "불합격"]
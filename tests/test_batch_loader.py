@@ -0,0 +1,51 @@
+# tests/test_batch_loader.py
+from batch_loader import BatchLoader
+from dao import MAX_IN_PARAMS, JobDAO, UserDAO
+from entities import Job, User
+
+
+def test_loader_coalesces_keys_into_one_batch():
+    calls = []
+
+    def batch_fn(keys):
+        calls.append(list(keys))
+        return {k: k * 10 for k in keys if k != 3}
+
+    loader = BatchLoader(batch_fn)
+    handles = [loader.load(k) for k in (1, 2, 3, 2)]
+    assert calls == []
+    # 첫 get() 에서 모아 둔 키를 중복 없이 한 번에 조회
+    assert [h.get() for h in handles] == [10, 20, None, 20]
+    assert calls == [[1, 2, 3]]
+
+    loader.prime(4, 99)
+    assert loader.load_many([1, 4, 5]) == [10, 99, 50]
+    assert calls == [[1, 2, 3], [5]]
+    assert loader.batches == 2
+
+
+def test_get_by_ids_chunks_large_id_lists(db):
+    dao = UserDAO(db)
+    with db.transaction():
+        ids = [dao.insert_user(User(username=f"user{i}", password="pw"))
+               for i in range(MAX_IN_PARAMS + 20)]
+    found = dao.get_users_by_ids(ids + [None, 99_999] + ids[:3])
+    assert sorted(found) == ids
+    assert found[ids[-1]].username == f"user{MAX_IN_PARAMS + 19}"
+
+
+def test_job_loader_uses_cache_and_one_query(db):
+    dao = JobDAO(db)
+    ids = [dao.insert_job(Job(title=f"공고 {i}")) for i in range(4)]
+    cached = dao.get_job_by_id(ids[0])
+    db.enable_profiling(explain_slow=False)
+
+    loader = dao.loader()
+    handles = [loader.load(i) for i in ids + [12345]]
+    jobs = [h.get() for h in handles]
+
+    assert jobs[0] is cached
+    assert [j.job_id for j in jobs[:4]] == ids and jobs[4] is None
+    # 캐시에 없는 공고만 IN 목록 한 번으로 읽는다
+    stats = db.disable_profiling().get_stats()
+    assert sum(s.calls for s in stats) == 1
@@ -0,0 +1,58 @@
+# tests/test_bookmarks.py
+from datetime import datetime, timedelta
+
+from dao import MAX_IN_PARAMS, JobDAO
+from entities import Job
+from managers import BookmarkManager
+
+
+def test_toggle_bookmark(db):
+    bm = BookmarkManager(db)
+    assert bm.toggle_bookmark(1, 10) is True
+    assert bm.is_bookmarked(1, 10)
+    assert bm.toggle_bookmark(1, 10) is False
+    assert not bm.is_bookmarked(1, 10)
+
+
+def test_toggle_bookmark_through_write_queue(db):
+    bm = BookmarkManager(db)
+    wq = db.enable_write_queue()
+    writes = wq.writes
+    assert bm.toggle_bookmark(1, 10) is True
+    assert bm.toggle_bookmark(1, 10) is False
+    assert wq.writes == writes + 2
+
+
+def test_bulk_add_and_remove(db):
+    bm = BookmarkManager(db)
+    job_ids = list(range(1, MAX_IN_PARAMS + 50))
+    assert bm.add_bookmarks(1, job_ids + job_ids[:5]) == len(job_ids)
+    assert bm.add_bookmarks(1, job_ids[:3]) == 0
+    # 청크가 여러 개여도 한 번에 지워진다
+    assert bm.remove_bookmarks(1, job_ids + [0]) == len(job_ids)
+    assert bm.remove_bookmarks(1, []) == 0
+
+
+def test_bookmarked_jobs_in_one_join_and_orphans_reported(db):
+    job_dao, bm = JobDAO(db), BookmarkManager(db)
+    a, b, c = (job_dao.insert_job(Job(title=t)) for t in ("A", "B", "C"))
+    now = datetime.now()
+    for minutes_ago, job_id in ((30, a), (10, b), (20, c)):
+        bm.bookmark_dao.add_bookmark(1, job_id, now - timedelta(minutes=minutes_ago))
+    bm.bookmark_dao.add_bookmark(2, a, now)
+    job_dao.delete_job(c)
+
+    db.enable_profiling(explain_slow=False)
+    jobs = bm.get_bookmarked_jobs(1)
+    stats = db.disable_profiling().get_stats()
+    # 스크랩 최신순, 삭제된 공고는 빠지고 공고 조회는 JOIN 한 번
+    assert [j.job_id for j in jobs] == [b, a]
+    assert sum(s.calls for s in stats) == 1
+    assert [(row.job_id, row.title) for row in bm.get_bookmarked_jobs(1, projection="list")] == [
+        (b, "B"), (a, "A"),
+    ]
+
+    assert [o.job_id for o in bm.get_orphan_bookmarks(1)] == [c]
+    assert bm.get_orphan_bookmarks(2) == []
+    assert bm.cleanup_orphan_bookmarks() == 1
+    assert bm.get_orphan_bookmarks() == []
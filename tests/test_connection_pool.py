@@ -0,0 +1,115 @@
+# tests/test_connection_pool.py
+import sqlite3
+import threading
+
+import pytest
+
+from dao import JobDAO, UserDAO
+from database_manager import PoolTimeoutError
+from entities import Job, User
+
+
+def test_more_threads_than_pool_size(make_db):
+    db = make_db(pool_size=2, pool_timeout=5.0)
+    dao = JobDAO(db)
+    job_id = dao.insert_job(Job(title="도서관 사서 보조"))
+    errors = []
+    found = []
+
+    def worker():
+        # release() 를 부르지 않아도 문장마다 커넥션이 반납되어야 한다
+        try:
+            for _ in range(20):
+                found.append(dao.get_job_by_id(job_id) is not None)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert not any(t.is_alive() for t in threads)
+    assert errors == []
+    assert len(found) == 6 * 20 and all(found)
+    assert db.pool.stats()["in_use"] == 0
+
+
+def test_exhausted_pool_raises_timeout(make_db):
+    db = make_db(pool_size=1, pool_timeout=0.2)
+    entered = threading.Event()
+    done = threading.Event()
+
+    def holder():
+        # 트랜잭션이 열려 있는 동안은 커넥션을 쥐고 있다
+        with db.transaction():
+            entered.set()
+            done.wait(5)
+
+    t = threading.Thread(target=holder)
+    t.start()
+    try:
+        assert entered.wait(5)
+        with pytest.raises(PoolTimeoutError):
+            db.execute_query("SELECT 1")
+    finally:
+        done.set()
+        t.join(5)
+
+    # 트랜잭션이 끝나면 커넥션이 돌아와 다시 쓸 수 있다
+    assert db.execute_query("SELECT 1").fetchone()[0] == 1
+
+
+def test_failed_write_releases_connection(make_db):
+    db = make_db(pool_size=8, pool_timeout=5.0)
+    dao = UserDAO(db)
+    dao.insert_user(User(username="kim", password="pw"))
+    errors = []
+
+    def worker():
+        try:
+            dao.insert_user(User(username="kim", password="pw"))
+        except Exception as e:
+            errors.append(e)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join(5)
+
+    assert len(errors) == 1 and isinstance(errors[0], sqlite3.IntegrityError)
+    # 실패한 문장의 암묵적 트랜잭션이 롤백되고 커넥션이 반납되어야 한다
+    assert db.pool.stats()["in_use"] == 0
+    assert dao.insert_user(User(username="lee", password="pw")) > 0
+
+
+def test_failed_begin_releases_connection(make_db):
+    db = make_db(pool_size=1, pool_timeout=0.5)
+    db.execute_query("PRAGMA busy_timeout = 0")
+    other = sqlite3.connect(db.db_path)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            with db.transaction(immediate=True):
+                pass
+        assert db.pool.stats()["in_use"] == 0
+    finally:
+        other.rollback()
+        other.close()
+
+    # 풀의 유일한 커넥션이 돌아와 다른 스레드도 쓸 수 있다
+    result = []
+    t = threading.Thread(target=lambda: result.append(db.execute_query("SELECT 1").fetchone()[0]))
+    t.start()
+    t.join(5)
+    assert result == [1]
+
+
+def test_stray_implicit_transaction_is_not_committed(db):
+    conn = db.connect()
+    conn.execute("INSERT INTO settings (key, value) VALUES ('stray', '1')")
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            pass
+    assert db.get_setting("stray") is None
+    assert db.pool.stats()["in_use"] == 0
@@ -0,0 +1,149 @@
+# tests/test_datetime_migration.py
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from dao import JobDAO
+from database_manager import MIGRATIONS, DatabaseManager
+from datetime_codec import EPOCH
+from entities import Job
+
+# 마이그레이션이 없던 시절(user_version 0)의 스키마: 날짜 컬럼이 모두 TEXT
+BASELINE_SCHEMA = """
+CREATE TABLE users (user_id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL,
+    password TEXT NOT NULL, email TEXT, phone TEXT, student_id TEXT, department TEXT,
+    role TEXT DEFAULT 'student');
+CREATE TABLE jobs (job_id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,
+    description TEXT, category TEXT, location TEXT, job_type TEXT, work_hours TEXT,
+    salary INTEGER, requirements TEXT, deadline TEXT, created_at TEXT, department TEXT,
+    max_applicants INTEGER);
+CREATE TABLE resumes (resume_id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL,
+    title TEXT, content TEXT, is_default INTEGER DEFAULT 0, created_at TEXT, updated_at TEXT);
+CREATE TABLE applications (application_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL, job_id INTEGER NOT NULL, resume_id INTEGER, status TEXT,
+    submitted_at TEXT);
+CREATE TABLE timetables (timetable_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL, semester TEXT, schedule_data TEXT, created_at TEXT);
+CREATE TABLE bookmarks (bookmark_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL, job_id INTEGER NOT NULL, created_at TEXT);
+CREATE TABLE view_history (history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL, job_id INTEGER NOT NULL, viewed_at TEXT);
+CREATE TABLE faqs (faq_id INTEGER PRIMARY KEY AUTOINCREMENT, category TEXT, question TEXT,
+    answer TEXT);
+CREATE TABLE inquiries (inquiry_id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL,
+    title TEXT, content TEXT, answer TEXT, status TEXT, created_at TEXT, answered_at TEXT);
+"""
+
+CREATED = "2024-03-01T09:30:00"
+DEADLINE = "2024-03-15T18:00:00.250000"
+# 이미 epoch 마이크로초로 들어 있는 값 (변환 대상이 아니어야 한다)
+EPOCH_VIEWED = (datetime(2024, 3, 2, 12, 0) - EPOCH) // timedelta(microseconds=1)
+
+
+@pytest.fixture
+def baseline_path(tmp_path):
+    path = str(tmp_path / "baseline.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executemany(
+        "INSERT INTO jobs (title, description, deadline, created_at) VALUES (?, ?, ?, ?)",
+        [("도서관 사서 보조", "자료 정리", DEADLINE, CREATED), ("학과 사무 보조", None, None, CREATED)],
+    )
+    conn.execute(
+        "INSERT INTO applications (user_id, job_id, status, submitted_at) "
+        "VALUES (1, 1, '합격', ?)",
+        (CREATED,),
+    )
+    conn.executemany(
+        "INSERT INTO view_history (user_id, job_id, viewed_at) VALUES (?, ?, ?)",
+        [(1, 1, CREATED), (1, 2, None)],
+    )
+    conn.execute("DELETE FROM jobs WHERE job_id = 2")
+    conn.execute("INSERT INTO jobs (title, created_at) VALUES ('학과 사무 보조', ?)", (CREATED,))
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _values(db, table, col):
+    return [
+        tuple(r) for r in db.execute_query(
+            f"SELECT {col}, typeof({col}) FROM {table} ORDER BY rowid"
+        ).fetchall()
+    ]
+
+
+def _column_types(db, table):
+    return {r["name"]: r["type"] for r in db.execute_query(f"PRAGMA table_info({table})").fetchall()}
+
+
+def test_baseline_db_migrates_to_latest(baseline_path):
+    db = DatabaseManager(baseline_path)
+    try:
+        db.create_tables()
+        assert db.get_schema_version() == MIGRATIONS[-1][0]
+        assert db.get_setting("datetime_mode") == "iso"
+        assert _column_types(db, "jobs")["created_at"] == "TIMESTAMP"
+        assert _column_types(db, "view_history")["viewed_at"] == "TIMESTAMP"
+
+        # 데이터와 AUTOINCREMENT 순번이 그대로 남는다
+        assert _values(db, "jobs", "created_at") == [(CREATED, "text"), (CREATED, "text")]
+        dao = JobDAO(db)
+        assert dao.insert_job(Job(title="새 공고")) == 4
+
+        # 다시 만든 테이블에도 검색 색인 트리거가 붙어 있다
+        assert [j.title for j in dao.search_jobs("사서 보조")] == ["도서관 사서 보조"]
+        # 지원서 이력은 기존 지원서로부터 채워진다
+        events = db.execute_query("SELECT status FROM application_events ORDER BY event_id").fetchall()
+        assert [e[0] for e in events] == ["제출", "합격"]
+    finally:
+        db.disconnect()
+
+
+def test_datetime_mode_round_trip(baseline_path):
+    db = DatabaseManager(baseline_path)
+    try:
+        db.create_tables()
+        db.execute_query(
+            "INSERT INTO view_history (user_id, job_id, viewed_at) VALUES (1, 3, ?)",
+            (EPOCH_VIEWED,),
+        )
+        before_iso = _values(db, "view_history", "viewed_at")
+        assert before_iso[1] == (None, "null")
+
+        db.set_datetime_mode("epoch")
+        assert db.get_setting("datetime_mode") == "epoch"
+        viewed = _values(db, "view_history", "viewed_at")
+        assert [t for _v, t in viewed] == ["integer", "null", "integer"]
+        assert viewed[2][0] == EPOCH_VIEWED
+        deadline, kind = _values(db, "jobs", "deadline")[0]
+        assert kind == "integer"
+        job = JobDAO(db).get_job_by_id(1)
+        assert job.deadline == datetime.fromisoformat(DEADLINE)
+        assert job.created_at == datetime.fromisoformat(CREATED)
+
+        db.set_datetime_mode("iso")
+        viewed = _values(db, "view_history", "viewed_at")
+        assert viewed[:2] == before_iso[:2]
+        assert viewed[2] == ("2024-03-02T12:00:00", "text")
+        assert _values(db, "jobs", "deadline") == [(DEADLINE, "text"), (None, "null")]
+    finally:
+        db.disconnect()
+
+
+def test_reopen_with_other_mode_converts(baseline_path):
+    db = DatabaseManager(baseline_path)
+    db.create_tables()
+    db.disconnect()
+
+    db = DatabaseManager(baseline_path, datetime_mode="epoch")
+    try:
+        db.create_tables()
+        assert db.dt_codec.mode == "epoch"
+        assert [t for _v, t in _values(db, "applications", "submitted_at")] == ["integer"]
+        # 다시 열어도 두 번 변환하지 않는다
+        db.load_datetime_mode()
+        assert JobDAO(db).get_job_by_id(1).created_at == datetime.fromisoformat(CREATED)
+    finally:
+        db.disconnect()
@@ -0,0 +1,62 @@
+# tests/test_deferred.py
+import pytest
+
+from dao import JobDAO, ResumeDAO
+from deferred import NOT_LOADED, is_loaded
+from entities import Job, Resume
+
+
+def _queries(db, fn):
+    db.enable_profiling(explain_slow=False)
+    result = fn()
+    stats = db.disable_profiling().get_stats()
+    return result, sum(s.calls for s in stats)
+
+
+@pytest.fixture
+def dao(db):
+    dao = JobDAO(db)
+    for i in range(3):
+        dao.insert_job(Job(title=f"공고 {i}", description=f"본문 {i}", requirements=f"조건 {i}"))
+    dao.cache.clear()
+    return dao
+
+
+def test_text_columns_load_on_first_access(db, dao):
+    job = dao.get_job_by_id(2)
+    assert not is_loaded(job, "description") and not is_loaded(job, "requirements")
+
+    # 한 필드를 읽으면 그 객체의 지연 컬럼을 한 번에 채운다
+    description, queries = _queries(db, lambda: job.description)
+    assert (description, queries) == ("본문 1", 1)
+    requirements, queries = _queries(db, lambda: job.requirements)
+    assert (requirements, queries) == ("조건 1", 0)
+
+
+def test_prefetch_loads_many_in_one_query(db, dao):
+    jobs = dao.get_all_jobs()
+    filled, queries = _queries(db, lambda: dao.prefetch_text(jobs))
+    assert (filled, queries) == (3, 1)
+    assert sorted(j.description for j in jobs) == ["본문 0", "본문 1", "본문 2"]
+    # 이미 읽은 객체는 다시 읽지 않는다
+    assert _queries(db, lambda: dao.prefetch_text(jobs)) == (0, 0)
+
+
+def test_deleted_row_and_plain_objects(db, dao):
+    job = dao.get_job_by_id(3)
+    db.execute_query("DELETE FROM jobs WHERE job_id = 3")
+    assert job.description is None
+
+    # loader 가 없는 객체(직접 만든 것)는 NOT_LOADED 대신 None
+    plain = Job(title="직접 생성", description=NOT_LOADED)
+    assert plain.description is None
+    assert Job(title="x", description="본문").description == "본문"
+    assert not NOT_LOADED
+
+
+def test_resume_content_is_deferred(db):
+    dao = ResumeDAO(db)
+    dao.insert_resume(Resume(user_id=1, title="기본", content="자기소개", is_default=True))
+    resume = dao.get_default_resume(1)
+    assert not is_loaded(resume, "content")
+    assert resume.content == "자기소개"
@@ -0,0 +1,27 @@
+# tests/test_job_cache.py
+from cache import LRUCache
+from dao import JobDAO
+from entities import Job
+
+
+def test_get_all_jobs_larger_than_cache_is_not_cached(db):
+    cache = db.cache("jobs", lambda: LRUCache(5))
+    dao = JobDAO(db)
+    for i in range(3):
+        dao.insert_job(Job(title=f"공고 {i}"))
+
+    # 캐시에 들어가는 크기면 목록과 행을 모두 캐시한다
+    assert len(dao.get_all_jobs()) == 3
+    assert JobDAO._ALL_JOBS_KEY in cache and len(cache) == 4
+
+    for i in range(3, 8):
+        dao.insert_job(Job(title=f"공고 {i}"))
+    cached = dao.get_job_by_id(1)
+    evictions = cache.evictions
+
+    # 캐시보다 큰 전체 목록은 캐시를 밀어내지 않고, 이미 있는 객체는 재사용한다
+    jobs = dao.get_all_jobs()
+    assert len(jobs) == 8
+    assert JobDAO._ALL_JOBS_KEY not in cache
+    assert cache.evictions == evictions
+    assert any(job is cached for job in jobs)
@@ -0,0 +1,61 @@
+# tests/test_job_filters.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from dao import JobDAO
+from entities import Job
+
+
+@pytest.fixture
+def dao(db):
+    dao = JobDAO(db)
+    now = datetime.now()
+    rows = [
+        # title, category, location, job_type, salary, deadline
+        ("사서 보조", "교내", "도서관", "근로", 10000, now + timedelta(days=3)),
+        ("배식 보조", "교내", "학생회관", "근로", 9860, now - timedelta(days=1)),
+        ("실습 조교", "교내", "공학관", "조교", 12000, None),
+        ("행정 인턴", "교외", "시청", "인턴", 11000, now + timedelta(days=30)),
+        ("카페", None, "학생회관", "근로", 9860, None),
+    ]
+    for i, (title, category, location, job_type, salary, deadline) in enumerate(rows):
+        dao.insert_job(Job(
+            title=title, category=category, location=location, job_type=job_type,
+            salary=salary, deadline=deadline, created_at=now - timedelta(hours=i),
+        ))
+    return dao
+
+
+def _titles(jobs):
+    return [j.title for j in jobs]
+
+
+def test_filters_combine_in_one_query(dao):
+    assert _titles(dao.find_jobs(category="교내")) == ["사서 보조", "배식 보조", "실습 조교"]
+    assert _titles(dao.find_jobs(job_type=["근로", "인턴"], min_salary=10000)) == [
+        "사서 보조", "행정 인턴",
+    ]
+    assert _titles(dao.find_jobs(location="학생회관", max_salary=9860)) == ["배식 보조", "카페"]
+    # 마감 지난 공고만 빠지고 마감일 없는 공고는 남는다
+    assert _titles(dao.find_jobs(not_expired=True, category="교내")) == ["사서 보조", "실습 조교"]
+    assert _titles(dao.find_jobs(
+        deadline_from=datetime.now(), deadline_to=datetime.now() + timedelta(days=7)
+    )) == ["사서 보조"]
+    # None 은 필터 없음, 빈 목록은 결과 없음
+    assert len(dao.find_jobs(category=None)) == 5
+    assert dao.find_jobs(category=[]) == []
+
+
+def test_facet_counts_ignore_own_field(dao):
+    assert dao.facet_counts("category") == {"교내": 3, "교외": 1, None: 1}
+    # 자기 컬럼 필터는 무시하고 나머지 필터는 적용한다
+    assert dao.facet_counts("category", category="교외", job_type="근로") == {"교내": 2, None: 1}
+    assert dao.facet_counts("job_type", category="교내", not_expired=True) == {"근로": 1, "조교": 1}
+
+
+def test_unknown_filter_or_facet_rejected(dao):
+    with pytest.raises(ValueError):
+        dao.find_jobs(colour="red")
+    with pytest.raises(ValueError):
+        dao.facet_counts("salary")
@@ -0,0 +1,98 @@
+# tests/test_pagination.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from dao import ApplicationDAO, JobDAO
+from entities import Application, Job
+
+
+def _walk(fetch, page_size):
+    """첫 페이지부터 끝까지 next_token 으로, 다시 처음까지 prev_token 으로 훑는다"""
+    forward, pages = [], []
+    page = fetch(page_size=page_size)
+    assert not page.has_prev
+    while True:
+        pages.append(page)
+        forward.extend(page.items)
+        if not page.has_next:
+            break
+        page = fetch(page_size=page_size, after=page.next_token)
+
+    backward = []
+    page = pages[-1]
+    while page.has_prev:
+        page = fetch(page_size=page_size, before=page.prev_token)
+        backward[:0] = page.items
+    return forward, backward, pages
+
+
+@pytest.fixture
+def jobs(db):
+    dao = JobDAO(db)
+    base = datetime(2024, 3, 1, 9, 0)
+    # 같은 시각 3건, NULL 2건, 나머지는 서로 다른 시각
+    created = [base, base, base, None, base + timedelta(days=1), None,
+               base - timedelta(days=1), base + timedelta(days=2)]
+    ids = [dao.insert_job(Job(title=f"공고 {i}", created_at=c)) for i, c in enumerate(created)]
+    expected = sorted(
+        zip(created, ids),
+        key=lambda p: (p[0] is not None, p[0] or base, p[1]),
+        reverse=True,
+    )
+    return dao, [job_id for _c, job_id in expected]
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 8, 20])
+def test_job_pages_forward_and_back(jobs, page_size):
+    dao, expected = jobs
+    forward, backward, pages = _walk(dao.get_jobs_page, page_size)
+    assert [j.job_id for j in forward] == expected
+    # 되돌아가면 첫 페이지를 제외한 나머지가 같은 순서로 나온다
+    assert [j.job_id for j in backward] == expected[: len(expected) - len(pages[-1])]
+
+
+def test_ties_and_nulls_order_by_id(jobs):
+    dao, _expected = jobs
+    jobs_by_id = {j.job_id: j for j in dao.get_all_jobs()}
+    ids = [j.job_id for j in dao.get_jobs_page(page_size=20)]
+    same_time = [i for i in ids if jobs_by_id[i].created_at == datetime(2024, 3, 1, 9, 0)]
+    nulls = [i for i in ids if jobs_by_id[i].created_at is None]
+    # 동점 구간은 id 역순, NULL 은 맨 뒤에 id 역순
+    assert len(same_time) == 3 and same_time == sorted(same_time, reverse=True)
+    assert ids[-2:] == nulls == sorted(nulls, reverse=True)
+
+
+def test_keyset_query_uses_index_without_sorting(db, jobs):
+    plan = db.explain(
+        "SELECT job_id FROM jobs WHERE (created_at, job_id) < (?, ?) "
+        "ORDER BY created_at DESC, job_id DESC LIMIT 10",
+        ("2024-03-01T09:00:00", 10),
+    )
+    assert any("idx_jobs_created" in line for line in plan)
+    assert not any("TEMP B-TREE" in line for line in plan)
+
+
+def test_application_pages_per_user(db):
+    job_dao, app_dao = JobDAO(db), ApplicationDAO(db)
+    submitted = datetime(2024, 3, 1, 9, 0)
+    mine = []
+    for i in range(5):
+        job_id = job_dao.insert_job(Job(title=f"공고 {i}"))
+        _result, app_id = app_dao.apply(Application(
+            user_id=1, job_id=job_id, status="제출",
+            submitted_at=submitted if i < 3 else submitted + timedelta(hours=i),
+        ))
+        mine.append(app_id)
+        app_dao.apply(Application(user_id=2, job_id=job_id, status="제출", submitted_at=submitted))
+
+    fetch = lambda **kw: app_dao.get_applications_page_by_user(1, **kw)  # noqa: E731
+    forward, backward, pages = _walk(fetch, 2)
+    expected = [mine[4], mine[3], mine[2], mine[1], mine[0]]
+    assert [a.application_id for a in forward] == expected
+    assert [a.application_id for a in backward] == expected[:4]
+
+
+def test_bad_page_token(db):
+    with pytest.raises(ValueError):
+        JobDAO(db).get_jobs_page(after="not-a-token")
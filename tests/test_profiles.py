@@ -0,0 +1,41 @@
+# tests/test_profiles.py
+import threading
+
+import pytest
+
+from database_manager import PERFORMANCE_PROFILES, DatabaseManager
+
+SYNCHRONOUS = {"OFF": 0, "NORMAL": 1, "FULL": 2}
+TEMP_STORE = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+def _expected(profile):
+    p = PERFORMANCE_PROFILES[profile]
+    return {
+        "journal_mode": p["journal_mode"].lower(),
+        "synchronous": SYNCHRONOUS[p["synchronous"]],
+        "cache_size": p["cache_size"],
+        "mmap_size": p["mmap_size"],
+        "temp_store": TEMP_STORE[p["temp_store"]],
+        "busy_timeout": p["busy_timeout"],
+    }
+
+
+@pytest.mark.parametrize("profile", sorted(PERFORMANCE_PROFILES))
+def test_profile_pragmas_applied_on_every_connection(make_db, profile):
+    db = make_db(profile=profile)
+    assert db.get_pragmas() == _expected(profile)
+
+    # 이 스레드가 커넥션을 쥔 동안 다른 스레드는 새 커넥션을 받는다. 거기에도 같은 값.
+    seen = []
+    with db.transaction():
+        t = threading.Thread(target=lambda: seen.append(db.get_pragmas()))
+        t.start()
+        t.join(5)
+    assert seen == [_expected(profile)]
+    assert db.pool.stats()["size"] == 2
+
+
+def test_unknown_profile_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        DatabaseManager(str(tmp_path / "x.db"), profile="turbo")
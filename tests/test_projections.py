@@ -0,0 +1,50 @@
+# tests/test_projections.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from dao import JobDAO, ViewHistoryDAO
+from entities import Job, ViewHistory
+
+
+@pytest.fixture
+def dao(db):
+    dao = JobDAO(db)
+    deadline = datetime(2024, 3, 15, 18, 0)
+    for i in range(3):
+        dao.insert_job(Job(
+            title=f"공고 {i}", description="긴 본문 " * 100, category="교내",
+            salary=10000 + i, deadline=deadline, created_at=deadline - timedelta(days=i + 1),
+        ))
+    dao.cache.clear()
+    return dao
+
+
+def test_list_projection_reads_only_its_columns(db, dao):
+    db.enable_profiling(explain_slow=False)
+    page = dao.get_jobs_page(page_size=10, projection="list")
+    stats = db.disable_profiling().get_stats()
+
+    assert [(r.job_id, r.title) for r in page] == [(1, "공고 0"), (2, "공고 1"), (3, "공고 2")]
+    assert page.items[0]._fields == ("job_id", "title")
+    assert "description" not in stats[0].sql
+    # projection 행은 Job identity map 에 들어가지 않는다
+    assert len(dao.cache) == 0
+
+
+def test_card_projection_decodes_dates(dao):
+    row = dao.get_jobs_page(page_size=1, projection="card").items[0]
+    assert row.deadline == datetime(2024, 3, 15, 18, 0)
+    assert (row.category, row.salary) == ("교내", 10000)
+    assert not hasattr(row, "description")
+
+
+def test_recent_views_projection(db, dao):
+    ViewHistoryDAO(db).insert_view(ViewHistory(user_id=1, job_id=2, viewed_at=datetime.now()))
+    [(row, _ts)] = ViewHistoryDAO(db).get_recent_views(1, projection="list")
+    assert (row.job_id, row.title) == (2, "공고 1")
+
+
+def test_unknown_projection(dao):
+    with pytest.raises(ValueError):
+        dao.get_jobs_page(projection="thumbnail")
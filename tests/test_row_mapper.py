@@ -0,0 +1,54 @@
+# tests/test_row_mapper.py
+from collections import namedtuple
+from datetime import datetime
+
+import pytest
+
+from dao import JOB_MAPPER, JobDAO, USER_MAPPER
+from datetime_codec import decode_datetime
+from entities import Application, Job, User
+from row_mapper import RowMapper
+
+Point = namedtuple("Point", ("x", "y", "label"))
+
+
+def test_maps_rows_positionally_with_converters():
+    mapper = RowMapper(Point, ("x", "y", "label"), {"y": int})
+    # 목록 뒤에 붙은 컬럼은 무시된다
+    assert mapper.map((1, "2", "a", "extra")) == Point(1, 2, "a")
+    assert mapper.map_all([(1, "2", "a"), (3, "4", None)]) == [Point(1, 2, "a"), Point(3, 4, None)]
+    assert mapper.select("p") == "p.x, p.y, p.label"
+
+
+def test_rejects_mismatched_or_unknown_columns():
+    with pytest.raises(ValueError):
+        RowMapper(Point, ("y", "x", "label"))
+    with pytest.raises(ValueError):
+        RowMapper(Point, ("x", "y"), {"z": int})
+
+
+def test_entities_are_slotted():
+    for entity in (User(), Job(), Application()):
+        assert not hasattr(entity, "__dict__")
+    with pytest.raises(AttributeError):
+        User().nickname = "x"
+
+
+def test_mappers_match_stored_rows(db):
+    dao = JobDAO(db)
+    created = datetime(2024, 3, 1, 9, 0)
+    job_id = dao.insert_job(Job(title="사서 보조", salary=10000, created_at=created))
+    row = db.execute_query(
+        f"SELECT {JOB_MAPPER.select()} FROM jobs WHERE job_id = ?", (job_id,)
+    ).fetchone()
+    job = JOB_MAPPER.map(row)
+    assert (job.job_id, job.title, job.salary) == (job_id, "사서 보조", 10000)
+    assert job.created_at == created and job.created_at is decode_datetime(row["created_at"])
+
+    db.execute_query(
+        "INSERT INTO users (username, password, role) VALUES ('kim', 'pw', 'staff')"
+    )
+    user = USER_MAPPER.map(
+        db.execute_query(f"SELECT {USER_MAPPER.select()} FROM users").fetchone()
+    )
+    assert (user.username, user.role) == ("kim", "staff")
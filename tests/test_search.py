@@ -0,0 +1,109 @@
+# tests/test_search.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from dao import FAQDAO, JobDAO
+from entities import FAQ, Job
+
+
+@pytest.fixture
+def dao(db):
+    dao = JobDAO(db)
+    base = datetime(2024, 3, 1, 9, 0)
+    for i, (title, desc, loc) in enumerate([
+        ("도서관 사서 보조", "자료 정리 및 대출 업무", "중앙도서관"),
+        ("학생식당 배식 보조", "점심 배식", "제1학생회관"),
+        ("Lab Assistant", "Python 실습 조교", "공학관"),
+        ("행정 보조", "학생식당 식권 정산", "본관"),
+    ]):
+        dao.insert_job(Job(title=title, description=desc, location=loc,
+                           created_at=base + timedelta(days=i)))
+    return dao
+
+
+def _ids(jobs):
+    return [j.job_id for j in jobs]
+
+
+def _fts_ids(db, keyword):
+    return sorted(r[0] for r in db.execute_query(
+        "SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?", (f'"{keyword}"',)
+    ).fetchall())
+
+
+def test_fts_search_matches_like(dao):
+    assert dao.has_search_index()
+    for keyword in ("사서 보조", "도서관", "assistant", "실습 조교", "없는 검색어"):
+        # 최신순 결과는 LIKE 스캔과 같다
+        assert _ids(dao.search_jobs(keyword)) == _ids(dao._search_like(keyword))
+    assert [j.title for j in dao.search_jobs("assistant")] == ["Lab Assistant"]
+    assert _ids(dao.search_jobs("보조")) == [4, 2, 1]
+
+
+def test_fts_rank_returns_same_set(dao):
+    ranked = dao.search_jobs("학생식당", rank=True, recency_boost=1.0)
+    assert sorted(_ids(ranked)) == sorted(_ids(dao._search_like("학생식당")))
+
+
+def test_short_or_wildcard_keywords_fall_back_to_like(dao):
+    # trigram 으로 찾을 수 없는 1글자, LIKE 와일드카드가 든 검색어
+    for keyword in ("관", "P", "보_", "학생%정산"):
+        assert _ids(dao.search_jobs(keyword)) == _ids(dao._search_like(keyword))
+    assert _ids(dao.search_jobs("학생%정산")) == [4]
+
+
+def test_fts_triggers_follow_update_and_delete(db, dao):
+    dao.update_job(1, {"title": "기숙사 행정 보조"})
+    assert _fts_ids(db, "사서") == []
+    assert _fts_ids(db, "기숙사") == [1]
+    assert [j.title for j in dao.search_jobs("기숙사")] == ["기숙사 행정 보조"]
+    assert dao.search_jobs("사서 보조") == []
+
+    dao.delete_job(2)
+    assert _fts_ids(db, "배식") == []
+    assert dao.search_jobs("배식") == []
+
+
+def test_rebuild_search_index_indexes_existing_rows(db, dao):
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('delete-all')")
+    assert _fts_ids(db, "도서관") == []
+    assert dao.rebuild_search_index()
+    assert _fts_ids(db, "도서관") == [1]
+
+
+def _ngram_docs(db, gram):
+    return sorted(r[0] for r in db.execute_query(
+        "SELECT doc_id FROM search_ngrams WHERE scope = 'job' AND gram = ?", (gram,)
+    ).fetchall())
+
+
+def test_two_char_hangul_uses_bigram_index(db, dao):
+    # "식당" 은 trigram 으로 찾을 수 없는 길이
+    assert _ngram_docs(db, "식당") == [2, 4]
+    for keyword in ("식당", "배식", "보조", "관 "):
+        assert _ids(dao.search_jobs(keyword)) == _ids(dao._search_like(keyword))
+    assert _ids(dao._search_ngram("식당")) == [4, 2]
+
+
+def test_bigram_index_follows_update_and_delete(db, dao):
+    dao.update_job(2, {"title": "카페 바리스타"})
+    # 옛 제목에만 있던 글자쌍은 빠지고 새 제목의 글자쌍이 들어간다
+    assert _ngram_docs(db, "식당") == [4]
+    assert _ngram_docs(db, "카페") == [2]
+    assert _ids(dao.search_jobs("카페")) == [2]
+
+    dao.delete_job(4)
+    assert _ngram_docs(db, "식당") == []
+    assert dao.search_jobs("식당") == []
+
+
+def test_faq_search_uses_bigram_index(db):
+    faq_dao = FAQDAO(db)
+    faq_dao.insert_faq(FAQ(category="지원", question="지원서는 어떻게 제출하나요?", answer="공고 선택 후 지원"))
+    faq_dao.insert_faq(FAQ(category="이력서", question="통합 이력서란?", answer="기본 이력서입니다."))
+    assert [f.category for f in faq_dao.search("이력")] == ["이력서"]
+    assert [f.category for f in faq_dao.search("지원")] == ["지원"]
+    # 1글자는 색인 없이 LIKE
+    assert len(faq_dao.search("서")) == 2
@@ -0,0 +1,67 @@
+# tests/test_search_cache.py
+import time
+from datetime import datetime, timedelta
+
+from cache import SearchResultCache
+from dao import JobDAO
+from entities import Job
+
+
+def test_longest_prefix():
+    cache = SearchResultCache(maxsize=8)
+    cache.put("도", (1, 2, 3))
+    cache.put("도서", (1, 2))
+    cache.put("도서관 야간", (1,))
+    assert cache.longest_prefix("도서관") == ("도서", (1, 2))
+    # 자기 자신은 접두어로 치지 않는다
+    assert cache.longest_prefix("도서") == ("도", (1, 2, 3))
+    assert cache.longest_prefix("학생") is None
+    assert cache.stats()["prefix_hits"] == 2
+    assert cache.stats()["hits"] == 0
+
+
+def test_longest_prefix_skips_expired():
+    cache = SearchResultCache(maxsize=8, ttl=0.01)
+    cache.put("도서", (1,))
+    time.sleep(0.02)
+    assert cache.longest_prefix("도서관") is None
+
+
+def _search_queries(db, dao, keyword):
+    db.enable_profiling(explain_slow=False)
+    jobs = dao.search_jobs(keyword)
+    stats = db.disable_profiling().get_stats()
+    return [j.job_id for j in jobs], [s.sql for s in stats]
+
+
+def test_extended_query_refines_cached_prefix(db):
+    dao = JobDAO(db)
+    base = datetime(2024, 3, 1)
+    for i, (title, desc) in enumerate(
+        (("도서관 사서", None), ("도서 정리", "창고"), ("학생식당", "도서관 옆"), ("Cafe", "café 보조"))
+    ):
+        dao.insert_job(Job(title=title, description=desc, created_at=base + timedelta(days=i)))
+
+    ids, _queries = _search_queries(db, dao, "도서")
+    assert ids == [3, 2, 1]
+    # 접두어 결과 안에서만 거르므로 검색 SQL 없이 끝난다 (공고는 캐시에서).
+    # 제목으로 확인되지 않는 후보의 본문만 한 번에 읽는다
+    ids, queries = _search_queries(db, dao, "도서관")
+    assert ids == [j.job_id for j in dao._search_like("도서관")] == [3, 1]
+    assert len(queries) == 1 and "description, requirements" in queries[0]
+    assert dao.search_cache_stats()["prefix_hits"] == 1
+
+    # LIKE 규칙: ASCII 만 대소문자 무시
+    dao.search_jobs("caf")
+    assert [j.job_id for j in dao.search_jobs("CAFÉ")] == [j.job_id for j in dao._search_like("CAFÉ")]
+    assert [j.job_id for j in dao.search_jobs("CAFe")] == [4]
+
+
+def test_writes_invalidate_search_cache(db):
+    dao = JobDAO(db)
+    dao.insert_job(Job(title="도서관 사서"))
+    assert len(dao.search_jobs("도서")) == 1
+    dao.insert_job(Job(title="도서관 야간"))
+    assert len(dao.search_jobs("도서관")) == 2
+    dao.update_job(1, {"title": "학생식당"})
+    assert [j.title for j in dao.search_jobs("도서")] == ["도서관 야간"]
@@ -0,0 +1,57 @@
+# tests/test_view_history.py
+from datetime import datetime, timedelta
+
+from dao import JobDAO, ViewHistoryDAO
+from entities import Job, ViewHistory
+
+
+def _insert_views(db, user_id, count, viewed_at=True):
+    now = datetime.now()
+    db.execute_many(
+        "INSERT INTO view_history (user_id, job_id, viewed_at) VALUES (?, ?, ?)",
+        [
+            (user_id, i + 1, db.dt_codec.encode(now - timedelta(minutes=i)) if viewed_at else None)
+            for i in range(count)
+        ],
+    )
+
+
+def _remaining(db, user_id):
+    row = db.execute_query(
+        "SELECT COUNT(viewed_at), COUNT(*) - COUNT(viewed_at) FROM view_history WHERE user_id = ?",
+        (user_id,),
+    ).fetchone()
+    return tuple(row)
+
+
+def test_compact_ignores_null_viewed_at(db):
+    dao = ViewHistoryDAO(db)
+    # 사용자 1: 시각 있는 행은 상한 이내, NULL 행까지 세면 상한 초과
+    _insert_views(db, 1, 3)
+    _insert_views(db, 1, 5, viewed_at=False)
+    # 사용자 2: 시각 있는 행만으로 상한 초과
+    _insert_views(db, 2, 5)
+    _insert_views(db, 2, 2, viewed_at=False)
+
+    assert dao._over_cap_users(3) == [2]
+    assert dao.compact(retain_days=90, per_user_cap=3) == 2
+    # NULL 행은 옮기지도 세지도 않는다
+    assert _remaining(db, 1) == (3, 5)
+    assert _remaining(db, 2) == (3, 2)
+
+
+def test_recent_views_are_distinct_and_latest_first(db):
+    job_dao, dao = JobDAO(db), ViewHistoryDAO(db)
+    a, b, c = (job_dao.insert_job(Job(title=t)) for t in ("A", "B", "C"))
+    now = datetime.now().replace(microsecond=0)
+    for job_id, minutes_ago in ((a, 30), (b, 20), (a, 10), (c, 40), (a, 50)):
+        dao.insert_view(ViewHistory(user_id=1, job_id=job_id, viewed_at=now - timedelta(minutes=minutes_ago)))
+    dao.insert_view(ViewHistory(user_id=2, job_id=c, viewed_at=now))
+
+    views = dao.get_recent_views(1)
+    assert [(job.job_id, ts) for job, ts in views] == [
+        (a, now - timedelta(minutes=10)),
+        (b, now - timedelta(minutes=20)),
+        (c, now - timedelta(minutes=40)),
+    ]
+    assert [job.job_id for job, _ts in dao.get_recent_views(1, limit=2)] == [a, b]
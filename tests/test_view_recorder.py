@@ -0,0 +1,124 @@
+# tests/test_view_recorder.py
+import logging
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from dao import JobDAO, ViewHistoryDAO
+from datetime_codec import decode_datetime
+from entities import Job
+from managers import BufferedViewRecorder
+
+
+def _count_views(db, user_id, job_id):
+    return db.execute_query(
+        "SELECT COUNT(*) FROM view_history WHERE user_id = ? AND job_id = ?",
+        (user_id, job_id),
+    ).fetchone()[0]
+
+
+@pytest.fixture
+def recorder(db):
+    rec = BufferedViewRecorder(db, ViewHistoryDAO(db), flush_interval=3600, collapse_window=10)
+    yield rec
+    rec.close()
+
+
+def test_collapse_spans_flush(db, recorder):
+    now = datetime.now()
+    recorder.record(1, 7, now)
+    assert recorder.flush() == 1
+
+    # flush 직후라도 창 안의 재열람은 새 행을 만들지 않는다
+    recorder.record(1, 7, now + timedelta(seconds=3))
+    assert recorder.flush() == 0
+    assert recorder.collapsed == 1
+    assert _count_views(db, 1, 7) == 1
+
+    # 창을 벗어나면 새 행
+    recorder.record(1, 7, now + timedelta(seconds=30))
+    assert recorder.flush() == 1
+    assert _count_views(db, 1, 7) == 2
+
+
+def test_failed_flush_keeps_collapse_state(db, recorder, monkeypatch):
+    now = datetime.now()
+    recorder.record(2, 9, now)
+
+    def broken(views):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(recorder.vh_dao, "insert_views", broken)
+    with pytest.raises(RuntimeError):
+        recorder.flush()
+    monkeypatch.undo()
+
+    # 되돌려 놓은 행에 합쳐져 시각만 갱신된다
+    later = now + timedelta(seconds=5)
+    recorder.record(2, 9, later)
+    assert recorder.pending_count() == 1
+    assert recorder.flush() == 1
+    assert _count_views(db, 2, 9) == 1
+    stored = db.execute_query(
+        "SELECT viewed_at FROM view_history WHERE user_id = ?", (2,)
+    ).fetchone()[0]
+    assert decode_datetime(stored) == later
+
+
+def test_repeat_after_flush_moves_stored_time(db, recorder):
+    job_dao = JobDAO(db)
+    a = job_dao.insert_job(Job(title="A"))
+    b = job_dao.insert_job(Job(title="B"))
+    now = datetime.now()
+    recorder.record(3, a, now)
+    recorder.flush()
+    recorder.record(3, b, now + timedelta(seconds=3))
+    recorder.record(3, a, now + timedelta(seconds=5))
+    assert recorder.flush() == 1
+
+    # 이미 저장된 행의 시각이 마지막 열람으로 갱신되어 순서가 바뀐다
+    assert _count_views(db, 3, a) == 1
+    views = ViewHistoryDAO(db).get_recent_views(3)
+    assert [job.job_id for job, _ in views] == [a, b]
+    assert views[0][1] == now + timedelta(seconds=5)
+
+
+def test_window_measured_from_first_view(db, recorder):
+    now = datetime.now()
+    recorder.record(4, 1, now)
+    recorder.flush()
+    # 계속 다시 봐도 창은 첫 열람부터 collapse_window 초까지만 열려 있다
+    recorder.record(4, 1, now + timedelta(seconds=8))
+    recorder.flush()
+    recorder.record(4, 1, now + timedelta(seconds=12))
+    assert recorder.flush() == 1
+    assert _count_views(db, 4, 1) == 2
+
+
+def test_background_failures_are_logged_once_and_bounded(db, monkeypatch, caplog):
+    rec = BufferedViewRecorder(
+        db, ViewHistoryDAO(db), flush_interval=0.01, max_backoff=0.02, max_buffer=3
+    )
+
+    def broken(views):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(rec.vh_dao, "insert_views", broken)
+    now = datetime.now()
+    with caplog.at_level(logging.DEBUG, logger="hangi_works.view_recorder"):
+        for job_id in range(5):
+            rec.record(5, job_id, now)
+        deadline = time.monotonic() + 5
+        while rec.failures < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # 마지막 flush 가 실패해도 스레드는 멈추고 예외는 호출자에게 간다
+        with pytest.raises(RuntimeError):
+            rec.close()
+
+    assert rec.failures >= 3
+    assert not rec._thread.is_alive()
+    errors = [r for r in caplog.records if r.levelno >= logging.ERROR]
+    # 백그라운드 실패는 한 번, close() 의 실패는 한 번
+    assert len(errors) == 2
+    assert rec.dropped == 2 and rec.pending_count() == 3
@@ -0,0 +1,110 @@
+# tests/test_write_queue.py
+import threading
+
+import pytest
+
+from database_manager import WriteQueue
+
+
+def test_jobs_left_after_stop_fail_instead_of_hanging(db):
+    wq = db.enable_write_queue()
+    gate = threading.Event()
+    # 쓰기 스레드를 붙잡아 두고 그 뒤에 작업과 _STOP 을 쌓는다
+    blocker = wq.submit_call(lambda conn: gate.wait(5))
+    queued = wq.submit("INSERT INTO settings (key, value) VALUES ('a', '1')")
+    wq._queue.put(WriteQueue._STOP)
+    late = wq.submit("INSERT INTO settings (key, value) VALUES ('b', '2')")
+    gate.set()
+    db.disable_write_queue()
+
+    assert blocker.result(5) is True
+    assert queued.result(5).rowcount == 1
+    with pytest.raises(RuntimeError):
+        late.result(5)
+    with pytest.raises(RuntimeError):
+        wq.submit("INSERT INTO settings (key, value) VALUES ('c', '3')")
+
+
+# 쓰기 스레드는 connect 예외를 그대로 올리고 끝난다
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_connect_failure_resolves_queued_jobs(db, monkeypatch):
+    started = threading.Event()
+    proceed = threading.Event()
+
+    def broken_connect():
+        started.set()
+        proceed.wait(5)
+        raise RuntimeError("no connection")
+
+    wq = WriteQueue(db)
+    monkeypatch.setattr(db, "connect", broken_connect)
+    wq.start()
+    assert started.wait(5)
+    fut = wq.submit("INSERT INTO settings (key, value) VALUES ('a', '1')")
+    proceed.set()
+
+    with pytest.raises(RuntimeError, match="no connection"):
+        fut.result(5)
+    wq.stop(5)
+    with pytest.raises(RuntimeError):
+        wq.submit("INSERT INTO settings (key, value) VALUES ('b', '2')")
+
+
+def _settings(db):
+    return [r[0] for r in db.execute_query("SELECT key FROM settings ORDER BY key").fetchall()]
+
+
+def test_nested_writes_join_the_job_savepoint(db):
+    db.enable_write_queue()
+    before = _settings(db)
+
+    def failing(conn):
+        conn.execute("INSERT INTO settings (key, value) VALUES ('x1', '1')")
+        # 쓰기 스레드에서 부른 execute_query 는 배치를 커밋하지 않고 작업에 참여한다
+        db.execute_query("INSERT INTO settings (key, value) VALUES ('x2', '2')")
+        with db.transaction():
+            db.execute_query("INSERT INTO settings (key, value) VALUES ('x3', '3')")
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        db.run_write(failing)
+    assert _settings(db) == before
+
+    def ok(conn):
+        db.execute_query("INSERT INTO settings (key, value) VALUES ('y1', '1')")
+        with db.transaction():
+            db.execute_query("INSERT INTO settings (key, value) VALUES ('y2', '2')")
+        return "done"
+
+    assert db.run_write(ok) == "done"
+    assert _settings(db) == sorted(before + ["y1", "y2"])
+
+
+def test_commit_hooks_run_after_batch_commit(db):
+    db.enable_write_queue()
+    events = []
+
+    def job(conn):
+        db.on_commit(lambda: events.append("commit"))
+        db.on_rollback(lambda: events.append("rollback"))
+        db.execute_query("INSERT INTO settings (key, value) VALUES ('h', '1')")
+        events.append("ran")
+
+    db.run_write(job)
+    assert events == ["ran", "commit"]
+
+    def failing(conn):
+        db.on_commit(lambda: events.append("commit"))
+        db.on_rollback(lambda: events.append("rollback"))
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        db.run_write(failing)
+    assert events == ["ran", "commit", "rollback"]
+
+
+def test_submit_from_writer_thread_is_rejected(db):
+    wq = db.enable_write_queue()
+    fut = wq.submit_call(lambda conn: wq.submit("INSERT INTO settings (key, value) VALUES ('z', '1')"))
+    with pytest.raises(RuntimeError):
+        fut.result(5)